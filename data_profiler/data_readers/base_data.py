@@ -124,6 +124,43 @@ class BaseData(object):
             else:
                 yield list(self.data[k] for k in indices[i:i + batch_size])
 
+    def _load_data_chunks_from_file(self, input_file_path, chunk_size):
+        raise NotImplementedError()
+
+    def get_chunk_generator(self, chunk_size):
+        """
+        Yields the data in order as consecutive chunks of at most `chunk_size`
+        rows in the selected data format. If the data has not yet been loaded
+        and the data class supports it, the chunks are read directly from the
+        file such that only one chunk is held in memory at a time. Otherwise,
+        the chunks are sliced from the loaded data.
+
+        :param chunk_size: maximum number of rows in each chunk
+        :type chunk_size: int
+        :return: Iterator
+        :rtype: Iterator(pd.DataFrame)
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        data_chunks = None
+        if self._data is None and self.input_file_path:
+            try:
+                data_chunks = self._load_data_chunks_from_file(
+                    self.input_file_path, chunk_size)
+            except NotImplementedError:
+                pass
+        if data_chunks is None:
+            data = self.data
+            for i in range(0, len(data), chunk_size):
+                yield data[i:i + chunk_size]
+            return
+
+        for data in data_chunks:
+            if self._selected_data_format:
+                data = self._data_formats[self._selected_data_format](data)
+            yield data
+
     @classmethod
     def is_match(cls, input_file_path, options):
         raise NotImplementedError()
@@ -126,8 +126,11 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             read_in_string=True
         )
 
-    def _load_data_from_file(self, input_file_path):
-        """Loads the data into memory from the file."""
+    def _determine_file_settings(self, input_file_path):
+        """
+        Determines the encoding of the file and, if not specified, its
+        delimiter and header from the first lines of the file.
+        """
         self._file_encoding = data_utils.detect_file_encoding(input_file_path)
         if not self._delimiter or not self._checked_header:
             with open(input_file_path, encoding=self.file_encoding) as csvfile:
@@ -138,6 +141,10 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             if not self._header:
                 self._header = self._determine_has_header(data_as_str)
                 self._checked_header = True
+
+    def _load_data_from_file(self, input_file_path):
+        """Loads the data into memory from the file."""
+        self._determine_file_settings(input_file_path)
         return data_utils.read_csv_df(
             input_file_path,
             self.delimiter, self.header, self.selected_columns,
@@ -145,6 +152,16 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             encoding=self.file_encoding
         )
 
+    def _load_data_chunks_from_file(self, input_file_path, chunk_size):
+        """Loads the data from the file in chunks of `chunk_size` rows."""
+        self._determine_file_settings(input_file_path)
+        return data_utils.read_csv_df_in_chunks(
+            input_file_path,
+            self.delimiter, self.header, chunk_size, self.selected_columns,
+            read_in_string=True,
+            encoding=self.file_encoding
+        )
+
     def _get_data_as_records(self, data):
         sep = self.delimiter if self.delimiter else self._default_delimiter 
         data = data.to_csv(sep=sep, index=False)
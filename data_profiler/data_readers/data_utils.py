@@ -179,13 +179,11 @@ def read_json_df(data_generator, selected_columns=None, read_in_string=False):
     return json_to_dataframe(lines, selected_columns, read_in_string)
 
 
-def read_csv_df(file_path, delimiter, header, selected_columns=[],
-                read_in_string=False, encoding='utf-8'):
+def _get_read_csv_args(delimiter, header, selected_columns=[],
+                       read_in_string=False, encoding='utf-8'):
     """
-    Reads a CSV file in chunks and returns a dataframe in the form of iterator.
-    
-    :param file_path: path to the CSV file.
-    :type file_path: str
+    Returns the keyword arguments shared by the pandas CSV readers.
+
     :param delimiter: character used to separate csv values.
     :type delimiter: str
     :param header: the header row in the csv file.
@@ -195,8 +193,8 @@ def read_csv_df(file_path, delimiter, header, selected_columns=[],
     :param read_in_string: if True, all the values in dataframe will be
         converted to string
     :type read_in_string: bool
-    :return: Iterator
-    :rtype: pd.DataFrame
+    :return: keyword arguments for `pd.read_csv`
+    :rtype: dict
     """
     args = {
         'sep': delimiter,
@@ -212,12 +210,120 @@ def read_csv_df(file_path, delimiter, header, selected_columns=[],
 
     if len(selected_columns) > 0:
         args['usecols'] = selected_columns
+    return args
+
+
+def read_csv_df(file_path, delimiter, header, selected_columns=[],
+                read_in_string=False, encoding='utf-8'):
+    """
+    Reads a CSV file in chunks and returns a dataframe in the form of iterator.
+    
+    :param file_path: path to the CSV file.
+    :type file_path: str
+    :param delimiter: character used to separate csv values.
+    :type delimiter: str
+    :param header: the header row in the csv file.
+    :type header: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: Iterator
+    :rtype: pd.DataFrame
+    """
+    args = _get_read_csv_args(
+        delimiter, header, selected_columns, read_in_string, encoding)
     fo = pd.read_csv(file_path, **args)
     data = fo.read()
     fo.close()
     return data
 
 
+def read_csv_df_in_chunks(file_path, delimiter, header, chunk_size,
+                          selected_columns=[], read_in_string=False,
+                          encoding='utf-8'):
+    """
+    Reads a CSV file and yields dataframes of at most `chunk_size` rows, such
+    that only one chunk of the file is held in memory at a time.
+
+    :param file_path: path to the CSV file.
+    :type file_path: str
+    :param delimiter: character used to separate csv values.
+    :type delimiter: str
+    :param header: the header row in the csv file.
+    :type header: int
+    :param chunk_size: maximum number of rows in each chunk
+    :type chunk_size: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: Iterator
+    :rtype: Iterator(pd.DataFrame)
+    """
+    args = _get_read_csv_args(
+        delimiter, header, selected_columns, read_in_string, encoding)
+    args['chunksize'] = chunk_size
+    fo = pd.read_csv(file_path, **args)
+    try:
+        for data in fo:
+            yield data
+    finally:
+        fo.close()
+
+
+def _read_parquet_row_group(parquet_file, row_group, selected_columns=None):
+    """
+    Reads a single row group of a parquet file into a dataframe, converting
+    all the unicode and mixed columns to utf-8.
+
+    :param parquet_file: opened parquet file
+    :type parquet_file: pyarrow.parquet.ParquetFile
+    :param row_group: index of the row group to be read
+    :type row_group: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :return: the row group as a dataframe
+    :rtype: pd.DataFrame
+    """
+    return _parquet_table_to_df(parquet_file.read_row_group(row_group),
+                                selected_columns)
+
+
+def _parquet_table_to_df(table, selected_columns=None):
+    """
+    Converts a table or record batch read from a parquet file into a
+    dataframe, converting all the unicode and mixed columns to utf-8.
+
+    :param table: rows read from a parquet file
+    :type table: pyarrow.Table or pyarrow.RecordBatch
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :return: the rows as a dataframe
+    :rtype: pd.DataFrame
+    """
+    data_row_df = table.to_pandas()
+
+    # Convert all the unicode columns to utf-8
+    types = data_row_df.apply(lambda x: pd.api.types.infer_dtype(
+                                            x.values, skipna=True))
+
+    mixed_and_unicode_cols = types[types == 'unicode'] \
+        .index.union(types[types == 'mixed'].index)
+
+    for col in mixed_and_unicode_cols:
+        data_row_df[col] = data_row_df[col].apply(
+            lambda x: x.encode('utf-8').strip() if isinstance(x, str) else x)
+        data_row_df[col] = data_row_df[col].apply(
+            lambda x: x.decode('utf-8').strip() if isinstance(x, bytes) else x)
+
+    if selected_columns:
+        data_row_df = data_row_df[selected_columns]
+    return data_row_df
+
+
 def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
     """
     Returns an iterator that returns one row group each time.
@@ -231,25 +337,7 @@ def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
     parquet_file = pq.ParquetFile(file_path)
     data = pd.DataFrame()
     for i in range(parquet_file.num_row_groups):
-
-        data_row_df = parquet_file.read_row_group(i).to_pandas()
-
-        # Convert all the unicode columns to utf-8
-        types = data_row_df.apply(lambda x: pd.api.types.infer_dtype(
-                                                x.values, skipna=True))
-
-        mixed_and_unicode_cols = types[types == 'unicode'] \
-            .index.union(types[types == 'mixed'].index)
-
-        for col in mixed_and_unicode_cols:
-            data_row_df[col] = data_row_df[col].apply(
-                lambda x: x.encode('utf-8').strip() if isinstance(x, str) else x)
-            data_row_df[col] = data_row_df[col].apply(
-                lambda x: x.decode('utf-8').strip() if isinstance(x, bytes) else x)
-
-        if selected_columns:
-            data_row_df = data_row_df[selected_columns]
-
+        data_row_df = _read_parquet_row_group(parquet_file, i, selected_columns)
         data = pd.concat([data, data_row_df])
 
     original_df_dtypes = data.dtypes
@@ -259,6 +347,38 @@ def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
     return data, original_df_dtypes
 
 
+def read_parquet_df_in_chunks(file_path, chunk_size, selected_columns=None,
+                              read_in_string=False):
+    """
+    Reads a Parquet file in batches of at most `chunk_size` rows and yields
+    each of them as a dataframe, such that only one chunk is held in memory
+    at a time, however large the row groups of the file are. The index of the
+    chunks continues across batches.
+
+    :param file_path: path to the Parquet file.
+    :type file_path: str
+    :param chunk_size: maximum number of rows in each chunk
+    :type chunk_size: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: Iterator
+    :rtype: Iterator(pd.DataFrame)
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    row_offset = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_size,
+                                           columns=selected_columns or None):
+        data = _parquet_table_to_df(batch, selected_columns)
+        if read_in_string:
+            data = data.astype(str)
+        data.index = pd.RangeIndex(row_offset, row_offset + len(data))
+        row_offset += len(data)
+        yield data
+
+
 def read_text_as_list_of_strs(file_path):
     """
     Returns a list of strings relative to the chunk size. Each line is 1 chunk.
@@ -213,6 +213,11 @@ class BaseColumnPrimitiveTypeProfiler(with_metaclass(abc.ABCMeta,
     """
     Abstract class for profiling the primative data type for a column of data.
     """
+    # whether only the matches are counted while a preceding data type is
+    # selected, when the data types are short circuited
+    _is_short_circuited = True
+    # statistics also updated while only the matches are counted
+    _match_count_stats = ()
 
     def __init__(self, name):
         """
@@ -236,6 +241,68 @@ class BaseColumnPrimitiveTypeProfiler(with_metaclass(abc.ABCMeta,
         BaseColumnProfiler. \
             _update_column_base_properties(self, profile)
 
+    def _get_match_count(self, df_series, numeric_parse=None):
+        """
+        Counts the values of the series which match the data type, without
+        calculating any statistics of the matching values.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
+        :return: number of values matching the data type
+        :rtype: int
+        """
+        raise NotImplementedError()
+
+    def _may_match_all(self, df_series, numeric_parse=None):
+        """
+        Checks whether every value of the series may match the data type, in
+        which case the profile is updated with the series in full.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
+        :return: True or False
+        :rtype: bool
+        """
+        return self._get_match_count(df_series, numeric_parse) \
+            == len(df_series)
+
+    def _update_match_count(self, df_series, numeric_parse=None):
+        """
+        Updates the sample size and the match count of the profile with the
+        series, without calculating any statistics of the matching values.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
+        :return: None
+        """
+        if len(df_series) == 0:
+            return
+        self._update_column_base_properties(dict(
+            match_count=self._get_match_count(df_series, numeric_parse),
+            sample_size=len(df_series)))
+
+    def _carry_over_stats(self, other):
+        """
+        Takes over the statistics of another data type whose profile was
+        updated with every value while this profile only counted its matches,
+        if they are valid statistics of this data type.
+
+        :param other: profile of the other data type
+        :type other: BaseColumnPrimitiveTypeProfiler
+        :return: whether the statistics were carried over
+        :rtype: bool
+        """
+        return False
+
     def _add_helper(self, other1, other2):
         """
         Merges the properties of two objects inputted
@@ -1,5 +1,9 @@
+from collections import Counter
+
 from . import BaseColumnProfiler
+from .sketches import HyperLogLog
 import numpy as np
+import pandas as pd
 
 
 class CategoricalColumn(BaseColumnProfiler):
@@ -23,11 +27,19 @@ class CategoricalColumn(BaseColumnProfiler):
 
         :param name: Name of data
         :type name: String
+        :param options: Options for the categorical column
+        :type options: CategoricalOptions
         """
 
         self.options = options
         super(CategoricalColumn, self).__init__(name)
-        self._categories = list()
+        self._categories = Counter()
+        self._max_unique_count = None
+        self._unique_count_precision = 14
+        self._unique_count_sketch = None
+        if options:
+            self._max_unique_count = options.max_unique_count
+            self._unique_count_precision = options.unique_count_precision
         self.__calculations = {
             "is_enabled": CategoricalColumn._update_categories
         }
@@ -49,8 +61,27 @@ class CategoricalColumn(BaseColumnProfiler):
                                 other.__class__.__name__))
 
         merged_profile = CategoricalColumn(None)
+        max_unique_counts = [max_unique_count for max_unique_count
+                             in [self._max_unique_count,
+                                 other._max_unique_count]
+                             if max_unique_count is not None]
+        if max_unique_counts:
+            merged_profile._max_unique_count = min(max_unique_counts)
+        merged_profile._unique_count_precision = self._unique_count_precision
         merged_profile._categories = self._categories.copy()
+        if self._unique_count_sketch is not None:
+            merged_profile._unique_count_sketch = \
+                self._unique_count_sketch + HyperLogLog(
+                    self._unique_count_sketch.precision)
         merged_profile._update_categories(other._categories)
+        if other._unique_count_sketch is not None:
+            if merged_profile._unique_count_sketch is None:
+                merged_profile._unique_count_sketch = HyperLogLog(
+                    other._unique_count_sketch.precision)
+                merged_profile._unique_count_sketch.update(
+                    merged_profile._hash_values(merged_profile._categories))
+                merged_profile._categories = Counter()
+            merged_profile._unique_count_sketch += other._unique_count_sketch
         BaseColumnProfiler._add_helper(merged_profile, self, other)
         return merged_profile
 
@@ -63,21 +94,43 @@ class CategoricalColumn(BaseColumnProfiler):
         profile = dict(
             categorical=self.is_match,
             statistics=dict([
-                ('unique_count', len(self.categories)),
+                ('unique_count', self.unique_count),
                 ('unique_ratio', self.unique_ratio),
             ]),
             times=self.times
         )
         if self.is_match:
-            profile["statistics"].update(dict(categories=self.categories))
+            profile["statistics"].update(dict(
+                categories=self.categories,
+                categorical_count=self.categorical_counts))
         return profile
 
     @property
     def categories(self):
         """
-        Property for categories.
+        Property for categories, in the order they were first seen. Empty once
+        the column has more unique values than `max_unique_count`.
+        """
+        return list(self._categories)
+
+    @property
+    def categorical_counts(self):
+        """
+        Property for the number of times each category was seen.
+        """
+        return dict(self._categories)
+
+    @property
+    def unique_count(self):
+        """
+        Property for the number of unique values, estimated by a HyperLogLog
+        sketch once the column has more unique values than `max_unique_count`.
         """
-        return self._categories
+        if self._unique_count_sketch is None:
+            return len(self._categories)
+        unique_count = int(round(self._unique_count_sketch.cardinality))
+        return min(max(unique_count, self._max_unique_count + 1),
+                   self.sample_size)
 
     @property
     def unique_ratio(self):
@@ -87,7 +140,7 @@ class CategoricalColumn(BaseColumnProfiler):
         """
         unique_ratio = 1.0
         if self.sample_size:
-            unique_ratio = len(self.categories) / self.sample_size
+            unique_ratio = self.unique_count / self.sample_size
         return unique_ratio
 
     @property
@@ -96,6 +149,8 @@ class CategoricalColumn(BaseColumnProfiler):
         Property for is_match. Returns true if column is categorical.
         """
         is_match = False
+        if self._unique_count_sketch is not None:
+            return is_match
         unique = len(self._categories)
         if unique <= self._MAXIMUM_UNIQUE_VALUES_TO_CLASSIFY_AS_CATEGORICAL:
             is_match = True
@@ -117,15 +172,40 @@ class CategoricalColumn(BaseColumnProfiler):
         :param subset_properties: Contains the results of the properties of the
         subset before they are merged into the main data profile.
         :type subset_properties: dict
-        :param df_series: Data to be profiled
-        :type df_series: pandas.DataFrame
+        :param df_series: Data to be profiled, or the counts of its values
+        :type df_series: pandas.DataFrame or collections.Counter
         :return: None
         """
+        if self._unique_count_sketch is not None:
+            self._unique_count_sketch.update(self._hash_values(df_series))
+            return
+
         if hasattr(df_series, 'tolist'):
             df_series = df_series.tolist()
+        self._categories.update(df_series)
+
+        # past the max unique count, the unique values are only estimated
+        if self._max_unique_count is not None \
+                and len(self._categories) > self._max_unique_count:
+            self._unique_count_sketch = HyperLogLog(
+                self._unique_count_precision)
+            self._unique_count_sketch.update(
+                self._hash_values(self._categories))
+            self._categories = Counter()
 
-        self._categories = self._combine_unique_sets(
-            self._categories, df_series)
+    @staticmethod
+    def _hash_values(values):
+        """
+        Hashes the values as strings, the same way regardless of whether they
+        come from a column or from the keys of category counts.
+
+        :param values: values to hash
+        :type values: iterable
+        :return: 64-bit hashes of the values
+        :rtype: numpy.ndarray
+        """
+        return pd.util.hash_pandas_object(
+            pd.Series(list(values), dtype=object), index=False).values
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -140,12 +220,15 @@ class CategoricalColumn(BaseColumnProfiler):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, numeric_parse=None):
         """
         Updates the column profile.
 
         :param df_series: Data to profile.
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            unused since the categories are the strings
+        :type numeric_parse: dict
         :return: None
         """
         profile = dict(
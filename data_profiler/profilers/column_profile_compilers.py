@@ -1,14 +1,15 @@
 import abc
+import copy
+import warnings
 from collections import OrderedDict
 
-import pandas as pd
-
 from future.utils import with_metaclass
 
 from . import DateTimeColumn, IntColumn, FloatColumn, TextColumn
 from . import OrderColumn, CategoricalColumn
 from . import DataLabelerColumn
 from .profiler_options import StructuredOptions
+from . import utils
 
 
 class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
@@ -16,20 +17,22 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
     # NOTE: these profilers are ordered. Test functionality if changed.
     _profilers = list()
 
-    def __init__(self, df_series, options=None):
+    def __init__(self, df_series=None, options=None, numeric_parse=None):
         if not self._profilers:
             raise NotImplementedError("Must add profilers.")
 
-        self.name = df_series.name
+        self.name = None
         self._profiles = OrderedDict()
-        self._create_profile(df_series, options)
+        if df_series is not None:
+            self.name = df_series.name
+            self._create_profile(df_series, options, numeric_parse)
 
     @property
     @abc.abstractmethod
     def profile(self):
         raise NotImplementedError()
 
-    def _create_profile(self, df_series, options=None):
+    def _create_profile(self, df_series, options=None, numeric_parse=None):
         """
         Initializes and evaluates all profilers for the given dataframe.
         
@@ -37,12 +40,15 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
         :type df_series: pandas.core.series.Series
         :param options: Options for the structured profiler
         :type options: StructuredOptions
+        :param numeric_parse: parse of the column by `utils.parse_numeric`,
+            which is parsed when needed if not given
+        :type numeric_parse: dict
         :return: None
         :rtype: None
         """
 
         # convert all the values to string
-        df_series = df_series.apply(str)
+        df_series = utils.to_str_series(df_series)
         
         selected_columns = None
         if options and isinstance(options, StructuredOptions):
@@ -57,7 +63,7 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
                     column_options = options.properties[column_type.col_type]
                 self._profiles[column_type.col_type] = \
                     column_type(df_series.name, options=column_options)
-                self._profiles[column_type.col_type].update(df_series)
+        self._update_profiles(df_series, numeric_parse)
 
     def __add__(self, other):
         """
@@ -78,7 +84,7 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
             raise ValueError('Column profilers were not setup with the same '
                              'options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
-        merged_profile_compiler = self.__class__(pd.Series([]))
+        merged_profile_compiler = self.__class__()
         merged_profile_compiler.name = self.name
         for profile_name in self._profiles:
             merged_profile_compiler._profiles[profile_name] = (
@@ -86,16 +92,33 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
             )
         return merged_profile_compiler
 
-    def update_profile(self, df_series):
+    def update_profile(self, df_series, numeric_parse=None):
         """
         Initializes the profiles the column dataframe.
         
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the column by `utils.parse_numeric`,
+            which is parsed when needed if not given
+        :type numeric_parse: dict
+        :return: None
+        :rtype: None
+        """
+        df_series = utils.to_str_series(df_series)
+        self._update_profiles(df_series, numeric_parse)
+
+    def _update_profiles(self, df_series, numeric_parse=None):
+        """
+        Updates each profile with the column converted to strings.
+
+        :param df_series: a given column of strings
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the column by `utils.parse_numeric`,
+            unused by profiles which do not need it
+        :type numeric_parse: dict
         :return: None
         :rtype: None
         """
-        df_series = df_series.apply(str)
         for column_profile in self._profiles:
             self._profiles[column_profile].update(df_series)
 
@@ -110,6 +133,184 @@ class ColumnPrimitiveTypeProfileCompiler(BaseColumnProfileCompiler):
         TextColumn,
     ]
 
+    def __init__(self, df_series=None, options=None, numeric_parse=None):
+        # when short circuited, only the statistics of the data type selected
+        # are calculated, the others only count the values they match
+        self._short_circuit_types = bool(
+            options and isinstance(options, StructuredOptions)
+            and options.short_circuit_types.is_enabled)
+        # data types whose statistics skipped values while matching all of
+        # them, which are left out of the report if the data type is later
+        # selected, unless the statistics of the data type preceding it are
+        # carried over
+        self._partial_stats_types = set()
+        super().__init__(df_series, options, numeric_parse)
+
+    def __add__(self, other):
+        """
+        Merges two profile compilers together overriding the `+` operator.
+
+        :param other: profile compiler being add to this one.
+        :type other: ColumnPrimitiveTypeProfileCompiler
+        :return: merger of the two column profilers
+        """
+        merged_profile_compiler = super().__add__(other)
+        merged_profile_compiler._short_circuit_types = \
+            self._short_circuit_types or other._short_circuit_types
+
+        merged_profile_compiler._partial_stats_types = \
+            self._partial_stats_types | other._partial_stats_types
+
+        # the partial statistics which can no longer be completed when the
+        # data type takes over are completed in copies of the profiles merged
+        complete_stats_types = \
+            merged_profile_compiler._get_complete_stats_types()
+        for col_type in merged_profile_compiler._profiles:
+            if col_type not in merged_profile_compiler._partial_stats_types \
+                    or merged_profile_compiler._get_preceding_profile(
+                        col_type, complete_stats_types) is not None:
+                continue
+            profiles = []
+            for compiler in [self, other]:
+                profiler = compiler._profiles[col_type]
+                if col_type in compiler._partial_stats_types:
+                    profiler = copy.deepcopy(profiler)
+                    preceding_profiler = compiler._get_preceding_profile(
+                        col_type, compiler._get_complete_stats_types())
+                    if preceding_profiler is None \
+                            or not profiler._carry_over_stats(
+                                preceding_profiler):
+                        break
+                profiles.append(profiler)
+            else:
+                merged_profile_compiler._profiles[col_type] = \
+                    profiles[0] + profiles[1]
+                merged_profile_compiler._partial_stats_types.discard(col_type)
+        merged_profile_compiler._warn_if_partial_stats()
+        return merged_profile_compiler
+
+    def _get_complete_stats_types(self):
+        """
+        Gets the data types which matched every value so far and whose
+        statistics cover all of them.
+
+        :return: the data types
+        :rtype: set
+        """
+        return {col_type for col_type, profiler in self._profiles.items()
+                if profiler.sample_size
+                and profiler.match_count == profiler.sample_size
+                and col_type not in self._partial_stats_types}
+
+    def _get_preceding_profile(self, col_type, complete_stats_types):
+        """
+        Gets the profile of the last data type preceding the given one whose
+        statistics are complete, which were calculated with the values the
+        given data type only counted as its matches.
+
+        :param col_type: a data type
+        :type col_type: str
+        :param complete_stats_types: data types whose statistics are complete
+        :type complete_stats_types: set
+        :return: the profile, None if no preceding data type is complete
+        :rtype: BaseColumnPrimitiveTypeProfiler
+        """
+        preceding_profiler = None
+        for preceding_col_type, profiler in self._profiles.items():
+            if preceding_col_type == col_type:
+                break
+            if preceding_col_type in complete_stats_types:
+                preceding_profiler = profiler
+        return preceding_profiler
+
+    def _update_profiles(self, df_series, numeric_parse=None):
+        """
+        Updates each profile with the column converted to strings. When the
+        data types are short circuited, they are checked in order and only
+        the first one which may still match every value is updated in full,
+        the others only counting the values they match, except the text which
+        is always updated in full.
+
+        :param df_series: a given column of strings
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the column by `utils.parse_numeric`,
+            which is parsed if not given
+        :type numeric_parse: dict
+        :return: None
+        :rtype: None
+        """
+        if len(df_series) == 0:
+            return
+
+        # the numeric data types share a single parse of the series
+        if numeric_parse is None and (
+                'int' in self._profiles or 'float' in self._profiles):
+            numeric_parse = utils.parse_numeric(df_series)
+
+        if not self._short_circuit_types:
+            for profiler in self._profiles.values():
+                profiler.update(df_series, numeric_parse=numeric_parse)
+            return
+
+        has_found_match = False
+        complete_stats_types = self._get_complete_stats_types()
+        for col_type, profiler in self._profiles.items():
+            may_match_all = not profiler.sample_size \
+                or profiler.match_count == profiler.sample_size
+            if not profiler._is_short_circuited:
+                profiler.update(df_series, numeric_parse=numeric_parse)
+                has_found_match |= \
+                    profiler.match_count == profiler.sample_size
+            elif not has_found_match and may_match_all \
+                    and profiler._may_match_all(df_series, numeric_parse):
+                # the data type takes over from the one preceding it
+                if col_type in self._partial_stats_types:
+                    preceding_profiler = self._get_preceding_profile(
+                        col_type, complete_stats_types)
+                    if preceding_profiler is not None \
+                            and profiler._carry_over_stats(preceding_profiler):
+                        self._partial_stats_types.discard(col_type)
+                profiler.update(df_series, numeric_parse=numeric_parse)
+                has_found_match = \
+                    profiler.match_count == profiler.sample_size
+            else:
+                profiler._update_match_count(df_series, numeric_parse)
+                if profiler.match_count == profiler.sample_size:
+                    self._partial_stats_types.add(col_type)
+        self._warn_if_partial_stats()
+
+    def _warn_if_partial_stats(self):
+        """
+        Warns if the statistics of the data type selected skipped some of the
+        values, which happens when a data type preceding it stopped matching
+        every value after an update, or a merge, in which it was selected and
+        its statistics could not be carried over.
+
+        :return: None
+        """
+        for col_type, profiler in self._profiles.items():
+            if profiler.data_type_ratio == 1.0:
+                if col_type in self._partial_stats_types:
+                    warnings.warn(
+                        "The {} statistics of column {} are left out of the "
+                        "report, since they skipped the values profiled when "
+                        "a preceding data type was selected."
+                        .format(col_type, self.name),
+                        RuntimeWarning
+                    )
+                break
+
+    @property
+    def selected_profile(self):
+        """
+        Profile of the first data type matching every value of the column,
+        None if no data type does.
+        """
+        for profiler in self._profiles.values():
+            if profiler.data_type_ratio == 1.0:
+                return profiler
+        return None
+
     @property
     def profile(self):
         profile = {
@@ -117,16 +318,24 @@ class ColumnPrimitiveTypeProfileCompiler(BaseColumnProfileCompiler):
             "data_type": None,
             "statistics": dict()
         }
-        has_found_match = False
+        selected_profile = self.selected_profile
+        if selected_profile is not None:
+            statistics = selected_profile.profile
+            # the text profile names its type as either string or text
+            if any(self._profiles[col_type] is selected_profile
+                   for col_type in self._partial_stats_types):
+                # only the statistics updated with every value are reported
+                statistics = {
+                    stat: value if stat == 'times'
+                    or stat in selected_profile._match_count_stats else None
+                    for stat, value in statistics.items()}
+            profile.update(
+                {
+                    "data_type": selected_profile.col_type,
+                    "statistics": statistics,
+                }
+            )
         for _, profiler in self._profiles.items():
-            if not has_found_match and profiler.data_type_ratio == 1.0:
-                profile.update(
-                    {
-                        "data_type": profiler.col_type,
-                        "statistics": profiler.profile,
-                    }
-                )
-                has_found_match = True
             profile["data_type_representation"].update(
                 dict([(profiler.col_type, profiler.data_type_ratio)])
             )
@@ -141,6 +350,25 @@ class ColumnStatsProfileCompiler(BaseColumnProfileCompiler):
         CategoricalColumn,
     ]
 
+    def _update_profiles(self, df_series, numeric_parse=None):
+        """
+        Updates each profile with the column converted to strings, the order
+        sharing the parse of the numeric data types.
+
+        :param df_series: a given column of strings
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the column by `utils.parse_numeric`,
+            which is parsed if not given
+        :type numeric_parse: dict
+        :return: None
+        :rtype: None
+        """
+        if numeric_parse is None and 'order' in self._profiles \
+                and len(df_series):
+            numeric_parse = utils.parse_numeric(df_series)
+        for profiler in self._profiles.values():
+            profiler.update(df_series, numeric_parse=numeric_parse)
+
     @property
     def profile(self):
         profile = dict()
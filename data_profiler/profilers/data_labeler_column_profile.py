@@ -1,7 +1,9 @@
 from . import BaseColumnProfiler
 from ..labelers.data_labelers import DataLabeler
 from .profiler_options import DataLabelerOptions
+import copy
 import operator
+from collections import defaultdict
 import numpy as np
 
 
@@ -29,6 +31,7 @@ class DataLabelerColumn(BaseColumnProfiler):
             if options.max_sample_size:
                 self._max_sample_size = options.max_sample_size
 
+        self._data_labeler_dirpath = data_labeler_dirpath
         self.data_labeler = DataLabeler(
             labeler_type='structured',
             dirpath=data_labeler_dirpath,
@@ -60,6 +63,35 @@ class DataLabelerColumn(BaseColumnProfiler):
         }
         self._filter_properties_w_options(self.__calculations, options)
 
+    def __getstate__(self):
+        """
+        Excludes the data labeler from the pickled profile, since it holds the
+        model. It is reattached with `_reattach_data_labeler` once unpickled.
+
+        :return: state of the profile without the data labeler
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        state['data_labeler'] = None
+        return state
+
+    def _reattach_data_labeler(self, data_labelers=None):
+        """
+        Loads the data labeler of the profile from its directory, unless one
+        was already loaded from the same directory.
+
+        :param data_labelers: data labelers already loaded, by their directory
+        :type data_labelers: dict
+        :return: None
+        """
+        if data_labelers is None:
+            data_labelers = dict()
+        dirpath = self._data_labeler_dirpath
+        if dirpath not in data_labelers:
+            data_labelers[dirpath] = DataLabeler(
+                labeler_type='structured', dirpath=dirpath, load_options=None)
+        self.data_labeler = data_labelers[dirpath]
+
     @staticmethod
     def assert_equal_conditions(data_labeler, data_labeler2):
         """
@@ -115,19 +147,14 @@ class DataLabelerColumn(BaseColumnProfiler):
                                 other.__class__.__name__))
 
         self.assert_equal_conditions(self, other)
-        merged_profile = DataLabelerColumn(None)
-        BaseColumnProfiler._add_helper(merged_profile, self, other)
 
-        #Set all common variables
+        # shallow copy to set all common variables rather than loading the
+        # model of the data labeler again, which is excluded from the copy
+        merged_profile = copy.copy(self)
         merged_profile.data_labeler = self.data_labeler
-        merged_profile._possible_data_labels = self._possible_data_labels
-        merged_profile._top_k_voting = self._top_k_voting
-        merged_profile._min_voting_prob = self._min_voting_prob
-        merged_profile._min_prob_differential = self._min_prob_differential
-        merged_profile._top_k_labels = self._top_k_labels
-        merged_profile._min_top_label_prob = self._min_top_label_prob
-        merged_profile._max_sample_size = self._max_sample_size
-        merged_profile._top_k_voting = self._top_k_voting
+        merged_profile.metadata = dict()
+        merged_profile.times = defaultdict(float)
+        BaseColumnProfiler._add_helper(merged_profile, self, other)
 
         #Combine rank distribution
         merged_profile.rank_distribution = {key: self.rank_distribution.get(key, 0) +
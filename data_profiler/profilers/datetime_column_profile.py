@@ -1,7 +1,10 @@
 from .base_column_profilers import BaseColumnPrimitiveTypeProfiler
 from . import BaseColumnProfiler
 
+import calendar
 import datetime
+import re
+import string
 import numpy as np
 import pandas as pd
 import warnings
@@ -34,6 +37,25 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         "%H:%M:%S.%f"  # 05:46:30.258509
     ]
 
+    # deletes the ASCII digits and whitespace and lowers the ASCII letters
+    _shape_translation = str.maketrans(
+        string.ascii_uppercase, string.ascii_lowercase,
+        ''.join(chr(i) for i in range(128) if chr(i).isdigit()
+                or chr(i).isspace()))
+    _letter_deletion = str.maketrans('', '', string.ascii_lowercase)
+
+    # regular expressions of the directives, the same as `datetime.strptime`
+    _directive_regexes = {
+        'Y': r'(?P<Y>\d\d\d\d)',
+        'y': r'(?P<y>\d\d)',
+        'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+        'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+        'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+        'M': r'(?P<M>[0-5]\d|\d)',
+        'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+        'f': r'(?P<f>[0-9]{1,6})',
+        '%': '%'}
+
     def __init__(self, name, options=None):
         """
         Initialization of column base properties and itself.
@@ -132,95 +154,311 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
 
         return converted_date
 
+    @staticmethod
+    def _get_month_names():
+        """
+        Gets the lowercase month names of the current locale, abbreviated and
+        in full, indexed by month as in `datetime.strptime`.
+
+        :return: the abbreviated month names and the full month names
+        :rtype: tuple(list(str), list(str))
+        """
+        return ([month_name.lower() for month_name in calendar.month_abbr],
+                [month_name.lower() for month_name in calendar.month_name])
+
+    @classmethod
+    def _get_date_format_regex(cls, date_format):
+        """
+        Gets the regular expression `datetime.strptime` matches the values of
+        a date format with, built from the regular expressions of its
+        directives.
+
+        :param date_format: a date format
+        :type date_format: str
+        :return: the regular expression, None if the date format has a
+            directive without a regular expression
+        :rtype: str
+        """
+        abbr_month_names, month_names = cls._get_month_names()
+        directive_regexes = dict(cls._directive_regexes)
+        for directive, names in [('b', abbr_month_names),
+                                 ('B', month_names)]:
+            directive_regexes[directive] = '(?P<{}>{})'.format(
+                directive, '|'.join(map(re.escape, sorted(
+                    names[1:], key=len, reverse=True))))
+
+        regex = ''
+        for directive, literal in re.findall(r'%(.)|(.)', date_format,
+                                             flags=re.DOTALL):
+            if directive:
+                if directive not in directive_regexes:
+                    return None
+                regex += directive_regexes[directive]
+            elif literal.isspace():
+                if not regex.endswith(r'\s+'):
+                    regex += r'\s+'
+            elif literal in '\\.^$*+?(){}[]|':
+                regex += '\\' + literal
+            else:
+                regex += literal
+        return regex
+
+    @classmethod
+    def _get_date_format_shape(cls, date_format):
+        """
+        Gets the shape every value of a date format has, i.e. its characters
+        other than digits and whitespace, as well as the bounds of its length.
+        For the formats with month names, the shape excludes letters.
+
+        :param date_format: a date format
+        :type date_format: str
+        :return: shape, whether it has month names, min length and max length
+        :rtype: tuple(str, bool, int, float)
+        """
+        abbr_month_names, month_names = cls._get_month_names()
+        directive_lengths = {
+            'Y': (4, 4), 'y': (2, 2), 'm': (1, 2), 'd': (1, 2), 'H': (1, 2),
+            'M': (1, 2), 'S': (1, 2), 'f': (1, 6),
+            'b': (min(map(len, abbr_month_names[1:])),
+                  max(map(len, abbr_month_names[1:]))),
+            'B': (min(map(len, month_names[1:])),
+                  max(map(len, month_names[1:])))}
+
+        shape = ''
+        has_month_names = False
+        min_length, max_length = 0, 0
+        for directive, literal in re.findall(r'%(.)|(.)', date_format,
+                                             flags=re.DOTALL):
+            if directive:
+                has_month_names |= directive in 'bB'
+                directive_min, directive_max = directive_lengths.get(
+                    directive, (0, np.inf))
+                min_length += directive_min
+                max_length += directive_max
+                continue
+            # whitespace matches a run of whitespace of any length
+            min_length += 1
+            max_length += np.inf if literal.isspace() else 1
+            shape += literal.translate(cls._shape_translation)
+        if has_month_names:
+            shape = shape.translate(cls._letter_deletion)
+        return shape, has_month_names, min_length, max_length
+
     @classmethod
-    def _get_datetime_profile(cls, df_series):
+    def _get_value_shapes(cls, df_series):
+        """
+        Gets the shape of each value of the series, i.e. its characters other
+        than digits and whitespace, with and without letters, as well as its
+        length. Values which are not strings have an empty shape and length.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :return: strings of the series and their shapes
+        :rtype: tuple(pandas.core.series.Series, dict)
+        """
+        if pd.api.types.infer_dtype(df_series, skipna=False) != 'string':
+            df_series = df_series.where(
+                df_series.map(lambda x: isinstance(x, str)), '')
+        shapes = np.array([value.translate(cls._shape_translation)
+                           for value in df_series.to_numpy()], dtype=object)
+
+        # shapes with other characters than ASCII ones are not checked since
+        # they could contain digits, whitespace or month names
+        return df_series, dict(
+            lengths=df_series.str.len().to_numpy(),
+            shapes=shapes,
+            letterless_shapes=np.array(
+                [shape.translate(cls._letter_deletion) for shape in shapes],
+                dtype=object),
+            is_checked=np.array([shape.isascii() for shape in shapes],
+                                dtype=bool))
+
+    @classmethod
+    def _has_date_format_shape(cls, value_shapes, date_format):
+        """
+        Checks which values have the shape of the date format, only those
+        can be dates in the format.
+
+        :param value_shapes: shapes of values, from `_get_value_shapes`
+        :type value_shapes: dict
+        :param date_format: a date format
+        :type date_format: str
+        :return: whether each value has the shape of the date format
+        :rtype: numpy.ndarray
+        """
+        format_shape, has_month_names, min_length, max_length = \
+            cls._get_date_format_shape(date_format)
+        shapes = value_shapes['letterless_shapes'] if has_month_names \
+            else value_shapes['shapes']
+        lengths = value_shapes['lengths']
+        return ((shapes == format_shape) | ~value_shapes['is_checked']) \
+            & (lengths >= min_length) & (lengths <= max_length)
+
+    @classmethod
+    def _parse_datetimes(cls, df_series, date_format):
+        """
+        Parses the values of the series in the date format with the same
+        regular expression and validation as `datetime.strptime`, all at once.
+        Returns the values which are dates as integers which have the same
+        order as the dates, along with their months. The date formats with
+        directives without a regular expression are parsed a value at a time
+        with `datetime.strptime`.
+
+        :param df_series: a given column of strings
+        :type df_series: pandas.core.series.Series
+        :param date_format: a date format
+        :type date_format: str
+        :return: positions of the dates in the series, their integer values
+            and their months
+        :rtype: tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        """
+        regex = cls._get_date_format_regex(date_format)
+        if regex is None:
+            date_objs = [cls._validate_datetime(value, date_format)
+                         for value in df_series.to_numpy()]
+            positions = np.flatnonzero(
+                [isinstance(date_obj, datetime.datetime)
+                 for date_obj in date_objs])
+            fields = pd.DataFrame(
+                [date_objs[i].strftime('%Y %m %d %H %M %S %f').split()
+                 for i in positions],
+                columns=['Y', 'm', 'd', 'H', 'M', 'S', 'f'])
+        else:
+            fields = df_series.str.extract(
+                r'\A(?P<match>{})'.format(regex), flags=re.IGNORECASE)
+
+            # the whole value must match the date format
+            positions = np.flatnonzero(
+                (fields['match'].str.len() == df_series.str.len()).to_numpy())
+            fields = fields.iloc[positions]
+
+        def get_field(name, default):
+            if name in fields:
+                return fields[name].astype(np.int64).to_numpy()
+            return np.full(len(fields), default, dtype=np.int64)
+
+        year = get_field('Y', 1900)
+        if 'y' in fields:
+            year = get_field('y', 0)
+            year = np.where(year <= 68, year + 2000, year + 1900)
+        month = get_field('m', 1)
+        for name, month_names in zip('bB', cls._get_month_names()):
+            if name in fields:
+                month = fields[name].str.lower().map(
+                    {month_name: i for i, month_name in enumerate(month_names)}
+                ).to_numpy(dtype=np.int64)
+        day = get_field('d', 1)
+        hour = get_field('H', 0)
+        minute = get_field('M', 0)
+        second = get_field('S', 0)
+        microsecond = np.zeros(len(fields), dtype=np.int64)
+        if 'f' in fields:
+            microsecond = fields['f'].str.ljust(6, '0').astype(
+                np.int64).to_numpy()
+
+        # the validation left to the datetime constructor by strptime
+        is_leap_year = (year % 4 == 0) & ((year % 100 != 0)
+                                          | (year % 400 == 0))
+        days_in_month = np.array(
+            [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[month] \
+            + (is_leap_year & (month == 2))
+        is_date = (year >= 1) & (day <= days_in_month) & (second <= 59)
+
+        dates = (((((year * 13 + month) * 32 + day) * 24 + hour) * 60
+                  + minute) * 60 + second) * 10 ** 6 + microsecond
+        return positions[is_date], dates[is_date], month[is_date]
+
+    @classmethod
+    def _get_datetime_profile(cls, df_series, learned_date_formats=None):
         """
         For each value in a column determines if it is a datetime and the format
         of the value. Also collects datetime stats for the column.
+        Each value is only parsed in the formats whose shape it has, i.e. its
+        length and its characters other than digits and whitespace. The date
+        formats already learned for the column are tried first, the others
+        only on the values which are not dates in any of them.
         
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
+        :param learned_date_formats: date formats previously found in the
+            column
+        :type learned_date_formats: list
         :return: parameters for datetime columns
         :rtype: dict
         """
 
         profile = dict()
         activated_date_formats = list()
-        len_df = len(df_series)
+        date_formats = cls._date_formats
+        if learned_date_formats:
+            date_formats = sorted(
+                date_formats,
+                key=lambda date_format: date_format not in learned_date_formats)
 
-        is_row_datetime = pd.Series(np.full((len(df_series)), False))
+        # values which are not strings are never datetimes
+        df_series, value_shapes = cls._get_value_shapes(df_series)
+
+        is_row_datetime = np.full(len(df_series), False)
 
         min_value = None
         max_value = None
         min_value_obj = datetime.datetime.max
         max_value_obj = datetime.datetime.min
-        for date_format in cls._date_formats:
+        for date_format in date_formats:
             if is_row_datetime.all():
                 break
-            valid_dates = df_series.apply(
-                lambda x: cls._validate_datetime(x, date_format)
-            )
-
-            df_dates = valid_dates[~valid_dates.isnull()]
-
-            if "%b" in date_format and not df_dates.empty:
+            candidates = np.flatnonzero(
+                ~is_row_datetime
+                & cls._has_date_format_shape(value_shapes, date_format))
+            if not len(candidates):
+                continue
+            positions, dates, months = cls._parse_datetimes(
+                df_series.iloc[candidates], date_format)
+            positions = candidates[positions]
+
+            if "%b" in date_format and len(months):
                 may_month = 5 # May can be %b or %B we want to force, so check
-                all_may = df_dates.apply(lambda x: x.month == may_month).all()
-                if all_may:
-                    valid_dates[:] = np.nan
-                    df_dates = pd.Series([], dtype=object)
-
-            # Create mask to avoid null dates
-            null_date_mask = valid_dates.isnull()
-            np_date_array = df_dates.values
-                    
+                if (months == may_month).all():
+                    continue
+            if not len(positions):
+                continue
+
             # check off any values which were found to be datetime
-            is_row_datetime[~is_row_datetime] = (~null_date_mask).values
-
-            if len(df_dates) > 0:
-                
-                # Converts to numpy prior to finding max index
-                min_idx = np.argmin(np_date_array)
-                max_idx = np.argmax(np_date_array)
-                
-                # Selects the min, ma value objects for comparison
-                tmp_min_value_obj = df_dates.iloc[min_idx]
-                tmp_max_value_obj = df_dates.iloc[max_idx]
-                
-                # If minimum value, keep reference
-                if tmp_min_value_obj < min_value_obj:
-                    min_value = df_series[~null_date_mask].iloc[min_idx]
-                    min_value_obj = tmp_min_value_obj
-                
-                # If maximum value, keep reference
-                if tmp_max_value_obj > max_value_obj:
-                    max_value = df_series[~null_date_mask].iloc[max_idx]
-                    max_value_obj = tmp_max_value_obj
-                    
-            df_series = df_series[null_date_mask]
+            is_row_datetime[positions] = True
+
+            # If minimum value, keep reference
+            min_value_candidate = df_series.iloc[positions[np.argmin(dates)]]
+            tmp_min_value_obj = datetime.datetime.strptime(
+                min_value_candidate, date_format)
+            if tmp_min_value_obj < min_value_obj:
+                min_value = min_value_candidate
+                min_value_obj = tmp_min_value_obj
+
+            # If maximum value, keep reference
+            max_value_candidate = df_series.iloc[positions[np.argmax(dates)]]
+            tmp_max_value_obj = datetime.datetime.strptime(
+                max_value_candidate, date_format)
+            if tmp_max_value_obj > max_value_obj:
+                max_value = max_value_candidate
+                max_value_obj = tmp_max_value_obj
 
             # Get a list of all datetime format identified in column
-            new_len = len(df_series)
-            if new_len < len_df:
-                activated_date_formats.append(date_format)
-                len_df = new_len
-                if "y" in date_format:
-                    warnings.warn(
-                        "Years provided were in two digit format. As a result, "
-                        "datetime assumes dates < 69 are for 2000s and above "
-                        "are for the 1990s. "
-                        "https://stackoverflow.com/questions/37766353/"
-                        "pandas-to-datetime-parsing-wrong-year",
-                        RuntimeWarning
-                    )
+            activated_date_formats.append(date_format)
+            if "y" in date_format:
+                warnings.warn(
+                    "Years provided were in two digit format. As a result, "
+                    "datetime assumes dates < 69 are for 2000s and above "
+                    "are for the 1990s. "
+                    "https://stackoverflow.com/questions/37766353/"
+                    "pandas-to-datetime-parsing-wrong-year",
+                    RuntimeWarning
+                )
 
         profile["date_formats"] = activated_date_formats
         profile["min"] = min_value
         profile["max"] = max_value
-        profile["min_obj"] = min_value_obj.to_datetime() \
-            if hasattr(min_value_obj, 'to_datetime') else min_value_obj
-        profile["max_obj"] = max_value_obj.to_datetime() \
-            if hasattr(max_value_obj, 'to_datetime') else max_value_obj
+        profile["min_obj"] = min_value_obj
+        profile["max_obj"] = max_value_obj
         profile["match_count"] = is_row_datetime.sum()
         return profile
 
@@ -238,7 +476,19 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         num_samples_to_check = 50
         thresh = 0.10
         sample_size = min(num_samples_to_check, len(df_series))
-        profile = self._get_datetime_profile(df_series.sample(sample_size))
+        df_sample = df_series.sample(sample_size)
+
+        # quickly rejects the samples without enough values having the shape
+        # of a date before parsing them
+        _, value_shapes = self._get_value_shapes(df_sample)
+        has_date_shape = np.full(sample_size, False)
+        for date_format in self._date_formats:
+            has_date_shape |= self._has_date_format_shape(value_shapes,
+                                                          date_format)
+        if has_date_shape.sum() / sample_size < thresh:
+            return False
+
+        profile = self._get_datetime_profile(df_sample, self.date_formats)
 
         if profile["match_count"] / sample_size < thresh:
             return False
@@ -261,7 +511,7 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         :return:
         """
         # date_formats
-        profile = self._get_datetime_profile(df_series)
+        profile = self._get_datetime_profile(df_series, self.date_formats)
         date_formats = profile.pop("date_formats", [])
         if date_formats:
             self.date_formats = self._combine_unique_sets(
@@ -289,6 +539,37 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
 
         subset_properties.update(profile)
 
+    def _get_match_count(self, df_series, numeric_parse=None):
+        """
+        Counts the values of the series which are datetimes.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: unused, datetimes are not numeric
+        :type numeric_parse: dict
+        :return: number of datetime values
+        :rtype: int
+        """
+        if not self._is_subset_datetime_column(df_series):
+            return 0
+        return self._get_datetime_profile(
+            df_series.reset_index(drop=True), self.date_formats)["match_count"]
+
+    def _may_match_all(self, df_series, numeric_parse=None):
+        """
+        Datetimes are only matched by parsing them, which already yields the
+        properties of the profile, hence the profile is updated in full
+        instead of parsing the series twice.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: unused, datetimes are not numeric
+        :type numeric_parse: dict
+        :return: True
+        :rtype: bool
+        """
+        return True
+
     def _update_helper(self, df_series, profile):
         """
         Method for updating the column profile properties.
@@ -301,12 +582,14 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, numeric_parse=None):
         """
         Updates the column profile.
         
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: unused, datetimes are not numeric
+        :type numeric_parse: dict
         :return: None
         """
         if len(df_series) == 0:
@@ -2,8 +2,10 @@ from . import NumericStatsMixin
 from .base_column_profilers import BaseColumnPrimitiveTypeProfiler
 from .profiler_options import FloatOptions
 from . import BaseColumnProfiler
+from . import utils
 
 import numpy as np
+import pandas as pd
 
 
 class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
@@ -13,6 +15,7 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     """
 
     col_type = "float"
+    _match_count_stats = ('precision', 'precision_distribution')
 
     def __init__(self, name, options=None):
         """
@@ -28,6 +31,7 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         NumericStatsMixin.__init__(self, options)
         BaseColumnPrimitiveTypeProfiler.__init__(self, name)
         self.precision = 0
+        self._precision_counts = {}
         self.__calculations = {
             "precision": FloatColumn._update_precision,
         }
@@ -50,6 +54,9 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         merged_profile = FloatColumn(None)
         BaseColumnPrimitiveTypeProfiler._add_helper(merged_profile, self, other)
         NumericStatsMixin._add_helper(merged_profile, self, other)
+        merged_profile.precision = max(self.precision, other.precision)
+        merged_profile._precision_counts = self._merge_precision_counts(
+            self._precision_counts, other._precision_counts)
         return merged_profile
 
     @property
@@ -66,16 +73,35 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             min=self.min,
             max=self.max,
             mean=self.mean,
-            median=None,
+            median=self.median,
             variance=self.variance,
             stddev=self.stddev,
             histogram=self.histogram_methods[histogram_method]['histogram'],
             quantiles=self.quantiles,
             times=self.times,
-            precision=self.precision
+            precision=self.precision,
+            precision_distribution=self.precision_distribution
         )
         return profile
 
+    @property
+    def precision_distribution(self):
+        """
+        Distribution of the number of decimal places of the values with a
+        decimal point, None if there are no such values.
+
+        :return: minimum, maximum and most common number of decimal places
+        :rtype: dict
+        """
+        if not self._precision_counts:
+            return dict(min=None, max=None, mode=None)
+        return dict(
+            min=min(self._precision_counts),
+            max=max(self._precision_counts),
+            mode=max(sorted(self._precision_counts),
+                     key=self._precision_counts.get)
+        )
+
     @property
     def data_type_ratio(self):
         """
@@ -87,6 +113,46 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             return float(self.match_count) / self.sample_size
         return None
 
+    @staticmethod
+    def _merge_precision_counts(precision_counts1, precision_counts2):
+        """
+        Adds the counts of the number of decimal places of two sets of values.
+
+        :param precision_counts1: count of each number of decimal places
+        :type precision_counts1: dict
+        :param precision_counts2: count of each number of decimal places
+        :type precision_counts2: dict
+        :return: merged counts
+        :rtype: dict
+        """
+        precision_counts = dict(precision_counts1)
+        for precision, count in precision_counts2.items():
+            precision_counts[precision] = \
+                precision_counts.get(precision, 0) + count
+        return precision_counts
+
+    @classmethod
+    def _get_float_precision_counts(cls, df_series):
+        """
+        Counts the number of decimal places of the values with a decimal point,
+        i.e. the number of characters after the last '.'.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :return: count of each number of decimal places
+        :rtype: dict
+        """
+        decimal_locs = df_series.str.rfind('.').to_numpy(dtype=np.int64)
+        value_lens = df_series.str.len().to_numpy(dtype=np.int64)
+
+        # integers will not have a '.', since indexes start at 0 the
+        # precision is: len - pos - 1
+        has_decimal_point = decimal_locs >= 0
+        precisions, counts = np.unique(
+            (value_lens - decimal_locs - 1)[has_decimal_point],
+            return_counts=True)
+        return dict(zip(precisions.tolist(), counts.tolist()))
+
     @classmethod
     def _get_float_precision(cls, df_series):
         """
@@ -96,23 +162,7 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :return: string representing its precision print format
         :rtype: int
         """
-        integer_decimal_loc = -1
-        float_precision = 0
-        for value in df_series:
-            decimal_loc = value.rfind('.')
-
-            # integers will not have a '.'
-            if decimal_loc == integer_decimal_loc:
-                continue
-
-            # since has a '.', subtract the str len from the position,
-            # since indexes start at 0: len - pos - 1
-            value_len = len(value)
-            value_precision = value_len - decimal_loc - 1
-
-            if float_precision < value_precision:
-                float_precision = value_precision
-        return float_precision
+        return max(cls._get_float_precision_counts(df_series), default=0)
 
     @classmethod
     def _is_each_row_float(cls, df_series):
@@ -126,13 +176,29 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :param df_series: series of values to evaluate
         :type df_series: pandas.core.series.Series
         :return: is_float_col
-        :rtype: list
+        :rtype: numpy.ndarray
         """
         len_df = len(df_series)
         if len_df == 0:
             return list()
 
-        return [NumericStatsMixin.is_float(x) for x in df_series]
+        return utils.parse_numeric(df_series)['is_float']
+
+    def _get_match_count(self, df_series, numeric_parse=None):
+        """
+        Counts the values of the series which are floats.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
+        :return: number of float values
+        :rtype: int
+        """
+        if numeric_parse is None:
+            numeric_parse = utils.parse_numeric(df_series)
+        return np.sum(numeric_parse['is_float'])
 
     @BaseColumnProfiler._timeit(name='precision')
     def _update_precision(self, df_series, prev_dependent_properties,
@@ -150,9 +216,49 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :type df_series: pandas.DataFrame
         :return: None
         """
-        self.precision = max(
-            self.precision, self._get_float_precision(df_series)
-        )
+        precision_counts = self._get_float_precision_counts(df_series)
+        self._precision_counts = self._merge_precision_counts(
+            self._precision_counts, precision_counts)
+        self.precision = max(self.precision,
+                             max(precision_counts, default=0))
+
+    def _update_match_count(self, df_series, numeric_parse=None):
+        """
+        Updates the sample size and the match count of the profile with the
+        series. The precision is still updated, since the statistics carried
+        over from the integers do not include it.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
+        :return: None
+        """
+        if len(df_series) == 0:
+            return
+        if numeric_parse is None:
+            numeric_parse = utils.parse_numeric(df_series)
+        super(FloatColumn, self)._update_match_count(df_series, numeric_parse)
+        if 'precision' in self.__calculations:
+            self._update_precision(
+                df_series.reset_index(drop=True)[numeric_parse['is_float']],
+                prev_dependent_properties={}, subset_properties={})
+
+    def _carry_over_stats(self, other):
+        """
+        Takes over the statistics of the integers, which are valid statistics
+        of floats, when this profile only counted their matches. The integer
+        profile must not have been updated with values which are not floats.
+
+        :param other: profile of the other data type
+        :type other: BaseColumnPrimitiveTypeProfiler
+        :return: whether the statistics were carried over
+        :rtype: bool
+        """
+        if other.col_type != 'int':
+            return False
+        return self._copy_numeric_stats(other)
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -168,17 +274,23 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             NumericStatsMixin._update_helper(self, df_series_clean, profile)
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, numeric_parse=None):
         """
         Updates the column profile.
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
         :return: None
         """
         if len(df_series) == 0:
             return
+        parse = numeric_parse
+        if parse is None:
+            parse = utils.parse_numeric(df_series)
         df_series = df_series.reset_index(drop=True)
-        is_each_row_float = self._is_each_row_float(df_series)
+        is_each_row_float = parse['is_float']
         sample_size = len(is_each_row_float)
         float_count = np.sum(is_each_row_float)
         profile = dict(match_count=float_count, sample_size=sample_size)
@@ -188,7 +300,7 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             prev_dependent_properties={}, subset_properties=profile)
 
         self._update_helper(
-            df_series_clean=df_series[is_each_row_float],
+            df_series_clean=pd.Series(parse['values'][is_each_row_float]),
             profile=profile
         )
 
@@ -2,7 +2,21 @@ import math
 import numpy as np
 
 
-def calculate_quantiles(num_quantile_groups, quantiles):
+def calculate_quantiles(num_quantile_groups, quantiles, get_percentiles=None):
+    """
+    Selects the quantiles splitting the values into the number of groups.
+
+    :param num_quantile_groups: number of groups the values are split into
+    :type num_quantile_groups: int
+    :param quantiles: every quantile of the values, by index
+    :type quantiles: dict
+    :param get_percentiles: if given, only the quantiles of the groups are
+        computed from their percentiles with this function, instead of being
+        selected from the quantiles
+    :type get_percentiles: Callable
+    :return: quantiles of the groups
+    :rtype: dict
+    """
     len_quant = len(quantiles)
     if not (num_quantile_groups and 0 < num_quantile_groups <= len_quant):
         num_quantile_groups = 4
@@ -14,9 +28,17 @@ def calculate_quantiles(num_quantile_groups, quantiles):
     # i.e. quantile:
     # quant_multiplier = 1000 / 4 = 250
     # [0 + 1] * (quant_multiplier) - 1 = 1 * 250 - 1 = 249 (first quantile)
+    quantile_inds = [math.ceil((ind + 1) * quant_multiplier) - 1
+                     for ind in range(num_quantile_groups - 1)]
+    if get_percentiles is not None:
+        # the quantile of index i is the percentile (i + 1) * 100 / len_quant
+        size_bins = 100 / len_quant
+        values = get_percentiles(
+            (np.array(quantile_inds, dtype=int) + 1) * size_bins)
+        return dict(enumerate(values))
     quantiles = {
-        ind: quantiles[math.ceil((ind + 1) * quant_multiplier) - 1]
-        for ind in range(num_quantile_groups - 1)
+        ind: quantiles[quantile_ind]
+        for ind, quantile_ind in enumerate(quantile_inds)
     }
     return quantiles
 
@@ -397,3 +397,141 @@ def _get_bin_edges(a, bins, range, weights):
     return bin_edges, n_equal_bins
 
 
+def _weighted_percentile(a, weights, q):
+    """
+    Computes the percentiles of the data in which each value is repeated as
+    many times as its weight, interpolated linearly as in `np.percentile`,
+    without repeating the values.
+    Parameters
+    ----------
+    a : ndarray
+        Values of the data.
+    weights : ndarray
+        Positive integer number of times each value is repeated.
+    q : array_like
+        Percentiles to compute, between 0 and 100.
+    Returns
+    -------
+    percentiles : ndarray
+        Percentiles of the repeated values.
+    """
+    sort_inds = np.argsort(a, kind='stable')
+    a = a[sort_inds]
+    cumulative_weights = np.cumsum(weights[sort_inds])
+    n = cumulative_weights[-1]
+
+    # a value is at the ranks below its cumulative weight in the repeated data
+    ranks = np.asarray(q, dtype=np.float64) / 100 * (n - 1)
+    lower_ranks = np.floor(ranks)
+    upper_ranks = np.minimum(lower_ranks + 1, n - 1)
+    lower = a[np.searchsorted(cumulative_weights, lower_ranks, side='right')]
+    upper = a[np.searchsorted(cumulative_weights, upper_ranks, side='right')]
+    return lower + (upper - lower) * (ranks - lower_ranks)
+
+
+def _get_weighted_bin_count(a, weights, bin_name):
+    """
+    Computes the number of equal width bins the automatic estimator selects
+    for the data in which each value is repeated as many times as its weight,
+    from the weighted statistics of the values rather than repeating them.
+    Parameters
+    ==========
+    a : ndarray
+        Ravelled data array
+    weights : ndarray
+        Positive integer number of times each value is repeated.
+    bin_name : str
+        Name of the automatic estimator, e.g. 'auto', 'fd' or 'sqrt'.
+    Returns
+    =======
+    n_equal_bins : int
+        The number of bins.
+    """
+    if bin_name not in _hist_bin_selectors or bin_name == 'stone':
+        raise ValueError(
+            "{!r} is not a valid estimator for `bins`".format(bin_name))
+    if not a.size:
+        return 1
+
+    n = weights.sum()
+    first_edge, last_edge = a.min(), a.max()
+    if not (np.isfinite(first_edge) and np.isfinite(last_edge)):
+        raise ValueError(
+            "autodetected range of [{}, {}] is not finite".format(
+                first_edge, last_edge))
+    ptp = last_edge - first_edge
+
+    def sturges():
+        return ptp / (np.log2(n) + 1.0)
+
+    def fd():
+        iqr = np.subtract(*_weighted_percentile(a, weights, [75, 25]))
+        return 2.0 * iqr * n ** (-1.0 / 3.0)
+
+    def std():
+        mean = np.average(a, weights=weights)
+        return mean, np.sqrt(np.average((a - mean) ** 2, weights=weights))
+
+    if bin_name == 'sqrt':
+        width = ptp / np.sqrt(n)
+    elif bin_name == 'sturges':
+        width = sturges()
+    elif bin_name == 'rice':
+        width = ptp / (2.0 * n ** (1.0 / 3))
+    elif bin_name == 'scott':
+        width = (24.0 * np.pi ** 0.5 / n) ** (1.0 / 3.0) * std()[1]
+    elif bin_name == 'doane':
+        width = 0.0
+        if n > 2:
+            sg1 = np.sqrt(6.0 * (n - 2) / ((n + 1.0) * (n + 3)))
+            mean, sigma = std()
+            if sigma > 0.0:
+                g1 = np.average(((a - mean) / sigma) ** 3, weights=weights)
+                width = ptp / (1.0 + np.log2(n) +
+                               np.log2(1.0 + np.absolute(g1) / sg1))
+    elif bin_name == 'fd':
+        width = fd()
+    else:  # auto
+        fd_bw = fd()
+        width = min(fd_bw, sturges()) if fd_bw else sturges()
+
+    if width:
+        return int(np.ceil(ptp / width))
+    # Width can be zero for some estimators, e.g. FD when the IQR is zero.
+    return 1
+
+
+def _get_bin_stats(a, bin_edges):
+    """
+    Computes the count, sum and sum of squared deviations from the mean of the
+    values in each bin with bincount reductions, rather than masking the data
+    once per bin. As with np.digitize, a bin includes its left edge but not
+    its right edge, and the values outside of the edges are not counted.
+    Parameters
+    ==========
+    a : ndarray
+        Ravelled data array
+    bin_edges : ndarray
+        Monotonically increasing edges of the bins.
+    Returns
+    =======
+    counts : ndarray
+        Number of values in each bin.
+    sums : ndarray
+        Sum of the values in each bin.
+    sq_deviations : ndarray
+        Sum of the squared deviations from the mean of each bin, the variance
+        of a non-empty bin being its sum of squared deviations over its count.
+    """
+    num_bins = len(bin_edges) - 1
+    inds = np.digitize(a, bin_edges) - 1
+    in_bins = (inds >= 0) & (inds < num_bins)
+    a, inds = a[in_bins], inds[in_bins]
+
+    counts = np.bincount(inds, minlength=num_bins)
+    sums = np.bincount(inds, weights=a, minlength=num_bins)
+    means = sums / np.maximum(counts, 1)
+    deviations = a - means[inds]
+    sq_deviations = np.bincount(inds, weights=deviations * deviations,
+                                minlength=num_bins)
+    return counts, sums, sq_deviations
@@ -2,8 +2,10 @@ from . import NumericStatsMixin
 from .base_column_profilers import BaseColumnPrimitiveTypeProfiler
 from .profiler_options import IntOptions
 from . import BaseColumnProfiler
+from . import utils
 
 import numpy as np
+import pandas as pd
 
 
 class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
@@ -65,7 +67,7 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             min=self.min,
             max=self.max,
             mean=self.mean,
-            median=None,
+            median=self.median,
             variance=self.variance,
             stddev=self.stddev,
             histogram=self.histogram_methods[histogram_method]['histogram'],
@@ -99,13 +101,29 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :param df_series: series of values to evaluate
         :type df_series: pandas.core.series.Series
         :return: is_int_col
-        :rtype: list
+        :rtype: numpy.ndarray
         """
         len_df = len(df_series)
         if len_df == 0:
             return list()
 
-        return [NumericStatsMixin.is_int(x) for x in df_series]
+        return utils.parse_numeric(df_series)['is_int']
+
+    def _get_match_count(self, df_series, numeric_parse=None):
+        """
+        Counts the values of the series which are integers.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
+        :return: number of integer values
+        :rtype: int
+        """
+        if numeric_parse is None:
+            numeric_parse = utils.parse_numeric(df_series)
+        return np.sum(numeric_parse['is_int'])
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -122,19 +140,25 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             NumericStatsMixin._update_helper(self, df_series_clean, profile)
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, numeric_parse=None):
         """
         Updates the column profile.
         
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
         :return: None
         """
         if len(df_series) == 0:
             return
 
+        parse = numeric_parse
+        if parse is None:
+            parse = utils.parse_numeric(df_series)
         df_series = df_series.reset_index(drop=True)
-        is_each_row_int = self._is_each_row_int(df_series)
+        is_each_row_int = parse['is_int']
         sample_size = len(is_each_row_int)
         match_int_count = np.sum(is_each_row_int)
         profile = dict(match_count=match_int_count, sample_size=sample_size)
@@ -144,6 +168,6 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             prev_dependent_properties={}, subset_properties=profile)
 
         self._update_helper(
-            df_series_clean=df_series[is_each_row_int],
+            df_series_clean=pd.Series(parse['values'][is_each_row_int]),
             profile=profile
         )
@@ -18,6 +18,7 @@ from future.utils import with_metaclass
 from . import BaseColumnProfiler
 
 from . import histogram_utils
+from .sketches import KLL
 
 
 class abstractstaticmethod(staticmethod):
@@ -37,6 +38,8 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     a column in the dataset which is a text column. Has Subclasses itself.
     """
     col_type = None
+    # batches of losses compared before the losing bin methods are dropped
+    _histogram_selection_min_batches = 5
 
     def __init__(self, options=None):
         """
@@ -55,6 +58,17 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         self.max_histogram_bin = 10000
         self.histogram_bin_method_names = ['auto', 'fd', 'doane', 'scott',
                                            'rice', 'sturges', 'sqrt']
+        self._histogram_adaptive_selection = False
+        if self.options:
+            histogram_options = self.options.histogram_and_quantiles
+            if histogram_options.method is not None:
+                self.histogram_bin_method_names = [histogram_options.method]
+            self._histogram_adaptive_selection = \
+                histogram_options.adaptive_selection
+        self._histogram_batch_losses = {}
+        self._histogram_batch_run_times = {}
+        self._histogram_methods_pruned = False
+        self._histogram_dropped_run_time = 0.
         self.histogram_methods = {}
         for method in self.histogram_bin_method_names:
             self.histogram_methods[method] = {
@@ -70,6 +84,9 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         self.quantiles = {
             bin_num: None for bin_num in range(1000)
         }
+        self._quantile_sketch = None
+        if self.options and self.options.quantile_sketch.is_enabled:
+            self._quantile_sketch = KLL(self.options.quantile_sketch.k)
 
         self.__calculations = {
             "min": NumericStatsMixin._get_min,
@@ -79,6 +96,9 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             "histogram_and_quantiles":
                 NumericStatsMixin._get_histogram_and_quantiles
         }
+        if self._quantile_sketch is not None:
+            self.__calculations["quantile_sketch"] = \
+                NumericStatsMixin._get_quantile_sketch
 
         self._filter_properties_w_options(self.__calculations, options)
 
@@ -102,24 +122,49 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         # get available bin methods and set to current
         bin_methods = list(set(other1.histogram_bin_method_names) &
                            set(other2.histogram_bin_method_names))
+        other2_methods = {method: method for method in bin_methods}
+        if not bin_methods and (other1._histogram_methods_pruned
+                                or other2._histogram_methods_pruned):
+            # the adaptive selections kept different bin methods, so the
+            # selected histograms are merged instead
+            bin_methods = [other1.histogram_selection]
+            other2_methods = {
+                other1.histogram_selection: other2.histogram_selection}
         if not bin_methods:
             raise ValueError('Profiles have no overlapping bin methods and '
                              'therefore cannot be added together.')
         self.histogram_bin_method_names = bin_methods
+        self.histogram_methods = {
+            method: self.histogram_methods.get(method, {
+                'total_loss': 0,
+                'current_loss': 0,
+                'histogram': {'bin_counts': None, 'bin_edges': None}})
+            for method in bin_methods}
 
         for i, method in enumerate(self.histogram_bin_method_names):
-            combined_values = other1._histogram_to_array(
-                method) + other2._histogram_to_array(method)
-            bin_counts, bin_edges = self._get_histogram(
-                combined_values, method)
+            values1, weights1 = other1._histogram_to_weighted_values(method)
+            values2, weights2 = other2._histogram_to_weighted_values(
+                other2_methods[method])
+            bin_counts, bin_edges = self._get_weighted_histogram(
+                np.concatenate([values1, values2]),
+                np.concatenate([weights1, weights2]), method)
             self.histogram_methods[method]['histogram']['bin_counts'] = \
                 bin_counts
             self.histogram_methods[method]['histogram']['bin_edges'] = bin_edges
 
-        # Select histogram: always choose first profile selected method
-        # Either both profiles have the same selection or you at least use one
-        # of the profiles selected method
-        self.histogram_selection = other1.histogram_selection
+        # Select histogram: choose the selected method of the first profile,
+        # otherwise of the second, if it was merged. Otherwise, the profiles
+        # kept different methods, so the merged method with the least loss
+        # accumulated by both profiles is selected.
+        if other1.histogram_selection in bin_methods:
+            self.histogram_selection = other1.histogram_selection
+        elif other2.histogram_selection in bin_methods:
+            self.histogram_selection = other2.histogram_selection
+        else:
+            self.histogram_selection = min(bin_methods, key=lambda method: (
+                other1.histogram_methods[method]['total_loss']
+                + other2.histogram_methods[other2_methods[method]][
+                    'total_loss']))
         self._get_quantiles()
 
     def _add_helper(self, other1, other2):
@@ -130,6 +175,24 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         :param other2: profile2 being added to self
         :return: None
         """
+        # Merge quantile sketches before the histograms, which otherwise
+        # estimate the quantiles
+        if (other1._quantile_sketch is None) \
+                != (other2._quantile_sketch is None):
+            raise ValueError('Profiles must either both or neither use a '
+                             'quantile sketch to be added together.')
+        if other1._quantile_sketch is not None:
+            self._quantile_sketch = \
+                other1._quantile_sketch + other2._quantile_sketch
+            self.__calculations["quantile_sketch"] = \
+                NumericStatsMixin._get_quantile_sketch
+
+        self._histogram_methods_pruned = other1._histogram_methods_pruned \
+            or other2._histogram_methods_pruned
+        self._histogram_dropped_run_time = max(
+            other1._histogram_dropped_run_time,
+            other2._histogram_dropped_run_time)
+
         # Merge Variance
         self.variance = self._merge_variance(
             other1.match_count, other1.variance, other1.mean,
@@ -147,8 +210,11 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
 
         elif other2.min is None:
             # update histogram
-            self.histogram_methods = other1.histogram_methods
-            self.quantiles = other1.quantiles
+            self.histogram_bin_method_names = \
+                list(other1.histogram_bin_method_names)
+            self.histogram_methods = copy.deepcopy(other1.histogram_methods)
+            self.histogram_selection = other1.histogram_selection
+            self.quantiles = copy.deepcopy(other1.quantiles)
 
             # update min, max, sum
             self.min = other1.min
@@ -156,20 +222,60 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             self.sum = other1.sum
         else:
             # update histogram
-            self.histogram_methods = other2.histogram_methods
-            self.quantiles = other2.quantiles
+            self.histogram_bin_method_names = \
+                list(other2.histogram_bin_method_names)
+            self.histogram_methods = copy.deepcopy(other2.histogram_methods)
+            self.histogram_selection = other2.histogram_selection
+            self.quantiles = copy.deepcopy(other2.quantiles)
 
             # update min, max, sum
             self.min = other2.min
             self.max = other2.max
             self.sum = other2.sum
 
+    def _copy_numeric_stats(self, other):
+        """
+        Replaces the numerical statistics of the profile with a copy of the
+        ones of another profile, if both calculate the same statistics.
+
+        :param other: profile whose statistics are copied
+        :type other: NumericStatsMixin
+        :return: whether the statistics were copied
+        :rtype: bool
+        """
+        if set(self.__calculations) \
+                != set(other._NumericStatsMixin__calculations) \
+                or not set(other.histogram_bin_method_names).issubset(
+                    self.histogram_bin_method_names) \
+                or self._histogram_adaptive_selection \
+                != other._histogram_adaptive_selection:
+            return False
+        for name in ['min', 'max', 'sum', 'variance',
+                     'histogram_bin_method_names', 'histogram_methods',
+                     'histogram_selection', 'quantiles', '_quantile_sketch',
+                     '_histogram_batch_losses', '_histogram_batch_run_times',
+                     '_histogram_methods_pruned',
+                     '_histogram_dropped_run_time']:
+            setattr(self, name, copy.deepcopy(getattr(other, name)))
+        return True
+
     @property
     def mean(self):
         if self.match_count == 0:
             return 0
         return float(self.sum) / self.match_count
 
+    @property
+    def median(self):
+        """
+        Median estimated by the quantile sketch, None if the sketch is
+        disabled or empty.
+        """
+        if self._quantile_sketch is None \
+                or not self._quantile_sketch.num_values:
+            return None
+        return float(self._quantile_sketch.quantiles(0.5))
+
     @property
     def stddev(self):
         if self.match_count == 0:
@@ -213,15 +319,74 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         elif match_count2 < 1:
             return variance1
 
-        curr_count = match_count1
-        delta = mean2 - mean1
-        m_curr = variance1 * (curr_count - 1)
-        m_batch = variance2 * (match_count2 - 1)
-        M2 = m_curr + m_batch + delta ** 2 * curr_count * match_count2 / \
-            (curr_count + match_count2)
-        new_variance = M2 / (curr_count + match_count2 - 1)
+        match_count, _, M2 = NumericStatsMixin._merge_moments(
+            match_count1, mean1, variance1 * (match_count1 - 1),
+            match_count2, mean2, variance2 * (match_count2 - 1))
+        new_variance = M2 / (match_count - 1)
         return new_variance
 
+    @staticmethod
+    def _merge_moments(match_count1, mean1, M2_1, match_count2, mean2, M2_2):
+        """
+        Merges the count, mean and sum of squared deviations from the mean (M2)
+        of two sets of values exactly, from:
+        T. F. Chan, G. H. Golub and R. J. LeVeque, "Updating formulae and a
+        pairwise algorithm for computing sample variances", 1979.
+
+        :param match_count1: number of values in set 1
+        :param mean1: mean of set 1
+        :param M2_1: sum of squared deviations from the mean of set 1
+        :param match_count2: number of values in set 2
+        :param mean2: mean of set 2
+        :param M2_2: sum of squared deviations from the mean of set 2
+        :return: count, mean and M2 of the merged set
+        :rtype: tuple(int, float, float)
+        """
+        match_count = match_count1 + match_count2
+        if match_count < 1:
+            return 0, 0., 0.
+        delta = mean2 - mean1
+        mean = mean1 + delta * match_count2 / match_count
+        M2 = M2_1 + M2_2 + delta ** 2 * match_count1 * match_count2 / \
+            match_count
+        return match_count, mean, M2
+
+    @staticmethod
+    def _get_batch_moments(df_series, subset_properties):
+        """
+        Calculates the count, min, max, sum, mean and sum of squared deviations
+        from the mean (M2) of the batch together on a contiguous float buffer.
+        They are calculated once per batch and stored in the subset properties,
+        such that the min, max, sum and variance calculations share them.
+
+        :param df_series: batch of values
+        :type df_series: pandas.core.series.Series
+        :param subset_properties: Contains the results of the properties of the
+            subset before they are merged into the main data profile.
+        :type subset_properties: dict
+        :return: moments of the batch
+        :rtype: dict
+        """
+        moments = subset_properties.get("moments", None)
+        if moments is not None:
+            return moments
+
+        values = np.ascontiguousarray(df_series, dtype=np.float64)
+        sum_value = values.sum()
+        if np.isnan(sum_value):
+            values = values[~np.isnan(values)]
+            sum_value = values.sum()
+        match_count = len(values)
+        moments = dict(match_count=match_count, min=np.nan, max=np.nan,
+                       sum=sum_value, mean=0., M2=0.)
+        if match_count:
+            mean = sum_value / match_count
+            deviations = values - mean
+            moments.update(min=values.min(), max=values.max(), mean=mean,
+                           M2=np.dot(deviations, deviations))
+        subset_properties["moments"] = moments
+        return moments
+
     def _estimate_stats_from_histogram(self, method):
         # test estimated mean and var
         bin_counts = self.histogram_methods[method]['histogram']['bin_counts']
@@ -235,13 +400,10 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     def _total_histogram_bin_variance(self, input_array, method):
         # calculate total variance over all bins of a histogram
         bin_edges = self.histogram_methods[method]['histogram']['bin_edges']
-        inds = np.digitize(input_array, bin_edges)
-        sum_var = 0
-        for i in range(1, len(bin_edges)):
-            elements_in_bin = input_array[inds == i]
-            bin_var = elements_in_bin.var() if len(elements_in_bin) > 0 else 0
-            sum_var += bin_var
-        return sum_var
+        counts, _, sq_deviations = histogram_utils._get_bin_stats(
+            np.asarray(input_array, dtype=np.float64), bin_edges)
+        is_filled = counts > 0
+        return np.sum(sq_deviations[is_filled] / counts[is_filled])
 
     @staticmethod
     def _histogram_loss(diff_var, avg_diffvar, total_var,
@@ -283,18 +445,70 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
 
         return selected_method
 
-    def _histogram_to_array(self, bins):
-        # Extend histogram to array format
+    def _prune_histogram_methods(self, method_times):
+        """
+        Records the losses of the current batch and, once the selected method
+        is stable, stops updating the histograms of the losing bin methods.
+        The selected method is stable when, over at least
+        `_histogram_selection_min_batches` batches, its loss is lower than the
+        loss of every other method but the runner-up by more than twice the
+        standard error of their paired differences. The runner-up is kept as a
+        challenger which can still take over the selection.
+
+        :param method_times: time spent on the histogram and loss of each bin
+            method in the current batch
+        :type method_times: numpy.ndarray
+        :return: None
+        """
+        for method, run_time in zip(self.histogram_bin_method_names,
+                                    method_times):
+            self._histogram_batch_losses.setdefault(method, []).append(
+                self.histogram_methods[method]['current_loss'])
+            self._histogram_batch_run_times.setdefault(method, []).append(
+                run_time)
+
+        ranked_methods = sorted(
+            self.histogram_bin_method_names,
+            key=lambda method: self.histogram_methods[method]['total_loss'])
+        selected_method, challenger = ranked_methods[:2]
+        batch_losses = np.array([self._histogram_batch_losses[method]
+                                 for method in ranked_methods])
+        num_batches = batch_losses.shape[1]
+        if num_batches < self._histogram_selection_min_batches:
+            return
+
+        loss_diffs = batch_losses[2:] - batch_losses[0]
+        std_errors = loss_diffs.std(axis=1, ddof=1) / np.sqrt(num_batches)
+        if not np.all(loss_diffs.mean(axis=1) > 2 * std_errors):
+            return
+
+        for method in ranked_methods[2:]:
+            self._histogram_dropped_run_time += \
+                np.mean(self._histogram_batch_run_times[method])
+            del self.histogram_methods[method]
+        self.histogram_bin_method_names = [selected_method, challenger]
+        self._histogram_methods_pruned = True
+        self._histogram_batch_losses = {}
+        self._histogram_batch_run_times = {}
+
+    def _histogram_to_weighted_values(self, bins):
+        """
+        Represents the histogram by the left edge of each bin weighted by the
+        bin count, except for the count of the last bin which is split between
+        its two edges.
+
+        :param bins: bin method of the histogram
+        :type bins: str
+        :return: the values and their integer weights
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
         bin_counts = self.histogram_methods[bins]['histogram']['bin_counts']
         bin_edges = self.histogram_methods[bins]['histogram']['bin_edges']
-        hist_to_array = [[bin_edge] * bin_count for bin_count, bin_edge in
-                         zip(bin_counts[:-1], bin_edges[:-2])]
-        hist_to_array.append([bin_edges[-2]] * int(bin_counts[-1] / 2))
-        hist_to_array.append([bin_edges[-1]] *
-                             (bin_counts[-1] - int(bin_counts[-1] / 2)))
-        array_flatten = [element for sublist in hist_to_array for
-                         element in sublist]
-        return array_flatten
+        weights = np.empty(len(bin_edges), dtype=np.int64)
+        weights[:-2] = bin_counts[:-1]
+        weights[-2] = int(bin_counts[-1] / 2)
+        weights[-1] = bin_counts[-1] - weights[-2]
+        return np.asarray(bin_edges, dtype=np.float64), weights
 
     def _get_histogram(self, values, bin_method):
         """
@@ -321,11 +535,43 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             bin_counts, bin_edges = np.histogram(values, bins=n_equal_bins)
         return bin_counts, bin_edges
 
+    def _get_weighted_histogram(self, values, weights, bin_method):
+        """
+        Get histogram from values, each repeated as many times as its integer
+        weight, and bin method. The counts are redistributed across the new
+        bin edges by weight, such that the cost depends on the number of
+        distinct values rather than the number of repeated values.
+
+        :param values: input values
+        :type values: np.array
+        :param weights: number of times each value is repeated
+        :type weights: np.array
+        :param bin_method: bin method, e.g., sqrt, rice, etc
+        :type bin_method: str
+        :return: bin edges and bin counts
+        """
+        is_counted = weights > 0
+        values, weights = values[is_counted], weights[is_counted]
+        if len(np.unique(values)) == 1:
+            bin_counts = np.array([weights.sum()])
+            bin_edges = np.array([values[0], values[0]])
+        else:
+            n_equal_bins = histogram_utils._get_weighted_bin_count(
+                values, weights, bin_method)
+            n_equal_bins = min(n_equal_bins, self.max_histogram_bin)
+            bin_counts, bin_edges = np.histogram(
+                values, bins=n_equal_bins, weights=weights)
+        return bin_counts, bin_edges
+
     def _merge_histogram(self, values, bins):
         # values is the current array of values,
         # that needs to be updated to the accumulated histogram
-        combined_values = values + self._histogram_to_array(bins)
-        bin_counts, bin_edges = self._get_histogram(combined_values, bins)
+        values = np.asarray(values, dtype=np.float64)
+        hist_values, hist_weights = self._histogram_to_weighted_values(bins)
+        bin_counts, bin_edges = self._get_weighted_histogram(
+            np.concatenate([values, hist_values]),
+            np.concatenate([np.ones(len(values), dtype=np.int64),
+                            hist_weights]), bins)
         self.histogram_methods[bins]['histogram']['bin_counts'] = bin_counts
         self.histogram_methods[bins]['histogram']['bin_edges'] = bin_edges
 
@@ -341,37 +587,49 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         pp. 425–436.
         The idea is to select the current best method based on accumulated
         losses up to the current time: all methods are compared using the
-        accumulated losses, and the best method with minimal loss is picked
+        accumulated losses, and the best method with minimal loss is picked.
+        Once the selection is stable, only the histograms of the selected
+        method and a challenger are updated, see `_prune_histogram_methods`.
 
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
         :return:
         """
 
-        df_series = df_series.replace([np.inf, -np.inf], np.nan).dropna()
-        if df_series.empty:
+        values = np.asarray(df_series, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if not len(values):
             return
+        exact_var = values.var()
 
         current_est_var = np.zeros(len(self.histogram_bin_method_names))
         current_exact_var = np.zeros(len(self.histogram_bin_method_names))
         current_total_var = np.zeros(len(self.histogram_bin_method_names))
         current_run_time = np.zeros(len(self.histogram_bin_method_names))
+        start_times = np.zeros(len(self.histogram_bin_method_names))
         for i, method in enumerate(self.histogram_bin_method_names):
             # update histogram for the method
             start_time = time.time()
-            bin_counts, bin_edges = self._get_histogram(df_series, method)
+            start_times[i] = start_time
+            bin_counts, bin_edges = self._get_histogram(values, method)
             if self.histogram_methods[method]['histogram']['bin_counts'] is None:
                 self.histogram_methods[method]['histogram']['bin_counts'] = bin_counts
                 self.histogram_methods[method]['histogram']['bin_edges'] = bin_edges
             else:
-                self._merge_histogram(df_series.tolist(), bins=method)
+                self._merge_histogram(values, bins=method)
             run_time = time.time() - start_time
+            current_run_time[i] = run_time
+            if len(self.histogram_bin_method_names) == 1:
+                continue
             # update loss for the method
             current_est_var[i] = self._estimate_stats_from_histogram(method)[1]
-            current_exact_var = df_series.values.var()
+            current_exact_var = exact_var
             current_total_var[i] = self._total_histogram_bin_variance(
-                df_series.values, method)
-            current_run_time[i] = run_time
+                values, method)
+
+        if len(self.histogram_bin_method_names) == 1:
+            self.histogram_selection = self.histogram_bin_method_names[0]
+            return
 
         # select the best method and update the total loss
         selected_method = self._select_method_for_histogram(
@@ -379,6 +637,20 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             current_total_var, current_run_time)
         self.histogram_selection = selected_method
 
+        # only the selected method and its challenger are updated once the
+        # selection is stable
+        if self._histogram_methods_pruned:
+            self.times['histogram_selection_time_saved'] += \
+                self._histogram_dropped_run_time
+        elif self._histogram_adaptive_selection:
+            # time spent on each method including its loss, which is
+            # estimated for the last method from the other methods
+            method_times = current_run_time.copy()
+            method_times[:-1] = np.diff(start_times)
+            method_times[-1] += np.mean(
+                method_times[:-1] - current_run_time[:-1])
+            self._prune_histogram_methods(method_times)
+
     def _get_percentile(self, percentile):
         """
         Get value for the number where the given percentage of values fall below
@@ -389,40 +661,56 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         :return: Value for which the percentage of values in the distribution
             fall before the percentage
         """
+        return self._get_percentiles([percentile])[0]
+
+    def _get_percentiles(self, percentiles):
+        """
+        Get the values below which the given percentages of values fall, from
+        the quantile sketch if enabled, otherwise from the selected histogram.
+        The cumulative distribution of the histogram is computed once and the
+        bin reaching each percentage is found with a binary search.
+
+        :param percentiles: Percentages of values to fall before the values
+        :type percentiles: list(float)
+        :return: Values for which the percentages of values in the
+            distribution fall before each percentage
+        :rtype: numpy.ndarray
+        """
+        percentiles = np.asarray(percentiles, dtype=np.float64)
+        if self._quantile_sketch is not None:
+            return self._quantile_sketch.quantiles(percentiles / 100)
+
         selected_method = self.histogram_selection
         bin_counts = \
             self.histogram_methods[selected_method]['histogram']['bin_counts']
-        bin_edges = \
-            self.histogram_methods[selected_method]['histogram']['bin_edges']
+        bin_edges = np.asarray(
+            self.histogram_methods[selected_method]['histogram']['bin_edges'])
         num_edges = len(bin_edges)
 
-        if percentile == 100:
-            return bin_edges[-1]
-        percentile = float(percentile) / 100
-
-        accumulated_count = 0
+        fractions = percentiles / 100
         bin_counts = bin_counts.astype(float)
-        normalized_bin_counts = bin_counts / np.sum(bin_counts)
-
-        bin_id = -1
-        # keep updating the total counts until it is
-        # close to the designated percentile
-        while accumulated_count < percentile:
-            bin_id += 1
-            accumulated_count += normalized_bin_counts[bin_id]
-
-        if accumulated_count == percentile:
-            if (num_edges % 2) == 0:
-                return 0.5 * (bin_edges[bin_id] + bin_edges[bin_id + 1])
-            else:
-                return bin_edges[bin_id + 1]
+        accumulated_counts = np.cumsum(bin_counts / np.sum(bin_counts))
+
+        # first bin whose accumulated count reaches the percentile, no bin is
+        # reached when the percentile is not positive
+        bin_ids = np.minimum(
+            np.searchsorted(accumulated_counts, fractions, side='left'),
+            len(accumulated_counts) - 1)
+        bin_ids[fractions <= 0] = -1
+        accumulated_count = np.where(
+            bin_ids >= 0, accumulated_counts[bin_ids], 0.)
+
+        if (num_edges % 2) == 0:
+            exact_values = 0.5 * (bin_edges[bin_ids] + bin_edges[bin_ids + 1])
+            values = 0.5 * (bin_edges[bin_ids - 1] + bin_edges[bin_ids])
         else:
-            if bin_id == 0:
-                return 0.5 * (bin_edges[0] + bin_edges[1])
-            if (num_edges % 2) == 0:
-                return 0.5 * (bin_edges[bin_id - 1] + bin_edges[bin_id])
-            else:
-                return bin_edges[bin_id]
+            exact_values = bin_edges[bin_ids + 1]
+            values = bin_edges[bin_ids]
+        is_exact = accumulated_count == fractions
+        values = np.where(is_exact, exact_values, values)
+        values[~is_exact & (bin_ids == 0)] = 0.5 * (bin_edges[0] + bin_edges[1])
+        values[percentiles == 100] = bin_edges[-1]
+        return values
 
     def _get_quantiles(self):
         """
@@ -432,9 +720,9 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         :return: list of quantiles
         """
         size_bins = 100 / len(self.quantiles)
-        for bin_num in range(len(self.quantiles) - 1):
-            self.quantiles[bin_num] = self._get_percentile(
-                percentile=((bin_num + 1) * size_bins))
+        percentiles = np.arange(1, len(self.quantiles)) * size_bins
+        values = self._get_percentiles(percentiles)
+        self.quantiles.update(zip(range(len(self.quantiles) - 1), values))
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -461,38 +749,38 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     @BaseColumnProfiler._timeit(name="min")
     def _get_min(self, df_series, prev_dependent_properties,
                  subset_properties):
-        min_value = df_series.min()
-        self.min = min_value if not self.min else min(self.min, min_value)
+        min_value = self._get_batch_moments(df_series, subset_properties)["min"]
+        self.min = min_value if self.min is None else min(self.min, min_value)
         subset_properties["min"] = min_value
 
     @BaseColumnProfiler._timeit(name="max")
     def _get_max(self, df_series, prev_dependent_properties,
                  subset_properties):
-        max_value = df_series.max()
-        self.max = max_value if not self.max else max(self.max, max_value)
+        max_value = self._get_batch_moments(df_series, subset_properties)["max"]
+        self.max = max_value if self.max is None else max(self.max, max_value)
         subset_properties["max"] = max_value
 
     @BaseColumnProfiler._timeit(name="sum")
     def _get_sum(self, df_series, prev_dependent_properties,
                  subset_properties):
-        sum_value = df_series.sum()
+        sum_value = self._get_batch_moments(df_series, subset_properties)["sum"]
         subset_properties["sum"] = sum_value
         self.sum = self.sum + sum_value
 
     @BaseColumnProfiler._timeit(name="variance")
     def _get_variance(self, df_series, prev_dependent_properties,
                       subset_properties):
-        variance = df_series.var()
+        moments = self._get_batch_moments(df_series, subset_properties)
+        batch_count = moments["match_count"]
+        variance = np.nan
+        if batch_count > 1:
+            variance = moments["M2"] / (batch_count - 1)
         subset_properties["variance"] = variance
-        sum_value = subset_properties["sum"]
-        batch_count = subset_properties["match_count"]
-        batch_mean = 0. if not batch_count else \
-            float(sum_value) / batch_count
         self.variance = self._merge_variance(self.match_count, self.variance,
                                              prev_dependent_properties["mean"],
                                              batch_count,
                                              variance,
-                                             batch_mean)
+                                             moments["mean"])
 
     @BaseColumnProfiler._timeit(name="histogram_and_quantiles")
     def _get_histogram_and_quantiles(self, df_series,
@@ -500,13 +788,21 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                                      subset_properties):
         try:
             self._update_histogram(df_series)
-            if self.histogram_selection is not None:
+            if self.histogram_selection is not None \
+                    and self._quantile_sketch is None:
                 self._get_quantiles()
         except BaseException:
             warnings.warn(
                 'Histogram error. Histogram and quantile results will not be '
                 'available')
 
+    @BaseColumnProfiler._timeit(name="quantile_sketch")
+    def _get_quantile_sketch(self, df_series, prev_dependent_properties,
+                             subset_properties):
+        values = np.asarray(df_series, dtype=np.float64)
+        self._quantile_sketch.update(values[~np.isnan(values)])
+        self._get_quantiles()
+
     @abc.abstractmethod
     def update(self, df_series):
         """
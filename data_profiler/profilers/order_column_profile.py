@@ -1,4 +1,7 @@
 from . import BaseColumnProfiler
+from . import utils
+
+import numpy as np
 
 
 class OrderColumn(BaseColumnProfiler):
@@ -233,39 +236,63 @@ class OrderColumn(BaseColumnProfiler):
         return dict(order=self.order, times=self.times)
 
     @BaseColumnProfiler._timeit(name="order")
-    def _get_data_order(self, df_series):
+    def _get_data_order(self, df_series, chunk_size=100000,
+                        numeric_parse=None):
         """
         Retrieves the order profile of a given data series.
         Will return either: ascending, descending, constant value, or random.
-        Additionally, returns the first and last value of the series.
+        Additionally, returns the first and last value of the series. The
+        values are compared as floats if they all are, otherwise as strings.
+        The consecutive values are compared a chunk at a time, stopping at the
+        first chunk in which the order becomes random, in which case the last
+        value is the one before the order became random.
 
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
+        :param chunk_size: number of consecutive values compared at once
+        :type chunk_size: int
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed here if None
+        :type numeric_parse: dict
         :return: order, first_value, last_value
         :rtype: String, Float, Float
         """
-        try:
-            df_series = df_series.astype(float)
-        except ValueError:
-            pass
+        if numeric_parse is None:
+            numeric_parse = utils.parse_numeric(df_series)
+        if numeric_parse['is_float'].all():
+            values = numeric_parse['values']
+        else:
+            values = df_series.to_numpy()
 
         order = None
-        last_value = df_series.iloc[0]
-        first_value = df_series.iloc[0]
-
-        for i in range(1, len(df_series)):
-            value = df_series.iloc[i]
-            if value < last_value and order == 'ascending':
-                order = 'random'
-                break
-            elif value < last_value and order is None:
-                order = 'descending'
-            elif value > last_value and order == 'descending':
-                order = 'random'
-                break
-            elif value > last_value and order is None:
-                order = 'ascending'
-            last_value = value
+        first_value = values[0]
+        last_value = values[-1]
+        for start in range(0, len(values) - 1, chunk_size):
+            chunk = values[start:start + chunk_size + 1]
+            is_ascending = chunk[1:] > chunk[:-1]
+            is_descending = chunk[1:] < chunk[:-1]
+            if order is None:
+                ascending_ind = np.argmax(is_ascending)
+                descending_ind = np.argmax(is_descending)
+                if is_descending[descending_ind] and (
+                        not is_ascending[ascending_ind]
+                        or descending_ind < ascending_ind):
+                    order = 'descending'
+                elif is_ascending[ascending_ind]:
+                    order = 'ascending'
+
+            # the order is random at the first step against it
+            is_against_order = None
+            if order == 'ascending':
+                is_against_order = is_descending
+            elif order == 'descending':
+                is_against_order = is_ascending
+            if is_against_order is not None:
+                random_ind = np.argmax(is_against_order)
+                if is_against_order[random_ind]:
+                    order = 'random'
+                    last_value = chunk[random_ind]
+                    break
         if not order:
             order = "constant value"
 
@@ -292,7 +319,11 @@ class OrderColumn(BaseColumnProfiler):
         """
         if self.order == "random":
             return
-        order, first_value, last_value = self._get_data_order(df_series)
+        numeric_parse = None
+        if prev_dependent_properties:
+            numeric_parse = prev_dependent_properties.get('numeric_parse')
+        order, first_value, last_value = self._get_data_order(
+            df_series, numeric_parse=numeric_parse)
 
         self.order, self._first_value, self._last_value, self._piecewise = \
             self._merge_order(self.order, self._first_value,
@@ -313,12 +344,15 @@ class OrderColumn(BaseColumnProfiler):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, numeric_parse=None):
         """
         Updates the column profile.
 
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`,
+            parsed when needed if None
+        :type numeric_parse: dict
         :return: None
         """
         if len(df_series) == 0:
@@ -327,5 +361,6 @@ class OrderColumn(BaseColumnProfiler):
         profile = dict(sample_size=len(df_series))
         BaseColumnProfiler._perform_property_calcs(
             self, self.__calculations, df_series=df_series,
-            prev_dependent_properties={}, subset_properties=profile)
+            prev_dependent_properties=dict(numeric_parse=numeric_parse),
+            subset_properties=profile)
         self._update_helper(df_series, profile)
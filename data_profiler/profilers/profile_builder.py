@@ -14,12 +14,21 @@ from .column_profile_compilers import ColumnDataLabelerCompiler
 
 from .helpers.report_helpers import calculate_quantiles, _prepare_report
 from .profiler_options import ProfilerOptions, StructuredOptions
+from .sketches import HyperLogLog
 
+import concurrent.futures
+import contextlib
 import copy
+import math
+import operator
+import os
+import pickle
 import random
+import struct
+import numpy as np
 import pandas as pd
 import re
-import hashlib
+import zlib
 from collections import OrderedDict
 from .. import data_readers
 from . import utils
@@ -27,7 +36,7 @@ from . import utils
 
 class StructuredDataProfile(object):
 
-    def __init__(self, df_series, sample_size=None, min_sample_size=500,
+    def __init__(self, df_series=None, sample_size=None, min_sample_size=500,
                  sampling_ratio=0.2, min_true_samples=None,
                  options=None):
         self.options = options
@@ -37,6 +46,19 @@ class StructuredDataProfile(object):
         if self._min_true_samples is None:
             self._min_true_samples = 0
 
+        self.name = None
+        self.sample_size = 0
+        self.sample = list()
+        self.null_count = 0
+        self.null_types = list()
+        self._null_types_index = {}
+        self.profiles = {}
+        self._profile_cache = None
+
+        # without a column, the profile is left empty to be filled by a merge
+        if df_series is None:
+            return
+
         # if you create your own DF without giving the column name,
         # it labels the name as an int64, however, if you try to
         # `json.dump` an int64, it errors.
@@ -45,22 +67,20 @@ class StructuredDataProfile(object):
         else:
             self.name = int(df_series.name)
 
-        self.sample_size = 0
-        self.sample = list()
-        self.null_count = 0
-        self.null_types = list()
-        self.null_types_index = {}
         if not sample_size:
             sample_size = self._get_sample_size(df_series)
         clean_sampled_df, base_stats = \
             self.get_base_props_and_clean_null_params(df_series, sample_size)
         self._update_base_stats(base_stats)
+        numeric_parse = self._get_numeric_parse(clean_sampled_df)
         self.profiles = {
             'data_type_profile':
                 ColumnPrimitiveTypeProfileCompiler(clean_sampled_df,
-                                                   self.options),
+                                                   self.options,
+                                                   numeric_parse),
             'data_stats_profile':
-                ColumnStatsProfileCompiler(clean_sampled_df, self.options)}
+                ColumnStatsProfileCompiler(clean_sampled_df, self.options,
+                                           numeric_parse)}
 
         # use the data labeler by default
         use_data_labeler = True
@@ -91,22 +111,22 @@ class StructuredDataProfile(object):
                              ' options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
         merged_profile = StructuredDataProfile(
-            df_series=pd.Series([]),
             min_sample_size=max(self._min_sample_size, other._min_sample_size),
             sampling_ratio=max(self._sampling_ratio, other._sampling_ratio),
             min_true_samples=max(self._min_true_samples,
-                                 other._min_true_samples))
+                                 other._min_true_samples),
+            options=self.options)
 
         merged_profile.name = self.name
         merged_profile._update_base_stats(
             {"sample": self.sample, 'sample_size': self.sample_size,
              "null_count": self.null_count,
-             "null_types": copy.deepcopy(self.null_types_index)}
+             "null_types": self._null_types_index}
         )
         merged_profile._update_base_stats(
             {"sample": other.sample, 'sample_size': other.sample_size,
              "null_count": other.null_count,
-             "null_types": copy.deepcopy(other.null_types_index)}
+             "null_types": other._null_types_index}
         )
         samples = list(dict.fromkeys(self.sample + other.sample))
         merged_profile.sample = random.sample(samples, min(len(samples), 5))
@@ -116,8 +136,43 @@ class StructuredDataProfile(object):
             )
         return merged_profile
 
+    def __getstate__(self):
+        """
+        Excludes the cached profile from the pickled profile, since it is
+        compiled again from the profiles when needed.
+
+        :return: state of the profile without the cached profile
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        state['_profile_cache'] = None
+        return state
+
+    @property
+    def null_types_index(self):
+        """
+        Sorted row indices of each null type, expanded from their compact
+        representation.
+        """
+        return {null_type: null_rows.tolist()
+                for null_type, null_rows in self._null_types_index.items()}
+
     @property
     def profile(self):
+        """
+        Profile of the column, which is cached until the column is updated.
+        """
+        if self._profile_cache is None:
+            self._profile_cache = self._get_profile()
+        return self._profile_cache
+
+    def _get_profile(self):
+        """
+        Compiles the profile of the column from each of its profiles.
+
+        :return: profile of the column
+        :rtype: OrderedDict
+        """
         unordered_profile = dict()
         for profile in self.profiles.values():
             utils.dict_merge(unordered_profile, profile.profile)
@@ -175,6 +230,7 @@ class StructuredDataProfile(object):
         return list(OrderedDict.fromkeys(a + b))
 
     def _update_base_stats(self, base_stats):
+        self._profile_cache = None
         self.sample_size += base_stats["sample_size"]
         self.sample = base_stats["sample"]
         self.null_count += base_stats["null_count"]
@@ -183,11 +239,28 @@ class StructuredDataProfile(object):
         )
 
         for null_type, null_rows in base_stats["null_types"].items():
-            if type(null_rows) is list:
-                null_rows.sort()
-            self.null_types_index.setdefault(null_type, []).extend(null_rows)
+            self._null_types_index.setdefault(
+                null_type, utils.RowIndexSet()).update(null_rows)
 
     def update_profile(self, df_series, sample_size=None, min_true_samples=None):
+        self._update_profile(df_series, sample_size, min_true_samples)
+
+    def _update_profile(self, df_series, sample_size=None,
+                        min_true_samples=None):
+        """
+        Updates the base stats and the compiled profiles with the column.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :param sample_size: Number of samples to use in generating the profile
+        :type sample_size: int
+        :param min_true_samples: Minimum number of samples required for the
+            profiler
+        :type min_true_samples: int
+        :return: sampled column with nulls removed, which the compiled
+            profiles were updated with
+        :rtype: pandas.core.series.Series
+        """
         if not sample_size:
             sample_size = len(df_series)
         if not sample_size:
@@ -196,8 +269,31 @@ class StructuredDataProfile(object):
             self.get_base_props_and_clean_null_params(
                 df_series, sample_size, min_true_samples=min_true_samples)
         self._update_base_stats(base_stats)
+        numeric_parse = self._get_numeric_parse(clean_sampled_df)
         for profile in self.profiles.values():
-            profile.update_profile(clean_sampled_df)
+            profile.update_profile(clean_sampled_df,
+                                   numeric_parse=numeric_parse)
+        self._profile_cache = None
+        return clean_sampled_df
+
+    def _get_numeric_parse(self, clean_sampled_df):
+        """
+        Parses the sampled column once for all the profiles comparing its
+        values as numbers, which are the int, float and order profiles.
+
+        :param clean_sampled_df: sampled column with nulls removed
+        :type clean_sampled_df: pandas.core.series.Series
+        :return: parse of the column by `utils.parse_numeric`, None if it is
+            empty or none of these profiles is enabled
+        :rtype: dict
+        """
+        if clean_sampled_df.empty:
+            return None
+        if self.options and isinstance(self.options, StructuredOptions) \
+                and not {'int', 'float', 'order'}.intersection(
+                    self.options.enabled_columns):
+            return None
+        return utils.parse_numeric(clean_sampled_df)
 
     def _get_sample_size(self, df_series):
         """
@@ -232,17 +328,6 @@ class StructuredDataProfile(object):
             parameters
         :rtype: pd.Series, dict
         """
-        NO_FLAG = 0
-        null_values_and_flags = {
-            "": NO_FLAG,
-            "nan": re.IGNORECASE,
-            "none": re.IGNORECASE,
-            "null": re.IGNORECASE,
-            "  *": NO_FLAG,
-            "--*": NO_FLAG,
-            "__*": NO_FLAG,
-        }
-
         len_df = len(df_series)
         if not len_df:
             return df_series, {
@@ -252,35 +337,30 @@ class StructuredDataProfile(object):
         if min_true_samples is None:
             min_true_samples = self._min_true_samples
 
-        # Pandas reads empty values in the csv files as nan
-        df_series = df_series.apply(str)
-
         sample_ind_generator = utils.shuffle_in_chunks(
             len_df, chunk_size=sample_size)
 
         na_columns = dict()
         true_sample_list = list()
+        true_sample_subsets = list()
         total_sample_size = 0
         for sample_inds in sample_ind_generator:
             total_sample_size += len(sample_inds)
 
-            df_series_subset = df_series.iloc[sample_inds]
-            # Check if known null types exist in column
-            for na, flags in null_values_and_flags.items():
-                # Check for the regex of the na in the string.
-                reg_ex_na = f"^{na}$"
-                matching_na_elements = df_series_subset.str.contains(
-                    reg_ex_na, flags=flags)
-                for row, elem in matching_na_elements.items():
-                    if elem:
-                        # Since df_series_subset[row] is mutable,
-                        # need to make new var
-                        row_value = str(df_series_subset[row])
-                        na_columns.setdefault(row_value, list()).append(row)
-
-                # Drop the values that matched regex_na
-                df_series_subset = df_series_subset[~matching_na_elements]
+            # Only the sampled values are converted to strings, since pandas
+            # reads empty values in the csv files as nan
+            df_series_subset = utils.to_str_series(
+                df_series.iloc[sample_inds])
+            # Check if known null types exist in column, all at once
+            matching_na_elements = df_series_subset.str.contains(
+                _NULL_VALUES_REGEX).values
+            _add_null_types_index(
+                na_columns, df_series_subset[matching_na_elements])
+
+            # Drop the values that matched a null type
+            df_series_subset = df_series_subset[~matching_na_elements]
             true_sample_list += df_series_subset.index.tolist()
+            true_sample_subsets.append(df_series_subset)
 
             if len(true_sample_list) >= min_true_samples and total_sample_size:
                 break
@@ -288,6 +368,7 @@ class StructuredDataProfile(object):
         # close the generator in case it is not exhausted.
         sample_ind_generator.close()
 
+        df_series = pd.concat(true_sample_subsets)
         df_series = df_series.loc[sorted(true_sample_list)]
         non_na = len(df_series)
         total_na = total_sample_size - non_na
@@ -305,6 +386,127 @@ class StructuredDataProfile(object):
         return df_series, base_stats
 
 
+_NULL_VALUES_AND_FLAGS = {
+    "": 0,
+    "nan": re.IGNORECASE,
+    "none": re.IGNORECASE,
+    "null": re.IGNORECASE,
+    "  *": 0,
+    "--*": 0,
+    "__*": 0,
+}
+_NULL_VALUES_REGEX = re.compile("^(?:{})$".format("|".join(
+    "(?i:{})".format(na) if flags & re.IGNORECASE else na
+    for na, flags in _NULL_VALUES_AND_FLAGS.items()
+)))
+
+
+def _get_null_value_rank(null_value):
+    """
+    Returns the position in `_NULL_VALUES_AND_FLAGS` of the first null value
+    matching the given value.
+
+    :param null_value: value known to match one of the null values
+    :type null_value: str
+    :return: position of the matching null value
+    :rtype: int
+    """
+    for rank, (na, flags) in enumerate(_NULL_VALUES_AND_FLAGS.items()):
+        if re.search("^{}$".format(na), null_value, flags=flags):
+            return rank
+
+
+def _add_null_types_index(na_columns, null_series):
+    """
+    Adds the index of each null value to the list of its null type in
+    `na_columns`. Null types are added in order of the null value they match in
+    `_NULL_VALUES_AND_FLAGS` and then in order of appearance, as are their
+    indices.
+
+    :param na_columns: lists of indices for each null type, updated inplace
+    :type na_columns: dict
+    :param null_series: values of the column which are null
+    :type null_series: pandas.core.series.Series
+    :return: None
+    """
+    if not len(null_series):
+        return
+    codes, null_types = pd.factorize(null_series.values)
+    ranks = [_get_null_value_rank(null_type) for null_type in null_types]
+    sorted_inds = np.argsort(codes, kind='stable')
+    splits = np.split(null_series.index.values[sorted_inds],
+                      np.cumsum(np.bincount(codes))[:-1])
+    for code in sorted(range(len(null_types)), key=ranks.__getitem__):
+        na_columns.setdefault(null_types[code], list()).extend(
+            splits[code].tolist())
+
+
+@contextlib.contextmanager
+def _column_random_state(seed):
+    """
+    Seeds `random` and `numpy.random` while a column is profiled so that the
+    column profile does not depend on the order, or the process, in which the
+    columns are profiled. The prior random states are restored afterwards.
+
+    :param seed: seed for the column, None leaves the random states untouched
+    :type seed: int
+    :return: None
+    """
+    if seed is None:
+        yield
+        return
+    random_state = random.getstate()
+    np_random_state = np.random.get_state()
+    random.seed(seed)
+    np.random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(random_state)
+        np.random.set_state(np_random_state)
+
+
+def _profile_columns(column_tasks):
+    """
+    Creates or updates the structured profile of each column in the tasks.
+    Executed inline when profiling serially, otherwise within a pool worker,
+    hence the data labeler must be disabled in the task options.
+
+    :param column_tasks: tasks of the form (df_series, column_profile,
+        sample_size, min_true_samples, options, seed, return_sample) where
+        column_profile is None if the column has not been profiled yet.
+    :type column_tasks: list(tuple)
+    :return: the column profiles and their cleaned samples (if requested)
+    :rtype: list(tuple(StructuredDataProfile, pandas.core.series.Series))
+    """
+    results = []
+    for (df_series, column_profile, sample_size, min_true_samples, options,
+         seed, return_sample) in column_tasks:
+        with _column_random_state(seed):
+            if column_profile is None:
+                column_profile = StructuredDataProfile(
+                    df_series.iloc[:0],
+                    min_true_samples=min_true_samples,
+                    options=options)
+                if not sample_size:
+                    sample_size = column_profile._get_sample_size(df_series)
+            clean_sampled_df = column_profile._update_profile(
+                df_series, sample_size=sample_size,
+                min_true_samples=min_true_samples)
+        results.append(
+            (column_profile, clean_sampled_df if return_sample else None))
+    return results
+
+
+# sections of the profile report, in order
+_REPORT_SECTIONS = ("global_stats", "data_stats")
+
+# header of the saved profiles, followed by the version of their format
+_SAVE_FILE_SIGNATURE = b'DPPROFILE'
+_SAVE_FILE_VERSION = 1
+_SAVE_FILE_VERSION_STRUCT = struct.Struct('<H')
+
+
 class Profiler(object):
 
     def __init__(self, data, samples_per_update=None, min_true_samples=None, 
@@ -312,7 +514,7 @@ class Profiler(object):
         """
         Instantiate the Profiler class
         
-        :param data: Data to be profiled
+        :param data: Data to be profiled, an empty profiler is created if None
         :type data: Data class object
         :param samples_per_update: Number of samples to use in generating
             profile
@@ -337,12 +539,17 @@ class Profiler(object):
         self.file_type = None
         self.null_in_row_count = 0
         self.hashed_row_dict = dict()
+        self._unique_row_sketch = None
+        if self.options.unique_row_sketch.is_enabled:
+            self._unique_row_sketch = HyperLogLog(
+                self.options.unique_row_sketch.precision)
         self.rows_ingested = 0
         self._samples_per_update = samples_per_update
         self._min_true_samples = min_true_samples
         self._profile = dict()
-            
-        self.update_profile(data)
+
+        if data is not None:
+            self.update_profile(data)
 
     def __add__(self, other):
         """
@@ -363,11 +570,16 @@ class Profiler(object):
             raise ValueError('The two profilers were not setup with the same '
                              'options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
+        elif (self._unique_row_sketch is None) \
+                != (other._unique_row_sketch is None):
+            raise ValueError('The two profilers do not both estimate the '
+                             'unique rows with a sketch and cannot be added '
+                             'together.')
         merged_profile = Profiler(
-            data=pd.DataFrame([]), samples_per_update=self._samples_per_update,
-            min_true_samples=self._min_true_samples, profiler_options=None
+            data=None, samples_per_update=self._samples_per_update,
+            min_true_samples=self._min_true_samples,
+            profiler_options=self.options
         )
-        merged_profile.options = self.options
         merged_profile.encoding = self.encoding \
             if self.encoding == other.encoding else 'multiple files'
         merged_profile.file_type = self.file_type \
@@ -377,6 +589,9 @@ class Profiler(object):
         merged_profile.rows_ingested = self.rows_ingested + other.rows_ingested
         merged_profile.hashed_row_dict.update(self.hashed_row_dict)
         merged_profile.hashed_row_dict.update(other.hashed_row_dict)
+        if self._unique_row_sketch is not None:
+            merged_profile._unique_row_sketch = \
+                self._unique_row_sketch + other._unique_row_sketch
 
         for profile_name in self._profile:
             merged_profile._profile[profile_name] = (
@@ -384,11 +599,72 @@ class Profiler(object):
             )
         return merged_profile
 
+    @staticmethod
+    def merge(profiles, workers=None):
+        """
+        Merges many profiles together, e.g. the partial profiles of several
+        files or partitions of a dataset. The profiles are merged pairwise in
+        a balanced tree, hence each profile takes part in about log2(N)
+        merges instead of up to N - 1 merges when adding them one after the
+        other. If more than one worker is given, the merges of each level of
+        the tree are executed in a pool of threads, which keeps the data
+        labeler models shared among the profiles.
+
+        :param profiles: profiles to be merged
+        :type profiles: list(Profiler)
+        :param workers: number of threads merging the profiles, merged
+            serially if None or 1
+        :type workers: int
+        :return: merger of the profiles
+        :rtype: Profiler
+        """
+        profiles = list(profiles)
+        if not profiles:
+            raise ValueError('At least one profile must be given to merge.')
+        for profile in profiles:
+            if not isinstance(profile, Profiler):
+                raise TypeError('`{}` is not a Profiler and cannot be merged.'
+                                .format(type(profile).__name__))
+        if workers is not None and (isinstance(workers, bool)
+                                    or not isinstance(workers, int)
+                                    or workers < 1):
+            raise ValueError('workers must be a positive integer or None.')
+
+        with contextlib.ExitStack() as stack:
+            map_function = map
+            if workers and workers > 1 and len(profiles) > 2:
+                executor = stack.enter_context(
+                    concurrent.futures.ThreadPoolExecutor(max_workers=workers))
+                map_function = executor.map
+            while len(profiles) > 1:
+                merged_profiles = list(map_function(
+                    operator.add, profiles[0:-1:2], profiles[1::2]))
+                if len(profiles) % 2:
+                    merged_profiles.append(profiles[-1])
+                profiles = merged_profiles
+        return profiles[0]
+
     @property
     def profile(self):
         return self._profile
 
     def report(self, report_options=None):
+        """
+        Generates the report of the profile. The profile of each column is
+        cached until the column is updated, hence only the columns updated
+        since the previous report are compiled again. The report can also be
+        restricted to some of the columns or sections, such that the other
+        parts are not compiled at all.
+
+        :param report_options: options of the report, i.e. `output_format`,
+            `num_quantile_groups`, `columns`, the names of the columns in the
+            data stats, and `sections`, the sections of the report (any of
+            "global_stats" and "data_stats"). All columns and sections are
+            reported if not specified.
+        :type report_options: dict
+        :return: report of the profile
+        :rtype: OrderedDict
+        """
         if not report_options:
             report_options = {
                 "output_format": None,
@@ -396,10 +672,26 @@ class Profiler(object):
             }
         output_format = report_options.get("output_format", None)
         num_quantile_groups = report_options.get("num_quantile_groups", 4)
-
-        columns = list(self._profile.values())
-        report = OrderedDict([
-            ("global_stats", {
+        column_names = report_options.get("columns", None)
+        sections = report_options.get("sections", None)
+        if column_names is None:
+            column_names = list(self._profile)
+        else:
+            missing_columns = [name for name in column_names
+                               if name not in self._profile]
+            if missing_columns:
+                raise ValueError('Columns {} are not in the profile.'
+                                 .format(missing_columns))
+        if sections is None:
+            sections = _REPORT_SECTIONS
+        elif set(sections) - set(_REPORT_SECTIONS):
+            raise ValueError('Report sections must be any of {}.'
+                             .format(list(_REPORT_SECTIONS)))
+
+        report = OrderedDict()
+        if "global_stats" in sections:
+            columns = list(self._profile.values())
+            report["global_stats"] = {
                 "samples_used": columns[0].sample_size if columns else 0,
                 "column_count": len(columns),
                 "unique_row_ratio": self._get_unique_row_ratio(),
@@ -409,64 +701,169 @@ class Profiler(object):
                 "encoding": self.encoding,
                 "data_classification": None,
                 "covariance": None,
-            }),
-            ("data_stats", OrderedDict()),
-        ])
-        for key in self._profile.keys():
-            report["data_stats"][key] = self._profile[key].profile
-            quantiles = report["data_stats"][key]["statistics"].get(
-                'quantiles')
-            if quantiles:
-                quantiles = calculate_quantiles(num_quantile_groups, quantiles)
-                report["data_stats"][key]["statistics"]["quantiles"] = quantiles
+            }
+            if self._unique_row_sketch is not None:
+                report["global_stats"]["unique_row_ratio_error"] = \
+                    self._unique_row_sketch.relative_error
+        if "data_stats" in sections:
+            report["data_stats"] = OrderedDict()
+            for key in column_names:
+                # the containers of the cached profile are copied, such that
+                # changing the report does not change the later reports
+                column_report = utils.copy_nested_containers(
+                    self._profile[key].profile)
+                quantiles = column_report["statistics"].get('quantiles')
+                if quantiles:
+                    # only the quantiles of the groups are computed from the
+                    # profile of the data type, once they have been estimated
+                    get_percentiles = None
+                    selected_profile = self._profile[key] \
+                        .profiles['data_type_profile'].selected_profile
+                    if quantiles.get(0) is not None:
+                        get_percentiles = selected_profile._get_percentiles
+                    column_report["statistics"]["quantiles"] = \
+                        calculate_quantiles(num_quantile_groups, quantiles,
+                                            get_percentiles)
+                report["data_stats"][key] = column_report
 
         if output_format:
             return _prepare_report(report, output_format=output_format)
         return report
 
+    def save(self, filepath):
+        """
+        Saves the profile to a file in a compact, versioned binary format. The
+        file holds the state of the profiler and of each of its columns, but
+        not the models of the data labelers, which are reattached when the
+        profile is loaded.
+
+        :param filepath: path of the file the profile is saved to
+        :type filepath: str
+        :return: None
+        """
+        profiler_state = self.__dict__.copy()
+        column_profiles = profiler_state.pop('_profile')
+        state = {'profiler': profiler_state,
+                 'columns': [(name, column_profile.__getstate__())
+                             for name, column_profile
+                             in column_profiles.items()]}
+        profile_bytes = zlib.compress(
+            pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        with open(filepath, 'wb') as outfile:
+            outfile.write(_SAVE_FILE_SIGNATURE)
+            outfile.write(_SAVE_FILE_VERSION_STRUCT.pack(_SAVE_FILE_VERSION))
+            outfile.write(profile_bytes)
+
+    @staticmethod
+    def load(filepath):
+        """
+        Loads a profile saved with `Profiler.save` and reattaches the data
+        labelers, each of which is only loaded once for all the columns.
+
+        The states are unpickled, which can execute arbitrary code, hence only
+        load files from trusted sources.
+
+        :param filepath: path of the file the profile was saved to
+        :type filepath: str
+        :return: the loaded profile
+        :rtype: Profiler
+        """
+        with open(filepath, 'rb') as infile:
+            signature = infile.read(len(_SAVE_FILE_SIGNATURE))
+            version_bytes = infile.read(_SAVE_FILE_VERSION_STRUCT.size)
+            if signature != _SAVE_FILE_SIGNATURE \
+                    or len(version_bytes) != _SAVE_FILE_VERSION_STRUCT.size:
+                raise ValueError('`{}` is not a saved profile.'
+                                 .format(filepath))
+            version = _SAVE_FILE_VERSION_STRUCT.unpack(version_bytes)[0]
+            if version > _SAVE_FILE_VERSION:
+                raise ValueError('The profile was saved in version {} of the '
+                                 'format, which is newer than the supported '
+                                 'version {}.'.format(version,
+                                                      _SAVE_FILE_VERSION))
+            state = pickle.loads(zlib.decompress(infile.read()))
+
+        # the attributes missing from older states keep their defaults
+        profiler_state = state['profiler']
+        profile = Profiler(data=None,
+                           profiler_options=profiler_state['options'])
+        profile.__dict__.update(profiler_state)
+        for name, column_state in state['columns']:
+            column_profile = StructuredDataProfile(
+                options=column_state.get('options'))
+            column_profile.__dict__.update(column_state)
+            profile._profile[name] = column_profile
+
+        data_labelers = dict()
+        for column_profile in profile._profile.values():
+            data_label_profile = column_profile.profiles.get(
+                'data_label_profile', None)
+            if data_label_profile is None:
+                continue
+            for labeler_profile in data_label_profile._profiles.values():
+                labeler_profile._reattach_data_labeler(data_labelers)
+        return profile
+
+    def _get_unique_row_count(self):
+        """
+        Returns the number of unique rows, which is estimated when the unique
+        row sketch is enabled.
+
+        :return: number of unique rows
+        :rtype: int
+        """
+        if self._unique_row_sketch is not None:
+            return min(int(round(self._unique_row_sketch.cardinality)),
+                       self.rows_ingested)
+        return len(self.hashed_row_dict)
+
     def _get_unique_row_ratio(self):
-        return len(self.hashed_row_dict) / self.rows_ingested
+        return self._get_unique_row_count() / self.rows_ingested
 
     def _get_null_row_ratio(self):
         return self.null_in_row_count / self.rows_ingested
 
     def _get_duplicate_row_count(self):
-        return self.rows_ingested - len(self.hashed_row_dict)
+        return self.rows_ingested - self._get_unique_row_count()
 
     def _update_row_statistics(self, data):
         """
-        Iterate over the provided dataset row by row and calculate
-        the row statistics. Specificaly, number of unique rows,
-        rows containing null values, and total rows reviewed. This
-        function is safe to use in batches.
+        Calculate the row statistics of the provided dataset in a vectorized
+        manner. Specificaly, number of unique rows, rows containing null
+        values, and total rows reviewed. Each row is hashed to a 64-bit
+        integer over the values of its columns. This function is safe to use
+        in batches.
 
         :param data: a dataset
         :type data: pandas.DataFrame
         """
-        for index, row in data.iterrows():
-
-            # Hash the row and stores it in the dict, count keys for unique rows
-            hashed_row = hashlib.sha256(
-                row.to_string().strip().encode()).hexdigest()
-            self.hashed_row_dict[hashed_row] = True
+        if len(data.columns):
+            hashed_rows = pd.util.hash_pandas_object(data, index=False).values
+        else:
+            # rows without any columns are all the same
+            hashed_rows = np.zeros(len(data), dtype=np.uint64)
 
-            # check if null in row, if any add count
-            if row.isnull().any():
-                self.null_in_row_count += 1
+        # Stores the row hashes in the dict, count keys for unique rows, or
+        # in the sketch estimating the number of unique rows
+        if self._unique_row_sketch is not None:
+            self._unique_row_sketch.update(hashed_rows)
+        else:
+            self.hashed_row_dict.update(
+                dict.fromkeys(hashed_rows.tolist(), True))
 
-            # Used for ratios, total ingested rows
-            self.rows_ingested += 1
+        # Determines null count, any null in a row counts the row once
+        self.null_in_row_count += int(data.isnull().any(axis=1).sum())
 
-        # Determines null count, transposes column major to row major
-        # Any major returns true if null and sums total count of trues
-        # This is done quickly and with minimal transform(s)
-        # self.null_in_row_count = df.isnull().T.any().sum()
+        # Used for ratios, total ingested rows
+        self.rows_ingested += len(data)
 
     def update_profile(self, data, sample_size=None, min_true_samples=None):
         """
         Update the profile for data provided. User can specify the sample
         size to profile the data with. Additionally, the user can specify the
-        minimum number of non-null samples to profile.
+        minimum number of non-null samples to profile. If streaming is enabled
+        in the options, file-backed data is read and profiled in chunks, each
+        of which is sampled separately.
 
         :param data: data to be profiled
         :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
@@ -481,7 +878,17 @@ class Profiler(object):
         if not min_true_samples:
             min_true_samples = self._min_true_samples
 
-        if isinstance(data, data_readers.base_data.BaseData):
+        if isinstance(data, data_readers.base_data.BaseData) \
+                and self.options.streaming.is_enabled:
+            for chunk in data.get_chunk_generator(
+                    self.options.streaming.chunk_size):
+                self._profile = self._update_profile_from_chunk(
+                    chunk, self._profile, sample_size, min_true_samples,
+                    self.options)
+                self._update_row_statistics(chunk)
+            self.encoding = data.file_encoding
+            self.file_type = data.data_type
+        elif isinstance(data, data_readers.base_data.BaseData):
             self._profile = self._update_profile_from_chunk(
                 data.data, self._profile, sample_size, min_true_samples, self.options)
             self._update_row_statistics(data.data)
@@ -503,6 +910,12 @@ class Profiler(object):
                                    min_true_samples=None, options=None):
         """
         Iterate over the columns of a dataset and identify its parameters.
+        The columns are profiled in a pool of workers if parallel profiling is
+        enabled in the options, in which case each column of a process pool is
+        profiled with its own seed drawn from `random`, so the profiles do not
+        depend on the order in which the workers run. When every row of the
+        chunk is sampled, the statistics of the pooled profiles are identical
+        to the serial ones, only the randomly selected samples differ.
         
         :param df: a dataset
         :type df: pandas.DataFrame
@@ -524,23 +937,80 @@ class Profiler(object):
             raise ValueError('`Profiler` does not currently support data which '
                              'contains columns with duplicate names.')
 
+        structured_options = None
+        if options and options.structured_options:
+            structured_options = options.structured_options
+        parallel_options = options.parallel if options else None
+        is_parallel = bool(parallel_options and parallel_options.is_enabled)
+        is_thread_pool = is_parallel and parallel_options.pool_type == 'thread'
+
+        # the data labeler holds a model which cannot be shared with the
+        # workers, so it is always updated here with the cleaned samples
+        use_data_labeler = True
+        if structured_options:
+            use_data_labeler = structured_options.data_labeler.is_enabled
+        task_options = structured_options
+        if use_data_labeler:
+            task_options = copy.deepcopy(structured_options) \
+                if structured_options else StructuredOptions()
+            task_options.data_labeler.is_enabled = False
+
+        column_tasks = []
+        data_labelers = dict()
+        # the serial path and the thread pool share the caller's random state,
+        # only the columns of a process pool are seeded individually
+        seeds = dict()
         for col in df.columns:
-            if col in profile:
-                column_profile = profile[col]
-                column_profile.update_profile(
-                    df[col],
-                    sample_size=sample_size,
-                    min_true_samples=min_true_samples
-                )
+            if is_parallel and not is_thread_pool:
+                seeds[col] = random.randrange(2 ** 32)
+            column_profile = profile.get(col, None)
+            if column_profile is not None and use_data_labeler:
+                data_labelers[col] = \
+                    column_profile.profiles.pop('data_label_profile')
+            column_tasks.append((
+                df[col], column_profile, sample_size, min_true_samples,
+                task_options, seeds.get(col), use_data_labeler))
+
+        try:
+            workers = 1
+            if is_parallel:
+                workers = parallel_options.workers or os.cpu_count() or 1
+            columns_per_task = max(len(column_tasks), 1)
+            if workers > 1 and len(column_tasks) > 1:
+                columns_per_task = parallel_options.columns_per_task or \
+                    math.ceil(len(column_tasks) / (workers * 4))
+            task_chunks = [column_tasks[i:i + columns_per_task] for i in
+                           range(0, len(column_tasks), columns_per_task)]
+
+            if len(task_chunks) > 1:
+                pool_executor = concurrent.futures.ProcessPoolExecutor
+                if is_thread_pool:
+                    pool_executor = concurrent.futures.ThreadPoolExecutor
+                with pool_executor(max_workers=workers) as executor:
+                    results = list(executor.map(_profile_columns, task_chunks))
             else:
-                structured_options = None
-                if options and options.structured_options:
-                    structured_options = options.structured_options
-                profile[col] = StructuredDataProfile(
-                    df[col],
-                    sample_size=sample_size,
-                    min_true_samples=min_true_samples,
-                    options=structured_options
-                )
+                results = list(map(_profile_columns, task_chunks))
+
+            results = [result for chunk in results for result in chunk]
+            for col, (column_profile, clean_sampled_df) in zip(df.columns,
+                                                               results):
+                column_profile.options = structured_options
+                if use_data_labeler:
+                    with _column_random_state(seeds.get(col)):
+                        if col in data_labelers:
+                            data_labelers[col].update_profile(clean_sampled_df)
+                        else:
+                            data_labelers[col] = ColumnDataLabelerCompiler(
+                                clean_sampled_df, structured_options)
+                    column_profile.profiles['data_label_profile'] = \
+                        data_labelers[col]
+                    column_profile._profile_cache = None
+                profile[col] = column_profile
+        finally:
+            # reattach the data labelers which were not updated, e.g. if a
+            # worker raised, so the column profiles never lose them
+            for col, data_labeler in data_labelers.items():
+                if 'data_label_profile' not in profile[col].profiles:
+                    profile[col].profiles['data_label_profile'] = data_labeler
 
         return profile
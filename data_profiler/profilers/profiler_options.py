@@ -163,6 +163,88 @@ class BaseColumnOptions(BooleanOption):
         return is_enabled
 
 
+class HistogramOption(BooleanOption):
+
+    bin_methods = ['auto', 'fd', 'doane', 'scott', 'rice', 'sturges', 'sqrt']
+
+    def __init__(self, is_enabled=True):
+        """
+        Options for the histograms and quantiles of the numeric stats. The
+        histogram of each bin method is updated with every batch and the
+        method with the least accumulated loss is selected.
+
+        :ivar is_enabled: boolean option to enable/disable the histograms and
+            quantiles.
+        :vartype is_enabled: bool
+        :ivar method: bin method pinned as the only histogram updated, or None
+            to select among all the bin methods.
+        :vartype method: str or None
+        :ivar adaptive_selection: boolean option to stop updating the
+            histograms of the losing bin methods once the selected method is
+            stable, keeping only the selected method and one challenger.
+            Disabled by default, in which case every bin method is updated.
+        :vartype adaptive_selection: bool
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.method = None
+        self.adaptive_selection = False
+
+    def _validate_helper(self, variable_path='HistogramOption'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if self.method is not None and self.method not in self.bin_methods:
+            errors.append("{}.method must be None or one of {}."
+                          .format(variable_path, self.bin_methods))
+        if not isinstance(self.adaptive_selection, bool):
+            errors.append("{}.adaptive_selection must be a Boolean."
+                          .format(variable_path))
+        return errors
+
+
+class QuantileSketchOptions(BooleanOption):
+
+    def __init__(self):
+        """
+        Options for estimating the quantiles and median of the numeric stats
+        with a KLL sketch, which is updated and merged in bounded memory,
+        instead of from the selected histogram. Disabled by default, in which
+        case the quantiles are estimated from the histogram and no median is
+        reported.
+
+        :ivar is_enabled: boolean option to enable/disable the sketch.
+        :vartype is_enabled: bool
+        :ivar k: capacity of the largest compactor of the sketch, at least 8.
+            The normalized rank error of the quantiles is approximately
+            2.296 / k ** 0.9723.
+        :vartype k: int
+        """
+        BooleanOption.__init__(self, is_enabled=False)
+        self.k = 200
+
+    def _validate_helper(self, variable_path='QuantileSketchOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if isinstance(self.k, bool) or not isinstance(self.k, int) \
+                or self.k < 8:
+            errors.append("{}.k must be an integer of at least 8."
+                          .format(variable_path))
+        return errors
+
+
 class NumericalOptions(BaseColumnOptions):
     def __init__(self):
         """
@@ -178,9 +260,12 @@ class NumericalOptions(BaseColumnOptions):
         :vartype sum: BooleanOption
         :ivar variance: boolean option to enable/disable variance
         :vartype variance: BooleanOption
-        :ivar histogram_and_quantiles: boolean option to enable/disable
-            histogram_and_quantiles
-        :vartype histogram_and_quantiles: BooleanOption
+        :ivar histogram_and_quantiles: option to enable/disable
+            histogram_and_quantiles and select their bin method
+        :vartype histogram_and_quantiles: HistogramOption
+        :ivar quantile_sketch: option to estimate the quantiles and median
+            with a sketch instead of the histogram
+        :vartype quantile_sketch: QuantileSketchOptions
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
@@ -189,7 +274,8 @@ class NumericalOptions(BaseColumnOptions):
         self.max = BooleanOption(is_enabled=True)
         self.sum = BooleanOption(is_enabled=True)
         self.variance = BooleanOption(is_enabled=True)
-        self.histogram_and_quantiles = BooleanOption(is_enabled=True)
+        self.histogram_and_quantiles = HistogramOption(is_enabled=True)
+        self.quantile_sketch = QuantileSketchOptions()
         BaseColumnOptions.__init__(self)
 
     @property
@@ -248,7 +334,7 @@ class NumericalOptions(BaseColumnOptions):
 
         errors = super()._validate_helper(variable_path=variable_path)
         for item in ["histogram_and_quantiles", "min", "max", "sum",
-                     "variance"]:
+                     "variance", "quantile_sketch"]:
             if not isinstance(self.properties[item], BooleanOption):
                 errors.append("{}.{} must be a BooleanOption."
                               .format(variable_path, item))
@@ -287,9 +373,12 @@ class IntOptions(NumericalOptions):
         :vartype sum: BooleanOption
         :ivar variance: boolean option to enable/disable variance
         :vartype variance: BooleanOption
-        :ivar histogram_and_quantiles: boolean option to enable/disable
-            histogram_and_quantiles
-        :vartype histogram_and_quantiles: BooleanOption
+        :ivar histogram_and_quantiles: option to enable/disable
+            histogram_and_quantiles and select their bin method
+        :vartype histogram_and_quantiles: HistogramOption
+        :ivar quantile_sketch: option to estimate the quantiles and median
+            with a sketch instead of the histogram
+        :vartype quantile_sketch: QuantileSketchOptions
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
@@ -314,9 +403,12 @@ class FloatOptions(NumericalOptions):
         :vartype sum: BooleanOption
         :ivar variance: boolean option to enable/disable variance
         :vartype variance: BooleanOption
-        :ivar histogram_and_quantiles: boolean option to enable/disable
-            histogram_and_quantiles
-        :vartype histogram_and_quantiles: BooleanOption
+        :ivar histogram_and_quantiles: option to enable/disable
+            histogram_and_quantiles and select their bin method
+        :vartype histogram_and_quantiles: HistogramOption
+        :ivar quantile_sketch: option to estimate the quantiles and median
+            with a sketch instead of the histogram
+        :vartype quantile_sketch: QuantileSketchOptions
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
@@ -341,6 +433,37 @@ class FloatOptions(NumericalOptions):
         return errors
 
 
+class VocabOptions(BooleanOption):
+
+    def __init__(self):
+        """
+        Options for the vocab of the text column.
+
+        :ivar is_enabled: boolean option to enable/disable the vocab.
+        :vartype is_enabled: bool
+        :ivar track_counts: boolean option to also count each character of
+            the vocab.
+        :vartype track_counts: bool
+        """
+        BooleanOption.__init__(self, is_enabled=True)
+        self.track_counts = False
+
+    def _validate_helper(self, variable_path='VocabOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if not isinstance(self.track_counts, bool):
+            errors.append("{}.track_counts must be a Boolean."
+                          .format(variable_path))
+        return errors
+
+
 class TextOptions(NumericalOptions):
     def __init__(self):
         """
@@ -348,8 +471,8 @@ class TextOptions(NumericalOptions):
 
         :ivar is_enabled: boolean option to enable/disable the column.
         :vartype is_enabled: bool
-        :ivar vocab: boolean option to enable/disable vocab
-        :vartype vocab: BooleanOption
+        :ivar vocab: option to enable/disable vocab and its counts
+        :vartype vocab: VocabOptions
         :ivar min: boolean option to enable/disable min
         :vartype min: BooleanOption
         :ivar max: boolean option to enable/disable max
@@ -358,15 +481,18 @@ class TextOptions(NumericalOptions):
         :vartype sum: BooleanOption
         :ivar variance: boolean option to enable/disable variance
         :vartype variance: BooleanOption
-        :ivar histogram_and_quantiles: boolean option to enable/disable
-            histogram_and_quantiles
-        :vartype histogram_and_quantiles: BooleanOption
+        :ivar histogram_and_quantiles: option to enable/disable
+            histogram_and_quantiles and select their bin method
+        :vartype histogram_and_quantiles: HistogramOption
+        :ivar quantile_sketch: option to estimate the quantiles and median
+            with a sketch instead of the histogram
+        :vartype quantile_sketch: QuantileSketchOptions
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
         """
         NumericalOptions.__init__(self)
-        self.vocab = BooleanOption(is_enabled=True)
+        self.vocab = VocabOptions()
 
     def _validate_helper(self, variable_path='TextOptions'):
         """
@@ -381,7 +507,8 @@ class TextOptions(NumericalOptions):
         if not isinstance(self.vocab, BooleanOption):
             errors.append("{}.vocab must be a BooleanOption."
                           .format(variable_path))
-        errors += self.vocab._validate_helper(variable_path)
+        else:
+            errors += self.vocab._validate_helper(variable_path + '.vocab')
         return errors
 
 
@@ -414,8 +541,41 @@ class CategoricalOptions(BaseColumnOptions):
 
         :ivar is_enabled: boolean option to enable/disable the column.
         :vartype is_enabled: bool
+        :ivar max_unique_count: number of unique values past which the column
+            is not categorical and its unique values are estimated with a
+            HyperLogLog sketch instead of being counted. None to always count
+            them.
+        :vartype max_unique_count: int
+        :ivar unique_count_precision: precision of the HyperLogLog sketch,
+            between 4 and 18.
+        :vartype unique_count_precision: int
         """
         BaseColumnOptions.__init__(self)
+        self.max_unique_count = None
+        self.unique_count_precision = 14
+
+    def _validate_helper(self, variable_path='CategoricalOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if self.max_unique_count is not None and (
+                isinstance(self.max_unique_count, bool)
+                or not isinstance(self.max_unique_count, int)
+                or self.max_unique_count < 1):
+            errors.append("{}.max_unique_count must be None or a positive "
+                          "integer.".format(variable_path))
+        if isinstance(self.unique_count_precision, bool) \
+                or not isinstance(self.unique_count_precision, int) \
+                or not 4 <= self.unique_count_precision <= 18:
+            errors.append("{}.unique_count_precision must be an integer "
+                          "between 4 and 18.".format(variable_path))
+        return errors
 
 
 class DataLabelerOptions(BaseColumnOptions):
@@ -474,6 +634,12 @@ class StructuredOptions(BaseOption):
         :vartype category: CategoricalOptions
         :ivar data_labeler: option set for data_labeler profiling.
         :vartype data_labeler: DataLabelerOptions
+        :ivar short_circuit_types: boolean option to only compute the
+            statistics of the data type selected for a column, the other
+            data types only counting the values they match. Disabled by
+            default, in which case the statistics of every data type are
+            computed.
+        :vartype short_circuit_types: BooleanOption
         """
         self.int = IntOptions()
         self.float = FloatOptions()
@@ -482,13 +648,14 @@ class StructuredOptions(BaseOption):
         self.order = OrderOptions()
         self.category = CategoricalOptions()
         self.data_labeler = DataLabelerOptions()
+        self.short_circuit_types = BooleanOption(is_enabled=False)
 
     @property
     def enabled_columns(self):
         """Returns a list of the enabled profiler columns."""
         enabled_columns = list()
         for key, value in self.properties.items():
-            if value.is_enabled:
+            if isinstance(value, BaseColumnOptions) and value.is_enabled:
                 enabled_columns.append(key)
         return enabled_columns
 
@@ -509,6 +676,127 @@ class StructuredOptions(BaseOption):
         return errors
 
 
+class ParallelOptions(BooleanOption):
+
+    _pool_types = ['process', 'thread']
+
+    def __init__(self):
+        """
+        Options for profiling the columns of a dataset in parallel. Disabled
+        by default, in which case the columns are profiled serially.
+
+        :ivar is_enabled: boolean option to enable/disable parallel profiling.
+        :vartype is_enabled: bool
+        :ivar pool_type: type of pool the columns are profiled in, either
+            'process' or 'thread'.
+        :vartype pool_type: str
+        :ivar workers: number of workers in the pool, None uses the number of
+            CPUs on the machine.
+        :vartype workers: int
+        :ivar columns_per_task: number of columns sent to a worker at once,
+            None splits the columns into roughly four tasks per worker.
+        :vartype columns_per_task: int
+        """
+        BooleanOption.__init__(self, is_enabled=False)
+        self.pool_type = 'process'
+        self.workers = None
+        self.columns_per_task = None
+
+    def _validate_helper(self, variable_path='ParallelOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if self.pool_type not in self._pool_types:
+            errors.append("{}.pool_type must be one of {}."
+                          .format(variable_path, self._pool_types))
+        for item in ['workers', 'columns_per_task']:
+            value = getattr(self, item)
+            if value is not None and (isinstance(value, bool)
+                                      or not isinstance(value, int)
+                                      or value < 1):
+                errors.append("{}.{} must be None or a positive integer."
+                              .format(variable_path, item))
+        return errors
+
+
+class StreamingOptions(BooleanOption):
+
+    def __init__(self):
+        """
+        Options for streaming file-backed data into the profile in chunks.
+        Disabled by default, in which case the entire dataset is loaded into
+        memory prior to profiling.
+
+        :ivar is_enabled: boolean option to enable/disable streaming.
+        :vartype is_enabled: bool
+        :ivar chunk_size: maximum number of rows read from the file and
+            profiled at once.
+        :vartype chunk_size: int
+        """
+        BooleanOption.__init__(self, is_enabled=False)
+        self.chunk_size = 100000
+
+    def _validate_helper(self, variable_path='StreamingOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if isinstance(self.chunk_size, bool) \
+                or not isinstance(self.chunk_size, int) or self.chunk_size < 1:
+            errors.append("{}.chunk_size must be a positive integer."
+                          .format(variable_path))
+        return errors
+
+
+class UniqueRowSketchOptions(BooleanOption):
+
+    def __init__(self):
+        """
+        Options for estimating the number of unique rows with a HyperLogLog
+        sketch, which uses a fixed amount of memory, instead of storing the
+        hash of every unique row. Disabled by default, in which case the
+        unique rows are counted exactly.
+
+        :ivar is_enabled: boolean option to enable/disable the sketch.
+        :vartype is_enabled: bool
+        :ivar precision: number of hash bits selecting one of the
+            2 ** precision registers of the sketch, between 4 and 18. The
+            relative standard error of the estimate is
+            1.04 / sqrt(2 ** precision).
+        :vartype precision: int
+        """
+        BooleanOption.__init__(self, is_enabled=False)
+        self.precision = 14
+
+    def _validate_helper(self, variable_path='UniqueRowSketchOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if isinstance(self.precision, bool) \
+                or not isinstance(self.precision, int) \
+                or not 4 <= self.precision <= 18:
+            errors.append("{}.precision must be an integer between 4 and 18."
+                          .format(variable_path))
+        return errors
+
+
 class ProfilerOptions(BaseOption):
 
     def __init__(self):
@@ -517,8 +805,17 @@ class ProfilerOptions(BaseOption):
 
         :ivar structured_options: option set for structured dataset profiling.
         :vartype structured_options: StructuredOptions
+        :ivar parallel: option set for profiling columns in parallel.
+        :vartype parallel: ParallelOptions
+        :ivar streaming: option set for streaming file-backed data in chunks.
+        :vartype streaming: StreamingOptions
+        :ivar unique_row_sketch: option set for estimating the unique rows.
+        :vartype unique_row_sketch: UniqueRowSketchOptions
         """
         self.structured_options = StructuredOptions()
+        self.parallel = ParallelOptions()
+        self.streaming = StreamingOptions()
+        self.unique_row_sketch = UniqueRowSketchOptions()
 
     def _validate_helper(self, variable_path='ProfilerOptions'):
         """
@@ -529,5 +826,12 @@ class ProfilerOptions(BaseOption):
         :return: list of errors (if raise_error is false)
         :rtype: list(str)
         """
-        return self.structured_options._validate_helper(
+        errors = self.structured_options._validate_helper(
             variable_path=variable_path + '.structured_options')
+        errors += self.parallel._validate_helper(
+            variable_path=variable_path + '.parallel')
+        errors += self.streaming._validate_helper(
+            variable_path=variable_path + '.streaming')
+        errors += self.unique_row_sketch._validate_helper(
+            variable_path=variable_path + '.unique_row_sketch')
+        return errors
@@ -0,0 +1,262 @@
+"""
+Mergeable sketches which summarize a stream of values in a fixed amount of
+memory.
+"""
+import numpy as np
+
+
+class HyperLogLog(object):
+    """
+    HyperLogLog sketch estimating the number of distinct values it was updated
+    with, using 2 ** precision registers of one byte each. The values are
+    given as 64-bit hashes. Two sketches with the same precision are merged by
+    taking the maximum of their registers.
+    From:
+    http://algo.inria.fr/flajolet/Publications/FlFuGaMe07.pdf
+    """
+
+    min_precision = 4
+    max_precision = 18
+
+    def __init__(self, precision=14):
+        """
+        Initializes an empty HyperLogLog sketch.
+
+        :param precision: number of hash bits used to select a register
+        :type precision: int
+        """
+        if isinstance(precision, bool) or not isinstance(precision, int) \
+                or not self.min_precision <= precision <= self.max_precision:
+            raise ValueError("precision must be an integer between {} and {}."
+                             .format(self.min_precision, self.max_precision))
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def num_registers(self):
+        return len(self.registers)
+
+    @property
+    def relative_error(self):
+        """
+        Relative standard error of the estimated number of distinct values.
+        """
+        return 1.04 / np.sqrt(self.num_registers)
+
+    def update(self, hashes):
+        """
+        Updates the sketch with 64-bit hashes of the values.
+
+        :param hashes: hashes of the values
+        :type hashes: numpy.ndarray
+        :return: None
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+        num_rank_bits = 64 - self.precision
+        register_inds = (hashes >> np.uint64(num_rank_bits)).astype(np.intp)
+
+        # the rank is the position of the leftmost 1 in the remaining bits,
+        # their bit length is found from the float exponent of each 32-bit
+        # half since a float cannot represent every 64-bit integer exactly
+        remaining = hashes & np.uint64((1 << num_rank_bits) - 1)
+        high_bit_length = np.frexp(remaining >> np.uint64(32))[1]
+        low_bit_length = np.frexp(remaining & np.uint64(0xFFFFFFFF))[1]
+        bit_length = np.where(high_bit_length > 0, high_bit_length + 32,
+                              low_bit_length)
+        ranks = (num_rank_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, register_inds, ranks)
+
+    @property
+    def cardinality(self):
+        """
+        Estimated number of distinct values the sketch was updated with.
+        """
+        num_registers = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        if num_registers == 16:
+            alpha = 0.673
+        elif num_registers == 32:
+            alpha = 0.697
+        elif num_registers == 64:
+            alpha = 0.709
+        estimate = alpha * num_registers ** 2 / np.sum(
+            np.ldexp(1.0, -self.registers.astype(int)))
+
+        # small range correction with linear counting
+        num_zero_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * num_registers and num_zero_registers:
+            estimate = num_registers * np.log(
+                num_registers / num_zero_registers)
+        return float(estimate)
+
+    def __add__(self, other):
+        """
+        Merges two sketches together overriding the `+` operator.
+
+        :param other: sketch being added to this one.
+        :type other: HyperLogLog
+        :return: merger of the two sketches
+        :rtype: HyperLogLog
+        """
+        if not isinstance(other, HyperLogLog):
+            raise TypeError("Unsupported operand type(s) for +: "
+                            "'HyperLogLog' and '{}'".format(
+                                other.__class__.__name__))
+        if self.precision != other.precision:
+            raise ValueError("Sketches with different precisions cannot be "
+                             "merged: {} != {}".format(self.precision,
+                                                       other.precision))
+        merged_sketch = HyperLogLog(self.precision)
+        merged_sketch.registers = np.maximum(self.registers, other.registers)
+        return merged_sketch
+
+
+class KLL(object):
+    """
+    KLL sketch estimating the quantiles of the values it was updated with in
+    bounded memory. The values are kept in compactors of increasing weight,
+    when a compactor exceeds its capacity, it is sorted and every other value
+    is promoted to the next compactor with twice the weight. Two sketches with
+    the same k are merged by concatenating their compactors and compacting.
+    From:
+    https://arxiv.org/abs/1603.05346
+    """
+
+    min_k = 8
+    _capacity_decay = 2. / 3
+
+    def __init__(self, k=200):
+        """
+        Initializes an empty KLL sketch.
+
+        :param k: capacity of the largest compactor, the rank error decreases
+            as k increases
+        :type k: int
+        """
+        if isinstance(k, bool) or not isinstance(k, int) or k < self.min_k:
+            raise ValueError("k must be an integer of at least {}."
+                             .format(self.min_k))
+        self.k = k
+        self.compactors = [np.empty(0, dtype=np.float64)]
+
+    @property
+    def num_values(self):
+        """
+        Number of values the sketch was updated with.
+        """
+        return int(sum(len(compactor) << level
+                       for level, compactor in enumerate(self.compactors)))
+
+    @property
+    def size(self):
+        """
+        Number of values retained by the sketch.
+        """
+        return sum(len(compactor) for compactor in self.compactors)
+
+    @property
+    def rank_error(self):
+        """
+        Approximate normalized rank error of the estimated quantiles with 99%
+        confidence, from the empirical fit of the Apache DataSketches library.
+        """
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return int(np.ceil(self._capacity_decay ** depth * self.k)) + 1
+
+    def _max_size(self):
+        return sum(self._capacity(level)
+                   for level in range(len(self.compactors)))
+
+    def _compress(self):
+        """
+        Compacts the lowest compactor exceeding its capacity, until the number
+        of values retained fits the capacity of the sketch.
+
+        :return: None
+        """
+        while self.size >= self._max_size():
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0, dtype=np.float64))
+
+                # promote every other value from a random offset, an odd
+                # value out remains in the compactor
+                compactor = np.sort(compactor)
+                num_compacted = len(compactor) - len(compactor) % 2
+                offset = np.random.randint(2)
+                self.compactors[level + 1] = np.concatenate([
+                    self.compactors[level + 1],
+                    compactor[offset:num_compacted:2]])
+                self.compactors[level] = compactor[num_compacted:]
+                break
+
+    def update(self, values):
+        """
+        Updates the sketch with the values.
+
+        :param values: values to add to the sketch
+        :type values: numpy.ndarray
+        :return: None
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+
+    def quantiles(self, fractions):
+        """
+        Estimates the values below which the fractions of the values fall.
+
+        :param fractions: fractions of the values, between 0 and 1
+        :type fractions: array_like
+        :return: estimated quantiles, NaN if the sketch is empty
+        :rtype: numpy.ndarray
+        """
+        fractions = np.asarray(fractions, dtype=np.float64)
+        values = np.concatenate(self.compactors)
+        if not len(values):
+            return np.full(fractions.shape, np.nan)
+        weights = np.concatenate([
+            np.full(len(compactor), 1 << level, dtype=np.int64)
+            for level, compactor in enumerate(self.compactors)])
+        sort_inds = np.argsort(values, kind='stable')
+        cumulative_weights = np.cumsum(weights[sort_inds])
+        inds = np.searchsorted(cumulative_weights,
+                               fractions * cumulative_weights[-1])
+        return values[sort_inds][np.minimum(inds, len(values) - 1)]
+
+    def __add__(self, other):
+        """
+        Merges two sketches together overriding the `+` operator.
+
+        :param other: sketch being added to this one.
+        :type other: KLL
+        :return: merger of the two sketches
+        :rtype: KLL
+        """
+        if not isinstance(other, KLL):
+            raise TypeError("Unsupported operand type(s) for +: "
+                            "'KLL' and '{}'".format(other.__class__.__name__))
+        if self.k != other.k:
+            raise ValueError("Sketches with different k cannot be merged: "
+                             "{} != {}".format(self.k, other.k))
+        merged_sketch = KLL(self.k)
+        num_levels = max(len(self.compactors), len(other.compactors))
+        empty = np.empty(0, dtype=np.float64)
+        merged_sketch.compactors = [
+            np.concatenate([
+                self.compactors[level]
+                if level < len(self.compactors) else empty,
+                other.compactors[level]
+                if level < len(other.compactors) else empty])
+            for level in range(num_levels)]
+        merged_sketch._compress()
+        return merged_sketch
@@ -1,8 +1,13 @@
+from collections import Counter
+
 from . import NumericStatsMixin
 from .base_column_profilers import BaseColumnPrimitiveTypeProfiler
 from .profiler_options import TextOptions
 from . import BaseColumnProfiler
 
+import numpy as np
+import pandas as pd
+
 
 class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     """
@@ -10,6 +15,9 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     the dataset which is a text column.
     """
     col_type = "text"
+    # text is the fallback of every column and its statistics are cheap, so
+    # they are always calculated, even when the data types are short circuited
+    _is_short_circuited = False
     
     def __init__(self, name, options=None):
         """
@@ -26,6 +34,9 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         NumericStatsMixin.__init__(self, options)
         BaseColumnPrimitiveTypeProfiler.__init__(self, name)
         self.vocab = list()
+        self._vocab_counts = None
+        if self.options and getattr(self.options.vocab, 'track_counts', False):
+            self._vocab_counts = Counter()
         self.__calculations = {
             "vocab": TextColumn._update_vocab
         }
@@ -44,11 +55,21 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         if not isinstance(other, TextColumn):
             raise TypeError("Unsupported operand type(s) for +: "
                             "'TextColumn' and '{}'".format(other.__class__.__name__))
+        if (self._vocab_counts is None) != (other._vocab_counts is None):
+            raise ValueError('Profiles must either both or neither track vocab '
+                             'counts to be added together.')
         merged_profile = TextColumn(None)
         merged_profile.vocab = self.vocab.copy()
-        merged_profile._update_vocab([other.vocab])
+        if self._vocab_counts is not None:
+            merged_profile._vocab_counts = self._vocab_counts.copy()
+            merged_profile._update_vocab(other._vocab_counts)
+        else:
+            merged_profile._update_vocab(other.vocab)
         NumericStatsMixin._add_helper(merged_profile, self, other)
         BaseColumnPrimitiveTypeProfiler._add_helper(merged_profile, self, other)
+        if merged_profile.max:
+            merged_profile.col_type = \
+                'string' if merged_profile.max <= 255 else 'text'
         return merged_profile
 
     @property
@@ -66,7 +87,7 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             min=self.min,
             max=self.max,
             mean=self.mean,
-            median=None,
+            median=self.median,
             variance=self.variance,
             stddev=self.stddev,
             histogram=self.histogram_methods[histogram_method]['histogram'],
@@ -74,6 +95,8 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             vocab=self.vocab,
             times=self.times
         )
+        if self._vocab_counts is not None:
+            profile['vocab_count'] = dict(self._vocab_counts)
         return profile
 
     @property
@@ -92,10 +115,13 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     def _update_vocab(self, data, prev_dependent_properties=None,
                       subset_properties=None):
         """
-        Finds the unique vocabulary used in the text column.
+        Finds the unique vocabulary used in the text column, and counts its
+        characters if tracked. The rows are joined to count the characters of
+        the whole batch at once.
 
-        :param data: list or array of data from which to extract vocab
-        :type data: Union[list, numpy.array, pandas.DataFrame]
+        :param data: list or array of data from which to extract vocab, or
+            the counts of the characters of another profile
+        :type data: Union[list, numpy.array, pandas.DataFrame, Counter]
         :param prev_dependent_properties: Contains all the previous properties
             that the calculations depend on.
         :type prev_dependent_properties: dict
@@ -104,13 +130,42 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :type subset_properties: dict
         :return: None
         """
-        vocab = []
-        for row in data:
-            row = list(row)
-            vocab = TextColumn._combine_unique_sets(vocab, row)
-        self.vocab = self._combine_unique_sets(self.vocab, vocab)
+        vocab_counts = data
+        if not isinstance(data, Counter):
+            vocab_counts = self._get_vocab_counts(''.join(data))
+        if self._vocab_counts is not None:
+            self._vocab_counts.update(vocab_counts)
+        self.vocab = self._combine_unique_sets(self.vocab, list(vocab_counts))
+
+    @staticmethod
+    def _get_vocab_counts(text):
+        """
+        Counts each character of the text from its code points, in the order
+        the characters first appear in the text. The order is found from
+        prefixes of the text doubling in size until every character counted
+        is found, which are usually short.
+
+        :param text: text to count the characters of
+        :type text: str
+        :return: count of each character
+        :rtype: dict
+        """
+        code_points = np.frombuffer(
+            text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        counts = np.bincount(code_points)
+        num_chars = np.count_nonzero(counts)
+
+        vocab_counts = dict()
+        start, size = 0, 1024
+        while len(vocab_counts) < num_chars:
+            for char in dict.fromkeys(text[start:start + size]):
+                if char not in vocab_counts:
+                    vocab_counts[char] = int(counts[ord(char)])
+            start += size
+            size *= 2
+        return vocab_counts
 
-    def _update_helper(self, df_series_clean, profile):
+    def _update_helper(self, df_series_clean, profile, numeric_parse=None):
         """
         Method for updating the column profile properties with a cleaned
         dataset and the known null parameters of the dataset.
@@ -119,21 +174,58 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :type df_series_clean: pandas.core.series.Series
         :param profile: text profile dictionary
         :type profile: dict
+        :param numeric_parse: parse of the series by `utils.parse_numeric`
+            whose lengths are reused, if any
+        :type numeric_parse: dict
         :return: None
         """
         if self._NumericStatsMixin__calculations:
-            text_lengths = df_series_clean.str.len()
+            text_lengths = self._get_text_lengths(df_series_clean,
+                                                  numeric_parse)
             NumericStatsMixin._update_helper(self, text_lengths, profile)
         self._update_column_base_properties(profile)
         if self.max:
             self.col_type = 'string' if self.max <= 255 else 'text'
 
-    def update(self, df_series):
+    @staticmethod
+    def _get_text_lengths(df_series, numeric_parse=None):
+        """
+        Gets the length of each text of the series, reusing the lengths of the
+        numeric parse of the series if any.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`
+        :type numeric_parse: dict
+        :return: length of each text
+        :rtype: pandas.core.series.Series
+        """
+        if numeric_parse is not None and numeric_parse['lengths'] is not None:
+            return pd.Series(numeric_parse['lengths'])
+        return df_series.str.len()
+
+    def _get_match_count(self, df_series, numeric_parse=None):
+        """
+        Counts the values of the series which are text, i.e. all of them.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param numeric_parse: unused, every value is text
+        :type numeric_parse: dict
+        :return: number of text values
+        :rtype: int
+        """
+        return len(df_series)
+
+    def update(self, df_series, numeric_parse=None):
         """
         Updates the column profile.
         
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param numeric_parse: parse of the series by `utils.parse_numeric`
+            whose lengths are reused, if any
+        :type numeric_parse: dict
         :return: None
         """
         len_df = len(df_series)
@@ -145,4 +237,4 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             self, self.__calculations, df_series=df_series,
             prev_dependent_properties={}, subset_properties=profile)
 
-        self._update_helper(df_series, profile)
+        self._update_helper(df_series, profile, numeric_parse)
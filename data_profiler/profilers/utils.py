@@ -14,8 +14,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import collections
+import copy
 import random
 import math
+import re
+
+import numpy as np
+import pandas as pd
 
 
 def dict_merge(dct, merge_dct):
@@ -36,48 +41,275 @@ def dict_merge(dct, merge_dct):
             dct[k] = merge_dct[k]
 
 
-class KeyDict(collections.defaultdict):
+def copy_nested_containers(obj):
     """
-    Helper class for sample_in_chunks. Allows keys that are missing to become
-    the values for that key.
-    From:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
+    Copies the dicts and lists nested in the object to an arbitrary depth,
+    keeping their type, while any other value is shared with the original.
+
+    :param obj: object whose containers are copied
+    :return: copy of the object
     """
-    def __missing__(self, key):
-        return key
+    if isinstance(obj, dict):
+        obj = copy.copy(obj)
+        for k, v in obj.items():
+            obj[k] = copy_nested_containers(v)
+    elif isinstance(obj, list):
+        obj = [copy_nested_containers(v) for v in obj]
+    return obj
 
 
-def shuffle_in_chunks(data_length, chunk_size):
+def shuffle_in_chunks(data_length, chunk_size, seed=None):
     """
     A generator for creating shuffled indexes in chunks. This reduces the cost
-    of having to create all indexes, but only of that what is needed.
-    Initial Code idea from:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
-    
+    of having to create all indexes, but only of that what is needed. Each
+    chunk is drawn at once with a NumPy random generator: random indexes not
+    drawn before are sampled until half of the data has been drawn, after
+    which the remaining indexes are shuffled at once. Hence, the memory used
+    is proportional to the number of indexes drawn.
+
     :param data_length: length of data to be shuffled
     :param chunk_size: size of shuffled chunks
-    :return: list of shuffled indices of chunk size
+    :param seed: seed for the random generator, if None it is drawn from the
+        `random` module such that seeding it makes the shuffle reproducible
+    :return: array of shuffled indices of chunk size
     """
-    indices = KeyDict()
-    j = 0
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    rng = np.random.default_rng(seed)
+
+    drawn_indices = np.empty(0, dtype=np.int64)  # sorted
+    remaining_indices = None
     # loop through all chunks
     for chunk_ind in range(max(math.ceil(data_length / chunk_size), 1)):
 
-        # determine the chunk size and preallocate an array
-        true_chunk_size = min(chunk_size, data_length - chunk_size * chunk_ind)
-        values = [-1] * true_chunk_size
+        # determine the chunk size
+        num_drawn = chunk_size * chunk_ind
+        true_chunk_size = min(chunk_size, data_length - num_drawn)
+
+        # once half of the indexes are drawn, most draws would be rejected
+        if remaining_indices is None \
+                and 2 * (num_drawn + true_chunk_size) > data_length:
+            remaining_indices = np.setdiff1d(
+                np.arange(data_length, dtype=np.int64), drawn_indices,
+                assume_unique=True)
+            rng.shuffle(remaining_indices)
+            drawn_indices = None
 
-        # shuffle the indexes
-        for count in range(true_chunk_size):
+        if remaining_indices is not None:
+            values = remaining_indices[:true_chunk_size]
+            remaining_indices = remaining_indices[true_chunk_size:]
+            yield values
+            continue
 
-            # get a random index to swap and swap it with j
-            k = random.randrange(j, data_length)
-            indices[j], indices[k] = indices[k], indices[j]
+        values = np.empty(0, dtype=np.int64)
+        while len(values) < true_chunk_size:
+            # draw enough indexes to expect 10% more new indexes than missing
+            num_missing = true_chunk_size - len(values)
+            num_available = data_length - len(drawn_indices) - len(values)
+            num_draws = math.ceil(-data_length * math.log1p(
+                -min(1.1 * num_missing / num_available, 0.99)))
+            candidates = np.unique(
+                rng.integers(0, data_length, size=num_draws))
 
-            # set the swapped value to the output
-            values[count] = indices[j]
+            # drop the indexes drawn before
+            for prev_indices in [drawn_indices, np.sort(values)]:
+                if len(prev_indices):
+                    positions = np.searchsorted(prev_indices, candidates)
+                    positions[positions == len(prev_indices)] -= 1
+                    candidates = candidates[
+                        prev_indices[positions] != candidates]
+
+            # the distinct indexes drawn are a uniformly random subset of
+            # those available, hence so is any shuffled part of them
+            rng.shuffle(candidates)
+            values = np.concatenate((values, candidates[:num_missing]))
 
-            # increment so as not to include values already swapped
-            j += 1
-            
         yield values
+
+        drawn_indices = np.union1d(drawn_indices, values)
+
+
+class RowIndexSet(object):
+    """
+    Compact, mergeable set of row indices. Integer indices are run-length
+    encoded as sorted, disjoint ranges of consecutive indices, such that long
+    runs of rows take constant space. Any other index labels are kept as a
+    sorted list (in order of addition if they cannot be compared). The indices
+    are only expanded when explicitly requested.
+    """
+
+    def __init__(self, indices=None):
+        """
+        Initializes the set with the given indices.
+
+        :param indices: row indices in the set
+        :type indices: Union[list, RowIndexSet]
+        """
+        self._ranges = np.empty((0, 2), dtype=np.int64)
+        self._labels = list()
+        if indices is not None:
+            self.update(indices)
+
+    @staticmethod
+    def _merge_ranges(ranges):
+        """
+        Merges overlapping or adjacent [start, stop) ranges.
+
+        :param ranges: ranges as rows of [start, stop)
+        :type ranges: numpy.ndarray
+        :return: sorted, disjoint ranges
+        :rtype: numpy.ndarray
+        """
+        if len(ranges) < 2:
+            return ranges
+        ranges = ranges[np.argsort(ranges[:, 0], kind='stable')]
+        stops = np.maximum.accumulate(ranges[:, 1])
+        is_new_range = np.empty(len(ranges), dtype=bool)
+        is_new_range[0] = True
+        is_new_range[1:] = ranges[1:, 0] > stops[:-1]
+        range_ends = np.append(np.flatnonzero(is_new_range)[1:] - 1,
+                               len(ranges) - 1)
+        return np.column_stack(
+            (ranges[is_new_range, 0], stops[range_ends]))
+
+    def update(self, indices):
+        """
+        Adds the given indices to the set.
+
+        :param indices: row indices to add
+        :type indices: Union[list, RowIndexSet]
+        :return: None
+        """
+        if isinstance(indices, RowIndexSet):
+            ranges = indices._ranges
+            labels = indices._labels
+        else:
+            labels = list(indices)
+            indices = np.asarray(labels)
+            if indices.dtype.kind in 'iu':
+                indices = np.unique(indices).astype(np.int64)
+                range_starts = np.append(
+                    0, np.flatnonzero(np.diff(indices) != 1) + 1)
+                range_stops = np.append(range_starts[1:], len(indices))
+                ranges = np.column_stack(
+                    (indices[range_starts], indices[range_stops - 1] + 1))
+                labels = list()
+            else:
+                ranges = np.empty((0, 2), dtype=np.int64)
+
+        if len(ranges):
+            self._ranges = self._merge_ranges(
+                np.concatenate((self._ranges, ranges)))
+        if len(labels):
+            labels = list(dict.fromkeys(self._labels + labels))
+            try:
+                labels.sort()
+            except TypeError:
+                pass  # labels of different types keep their order
+            self._labels = labels
+
+    def __len__(self):
+        return int(np.sum(self._ranges[:, 1] - self._ranges[:, 0])) \
+            + len(self._labels)
+
+    def __add__(self, other):
+        """
+        Merges two sets together overriding the `+` operator.
+
+        :param other: set being added to this one.
+        :type other: RowIndexSet
+        :return: union of the two sets
+        :rtype: RowIndexSet
+        """
+        merged_set = RowIndexSet(self)
+        merged_set.update(other)
+        return merged_set
+
+    def tolist(self):
+        """
+        Expands the set into a sorted list of its row indices.
+
+        :return: row indices in the set
+        :rtype: list
+        """
+        indices = list()
+        for start, stop in self._ranges.tolist():
+            indices.extend(range(start, stop))
+        return indices + self._labels
+
+
+def to_str_series(df_series):
+    """
+    Returns the series with each of its values converted to a string. A series
+    which already only contains strings is returned as is, such that a column
+    converted once can be shared by every profiler without copying it again.
+
+    :param df_series: a given column
+    :type df_series: pandas.core.series.Series
+    :return: column of strings
+    :rtype: pandas.core.series.Series
+    """
+    if isinstance(df_series, pd.Series) and not df_series.empty \
+            and pd.api.types.infer_dtype(df_series, skipna=False) == 'string':
+        return df_series
+    return df_series.apply(str)
+
+
+# the strings `float` accepts which `pandas.to_numeric` does not: nan and
+# infinity, overflowing exponents, underscores and non-ASCII digits
+_SPECIAL_FLOAT_REGEX = re.compile(
+    r'\s*[+-]?(?:nan|inf(?:inity)?|(?=\.?\d)(?:\d(?:_?\d)*)?'
+    r'(?:\.(?:\d(?:_?\d)*)?)?(?:e[+-]?\d(?:_?\d)*)?)\s*', re.IGNORECASE)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def parse_numeric(df_series):
+    """
+    Parses a whole column to floats in one pass, with the same rules as
+    `float`, along with which values are valid floats and which are integers.
+
+    :param df_series: a given column
+    :type df_series: pandas.core.series.Series
+    :return: the parsed `values` (NaN if invalid), the `is_float` and `is_int`
+        masks and the `lengths` of the values if they are all strings,
+        otherwise None
+    :rtype: dict
+    """
+    values = df_series.to_numpy(dtype=object)
+    try:
+        # every value is valid in numeric columns, which are cast at once
+        floats = values.astype(np.float64)
+        is_float = np.ones(len(values), dtype=bool)
+    except (ValueError, TypeError, OverflowError):
+        # pandas only finds the candidates, since it rounds differently than
+        # `float`, which then casts them exactly
+        is_float = pd.notna(pd.to_numeric(df_series, errors='coerce')
+                            ).to_numpy()
+        is_float[~is_float] = pd.Series(values[~is_float], dtype=object) \
+            .str.fullmatch(_SPECIAL_FLOAT_REGEX).fillna(False).to_numpy(bool)
+        floats = np.full(len(values), np.nan)
+        try:
+            floats[is_float] = values[is_float].astype(np.float64)
+        except (ValueError, TypeError, OverflowError):
+            parsed = np.array([_to_float(value) for value in values[is_float]],
+                              dtype=object)
+            valid = np.not_equal(parsed, None)
+            is_float[is_float] = valid
+            floats[is_float] = parsed[valid].astype(np.float64)
+    is_int = np.isfinite(floats)
+    is_int[is_int] = floats[is_int] == np.trunc(floats[is_int])
+
+    try:
+        lengths = np.fromiter(map(len, values), dtype=np.int64,
+                              count=len(values))
+    except TypeError:
+        lengths = None
+
+    return dict(values=floats, is_float=is_float, is_int=is_int,
+                lengths=lengths)
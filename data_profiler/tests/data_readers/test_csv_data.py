@@ -121,5 +121,45 @@ class TestCSVDataClass(unittest.TestCase):
         CSVData.is_match(path, options)
         self.assertEqual(0, options.get("header"))
 
+    def test_get_chunk_generator(self):
+        """
+        Determine if the csv file can be read in chunks which match the data
+        read all at once.
+        """
+        test_dir = os.path.join(test_root_path, 'data')
+        input_file_names = [
+            dict(path=os.path.join(test_dir, 'csv/diamonds.csv'),
+                 encoding='utf-8'),
+            dict(path=os.path.join(test_dir, 'csv/iris-utf-16.csv'),
+                 encoding='utf-16'),
+            dict(path=os.path.join(test_dir, 'csv/small-num.csv'),
+                 encoding='utf-8'),
+            dict(path=os.path.join(test_dir, 'csv/log_data_sparse.txt'),
+                 encoding='utf-8'),
+        ]
+        for input_file in input_file_names:
+            input_data_obj = Data(input_file['path'], data_type='csv')
+            chunks = list(input_data_obj.get_chunk_generator(chunk_size=7))
+
+            # chunks are read from the file, not from the loaded data
+            self.assertIsNone(input_data_obj._data)
+            self.assertEqual(input_file['encoding'].lower(),
+                             input_data_obj.file_encoding.lower())
+            self.assertTrue(all(len(chunk) <= 7 for chunk in chunks))
+            pd.testing.assert_frame_equal(input_data_obj.data,
+                                          pd.concat(chunks))
+
+        # loaded data is sliced
+        data = pd.DataFrame({'a': ['1', '2', '3'], 'b': ['4', '5', '6']})
+        input_data_obj = CSVData(data=data)
+        chunks = list(input_data_obj.get_chunk_generator(chunk_size=2))
+        self.assertEqual(2, len(chunks))
+        pd.testing.assert_frame_equal(data, pd.concat(chunks))
+
+        with self.assertRaisesRegex(ValueError,
+                                    "chunk_size must be a positive integer."):
+            list(input_data_obj.get_chunk_generator(chunk_size=0))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,13 @@
 import unittest
 import os
+import tempfile
+from unittest import mock
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ...data_readers import data_utils
 from ...data_readers.data import Data
 from ...data_readers.parquet_data import ParquetData
 
@@ -110,3 +117,39 @@ class TestParquetDataClass(unittest.TestCase):
         self.assertNotIn("b'", parq_data.data['col2'][1])
         self.assertNotIn('b"', parq_data.data['col2'][3])
         self.assertNotIn("b'", parq_data.data['col2'][3])
+
+    def test_get_chunk_generator(self):
+        """
+        Determine if the parquet file can be read in chunks which match the
+        data read all at once.
+        """
+        for input_file in self.input_file_names:
+            input_data_obj = Data(input_file['path'], data_type='parquet')
+            chunks = list(input_data_obj.get_chunk_generator(chunk_size=20))
+
+            # chunks are read from the file, not from the loaded data
+            self.assertIsNone(input_data_obj._data)
+            self.assertTrue(all(len(chunk) <= 20 for chunk in chunks))
+            pd.testing.assert_frame_equal(
+                input_data_obj.data.reset_index(drop=True), pd.concat(chunks))
+
+    def test_get_chunk_generator_within_row_group(self):
+        """
+        Determine if a row group larger than the chunk size is read one chunk
+        at a time rather than as a whole.
+        """
+        data = pd.DataFrame({'a': range(100), 'b': ['x', 'y'] * 50})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.parquet')
+            pq.write_table(pa.Table.from_pandas(data), file_path,
+                           row_group_size=len(data))
+
+            with mock.patch.object(pq.ParquetFile, 'read_row_group') \
+                    as mock_read_row_group:
+                chunks = list(data_utils.read_parquet_df_in_chunks(
+                    file_path, chunk_size=30, selected_columns=['b']))
+            mock_read_row_group.assert_not_called()
+
+        self.assertListEqual([30, 30, 30, 10],
+                             [len(chunk) for chunk in chunks])
+        pd.testing.assert_frame_equal(data[['b']], pd.concat(chunks))
@@ -1,6 +1,9 @@
 import unittest
 from data_profiler.profilers.helpers.report_helpers import _prepare_report
+from data_profiler.profilers.helpers.report_helpers import calculate_quantiles
+from data_profiler.profilers import FloatColumn
 import numpy as np
+import pandas as pd
 import json
 
 class TestReportHelperClass(unittest.TestCase):
@@ -23,6 +26,17 @@ class TestReportHelperClass(unittest.TestCase):
             json.dumps(x)
         except:
             self.fail('serialize_report not json serializable')
+    def test_calculate_quantiles_from_percentiles(self):
+        profiler = FloatColumn('test')
+        profiler.update(pd.Series(np.arange(1000).astype(str)))
+        for num_quantile_groups in [None, 3, 4, 10, 1000]:
+            expected = calculate_quantiles(num_quantile_groups,
+                                           profiler.quantiles)
+            quantiles = calculate_quantiles(num_quantile_groups,
+                                            profiler.quantiles,
+                                            profiler._get_percentiles)
+            self.assertDictEqual(expected, quantiles)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
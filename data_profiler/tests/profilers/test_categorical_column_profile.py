@@ -6,6 +6,7 @@ import numpy as np
 
 from data_profiler.profilers import CategoricalColumn, BaseColumnProfiler
 from data_profiler.profilers.profile_builder import StructuredDataProfile
+from data_profiler.profilers.profiler_options import CategoricalOptions
 from collections import defaultdict
 
 from . import utils as test_utils
@@ -162,13 +163,17 @@ class TestCategoricalColumn(unittest.TestCase):
         self.assertTrue(report["categorical"])
         six.assertCountEqual(
             self,
-            ['unique_count', 'unique_ratio', 'categories'], report['statistics']
+            ['unique_count', 'unique_ratio', 'categories',
+             'categorical_count'], report['statistics']
         )
         self.assertEqual(3, report["statistics"]["unique_count"])
         self.assertEqual(0.25, report["statistics"]["unique_ratio"])
         self.assertListEqual(
             ["a", "b", "c"], report["statistics"]["categories"]
         )
+        self.assertDictEqual(
+            {"a": 3, "b": 4, "c": 5}, report["statistics"]["categorical_count"]
+        )
 
     def test_false_categorical_report(self):
         df_non_categorical = pd.Series(list(map(str, range(0, 20))))
@@ -224,6 +229,61 @@ class TestCategoricalColumn(unittest.TestCase):
         self.assertEqual(profile3.is_match, True)
         self.assertEqual(profile3.unique_ratio, 16 / 1000)
 
+    def test_categorical_counts_merge(self):
+        profile = CategoricalColumn("Name")
+        profile.update(pd.Series(["b", "a", "b", "c"]))
+        profile2 = CategoricalColumn("Name")
+        profile2.update(pd.Series(["d", "a", "a"]))
+
+        profile3 = profile + profile2
+        self.assertListEqual(["b", "a", "c", "d"], profile3.categories)
+        self.assertDictEqual({"b": 2, "a": 3, "c": 1, "d": 1},
+                             profile3.categorical_counts)
+
+        # the profiles added are unchanged
+        self.assertDictEqual({"b": 2, "a": 1, "c": 1},
+                             profile.categorical_counts)
+
+    def test_max_unique_count(self):
+        options = CategoricalOptions()
+        options.max_unique_count = 20
+        profile = CategoricalColumn("Name", options=options)
+        profile.update(pd.Series(list(map(str, range(15))) * 5))
+        self.assertTrue(profile.is_match)
+        self.assertEqual(15, profile.unique_count)
+        self.assertIsNone(profile._unique_count_sketch)
+
+        # past the max unique count, the unique values are estimated
+        data = pd.Series(list(map(str, range(1000))) * 2)
+        profile.update(data)
+        self.assertFalse(profile.is_match)
+        self.assertListEqual([], profile.categories)
+        self.assertIsNotNone(profile._unique_count_sketch)
+        self.assertAlmostEqual(1000, profile.unique_count, delta=30)
+        self.assertAlmostEqual(1000 / 2075, profile.unique_ratio, delta=0.015)
+        report = profile.profile
+        self.assertFalse(report["categorical"])
+        six.assertCountEqual(
+            self, ['unique_count', 'unique_ratio'], report['statistics'])
+
+        # merging with a profile still counting its categories
+        profile2 = CategoricalColumn("Name")
+        profile2.update(pd.Series(list(map(str, range(1000, 1500)))))
+        for merged_profile in [profile + profile2, profile2 + profile]:
+            self.assertFalse(merged_profile.is_match)
+            self.assertEqual(2575, merged_profile.sample_size)
+            self.assertAlmostEqual(1500, merged_profile.unique_count,
+                                   delta=45)
+
+        # merging two profiles which exceed the max unique count together
+        profile3 = CategoricalColumn("Name", options=options)
+        profile3.update(pd.Series(list(map(str, range(10)))))
+        profile4 = CategoricalColumn("Name", options=options)
+        profile4.update(pd.Series(list(map(str, range(10, 25)))))
+        merged_profile = profile3 + profile4
+        self.assertFalse(merged_profile.is_match)
+        self.assertEqual(25, merged_profile.unique_count)
+
 
 class TestCategoricalSentence(unittest.TestCase):
 
@@ -2,9 +2,14 @@ from __future__ import print_function
 
 from data_profiler.profilers import column_profile_compilers as \
     col_pro_compilers
+from data_profiler.profilers.profiler_options import StructuredOptions
+from data_profiler.profilers import utils
 
+import numpy as np
+import pandas as pd
 import six
 import unittest
+import warnings
 from unittest import mock
 
 
@@ -84,5 +89,173 @@ class TestBaseColumnProfileCompilerClass(unittest.TestCase):
         )
 
 
+class TestColumnPrimitiveTypeProfileCompiler(unittest.TestCase):
+
+    def test_numeric_parse_shared(self):
+        data = pd.Series(['1', '2.5', 'a'], name='test')
+        for is_short_circuited in [False, True]:
+            options = StructuredOptions()
+            options.short_circuit_types.is_enabled = is_short_circuited
+            with mock.patch('data_profiler.profilers.utils.parse_numeric',
+                            wraps=utils.parse_numeric) as mock_parse:
+                compiler = \
+                    col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+                        data, options)
+                compiler.update_profile(data)
+
+            # the series is parsed once per update for every data type
+            self.assertEqual(2, mock_parse.call_count)
+            self.assertEqual(2, compiler._profiles['int'].match_count)
+            self.assertEqual(4, compiler._profiles['float'].match_count)
+            self.assertEqual(6, compiler._profiles['text'].match_count)
+
+    def test_short_circuit_types(self):
+        data = pd.Series(['1', '2', '3', '10', '-7'], name='test')
+        options = StructuredOptions()
+        options.datetime.is_enabled = False
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            data, options)
+
+        options.short_circuit_types.is_enabled = True
+        short_circuit_compiler = \
+            col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(data, options)
+
+        # the report is the same, the statistics of the data types not
+        # selected are not calculated
+        profile = compiler.profile
+        short_circuit_profile = short_circuit_compiler.profile
+        self.assertEqual('int', short_circuit_profile['data_type'])
+        self.assertDictEqual(profile['data_type_representation'],
+                             short_circuit_profile['data_type_representation'])
+        for stat in ['min', 'max', 'mean', 'variance', 'quantiles']:
+            self.assertEqual(profile['statistics'][stat],
+                             short_circuit_profile['statistics'][stat])
+        self.assertDictEqual(
+            {'int': 1.0, 'float': 1.0, 'string': 1.0},
+            short_circuit_compiler.profile['data_type_representation'])
+        self.assertEqual(9, short_circuit_compiler._profiles['int'].sum)
+        self.assertEqual(0, short_circuit_compiler._profiles['float'].sum)
+        self.assertIsNone(short_circuit_compiler._profiles['float'].min)
+        self.assertEqual(
+            5, short_circuit_compiler._profiles['float'].match_count)
+        self.assertEqual(2, short_circuit_compiler._profiles['text'].max)
+        self.assertSetEqual(
+            {'float'}, short_circuit_compiler._partial_stats_types)
+
+        # a data type no longer matching every value only counts matches,
+        # while the text is always updated in full
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            for batch in [['a', '1.5', '2'], ['5']]:
+                compiler.update_profile(pd.Series(batch, name='test'))
+                short_circuit_compiler.update_profile(
+                    pd.Series(batch, name='test'))
+        self.assertEqual(0, len(w))
+        self.assertDictEqual(
+            {'int': 7 / 9, 'float': 8 / 9, 'string': 1.0},
+            short_circuit_compiler.profile['data_type_representation'])
+        self.assertEqual('string', short_circuit_compiler.profile['data_type'])
+        self.assertEqual(9, short_circuit_compiler._profiles['int'].sum)
+        self.assertEqual(0, short_circuit_compiler._profiles['float'].sum)
+        text_profiler = short_circuit_compiler._profiles['text']
+        self.assertEqual(9, text_profiler.sample_size)
+        self.assertEqual(9, text_profiler.match_count)
+        statistics = short_circuit_compiler.profile['statistics']
+        expected_statistics = compiler.profile['statistics']
+        for stat in ['min', 'max', 'mean', 'variance', 'quantiles', 'vocab']:
+            self.assertEqual(expected_statistics[stat], statistics[stat])
+        for key in ['bin_counts', 'bin_edges']:
+            np.testing.assert_array_equal(
+                expected_statistics['histogram'][key],
+                statistics['histogram'][key])
+
+    def test_short_circuit_types_carry_over(self):
+        ints = pd.Series([str(i) for i in range(1000)], name='test')
+        floats = pd.Series(['0.5', '2.5'], name='test')
+        options = StructuredOptions()
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            pd.concat([ints, floats]), options)
+        expected_statistics = compiler.profile['statistics']
+
+        # the floats take over the statistics of the integers
+        options.short_circuit_types.is_enabled = True
+        short_circuit_compiler = \
+            col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(ints, options)
+        self.assertSetEqual({'float'},
+                            short_circuit_compiler._partial_stats_types)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            short_circuit_compiler.update_profile(floats)
+        self.assertEqual(0, len(w))
+        self.assertSetEqual(set(),
+                            short_circuit_compiler._partial_stats_types)
+        self.assertEqual('float', short_circuit_compiler.profile['data_type'])
+        statistics = short_circuit_compiler.profile['statistics']
+        for stat in ['min', 'max', 'mean', 'variance', 'stddev', 'precision',
+                     'precision_distribution', 'quantiles']:
+            self.assertEqual(expected_statistics[stat], statistics[stat])
+        for key in ['bin_counts', 'bin_edges']:
+            np.testing.assert_array_equal(
+                expected_statistics['histogram'][key],
+                statistics['histogram'][key])
+
+        # the same when the floats take over in a merge
+        compiler1 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            ints, options)
+        compiler2 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            floats, options)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            merged_compiler = compiler1 + compiler2
+        self.assertEqual(0, len(w))
+        self.assertSetEqual(set(), merged_compiler._partial_stats_types)
+        self.assertIsNone(compiler1._profiles['float'].min)
+        statistics = merged_compiler.profile['statistics']
+        for stat in ['min', 'max', 'mean', 'precision']:
+            self.assertEqual(expected_statistics[stat], statistics[stat])
+        self.assertAlmostEqual(expected_statistics['variance'],
+                               statistics['variance'])
+
+    def test_short_circuit_types_merge(self):
+        options = StructuredOptions()
+        options.short_circuit_types.is_enabled = True
+        compiler1 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            pd.Series(['1.5', '2.5'], name='test'), options)
+        compiler2 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            pd.Series(['1.5', '2.5'], name='test'), options)
+        merged_compiler = compiler1 + compiler2
+        self.assertTrue(merged_compiler._short_circuit_types)
+        self.assertEqual('float', merged_compiler.profile['data_type'])
+        self.assertEqual(8, merged_compiler._profiles['float'].sum)
+
+        compiler3 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            pd.Series(['a', 'b'], name='test'), options)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            merged_compiler = compiler1 + compiler3
+        self.assertEqual(0, len(w))
+        self.assertEqual('string', merged_compiler.profile['data_type'])
+        self.assertEqual(
+            0.5, merged_compiler.profile['data_type_representation']['float'])
+        self.assertEqual(1, merged_compiler.profile['statistics']['min'])
+        self.assertEqual(3, merged_compiler.profile['statistics']['max'])
+
+        # the statistics of the dates cannot be carried over to the integers
+        compiler4 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            pd.Series(['03142013'], name='test'), options)
+        self.assertEqual('datetime', compiler4.profile['data_type'])
+        compiler5 = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            pd.Series(['5'], name='test'), options)
+        with self.assertWarnsRegex(RuntimeWarning,
+                                   'The int statistics of column test are '
+                                   'left out of the report'):
+            merged_compiler = compiler4 + compiler5
+        self.assertEqual('int', merged_compiler.profile['data_type'])
+        statistics = merged_compiler.profile['statistics']
+        self.assertIn('times', statistics)
+        for stat in ['min', 'max', 'mean', 'variance', 'histogram']:
+            self.assertIsNone(statistics[stat])
+
+
 if __name__ == '__main__':
     unittest.main()
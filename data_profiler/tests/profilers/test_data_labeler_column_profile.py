@@ -4,6 +4,8 @@ from data_profiler.profilers.data_labeler_column_profile import DataLabelerColum
 
 import unittest
 from unittest import mock
+import pickle
+
 import pandas as pd
 import numpy as np
 import six
@@ -241,3 +243,29 @@ class TestDataLabelerColumnProfiler(unittest.TestCase):
         with self.assertRaises(ValueError):
             profiler._top_k_voting = 13
             test = profiler + profiler2
+
+    def test_pickle_without_data_labeler(self, mock_instance):
+        self._setup_data_labeler_mock(mock_instance)
+
+        data = pd.Series(['1', '2', '3'])
+        profiler = DataLabelerColumn(data.name)
+        profiler.update(data)
+
+        # the data labeler holds the model, hence it is not pickled
+        loaded_profiler = pickle.loads(pickle.dumps(profiler))
+        self.assertIsNone(loaded_profiler.data_labeler)
+        self.assertEqual(profiler.rank_distribution,
+                         loaded_profiler.rank_distribution)
+        self.assertEqual(profiler._sum_predictions.tolist(),
+                         loaded_profiler._sum_predictions.tolist())
+        self.assertEqual(profiler.sample_size, loaded_profiler.sample_size)
+
+        # reattached data labelers are loaded once for each directory
+        data_labelers = dict()
+        loaded_profiler._reattach_data_labeler(data_labelers)
+        loaded_profiler2 = pickle.loads(pickle.dumps(profiler))
+        loaded_profiler2._reattach_data_labeler(data_labelers)
+        self.assertEqual(2, mock_instance.call_count)
+        self.assertIs(mock_instance.return_value, loaded_profiler.data_labeler)
+        self.assertIs(loaded_profiler.data_labeler,
+                      loaded_profiler2.data_labeler)
@@ -6,6 +6,7 @@ from . import test_utils
 from unittest.mock import patch, MagicMock
 from collections import defaultdict
 
+import _strptime
 import unittest
 import pandas as pd
 import numpy as np
@@ -215,6 +216,96 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
 
         self._test_datetime_detection_helper(date_formats)
 
+    def test_get_datetime_profile_matches_strptime(self):
+        """
+        Checks the vectorized detection finds the same first format for each
+        value as strptime, including values which are dates despite an odd
+        shape and values which have the shape of a date without being one.
+        :return:
+        """
+        data = pd.Series([
+            '2013-03-5 15:43:30', '2013-03-6t15:43:30', '2013-03-05  10:00:00',
+            '2013-03- 5', '0001-01-01', '9999-12-31', '2016-02-29',
+            '2013-02-29', '0000-01-01', '2013-01-01 10:00:60',
+            '2013-03-6T15:43:30.1234567Z', '٢٠١٣-٠٣-٠٥', 'mar 11, 2013',
+            'MARCH 9, 2013', '12/31/99', '3142013', '5:46:30.2', 'hello',
+            '1.5', '', 5, '2013-03-07T10:00:00 '], dtype=object)
+
+        expected_formats = []
+        expected_dates = []
+        for value in data:
+            for date_format in DateTimeColumn._date_formats:
+                date = DateTimeColumn._validate_datetime(value, date_format)
+                if date is not np.nan:
+                    expected_dates.append((date, value))
+                    if date_format not in expected_formats:
+                        expected_formats.append(date_format)
+                    break
+
+        # the formats with a directive without a regular expression are
+        # parsed a value at a time
+        directive_regexes = DateTimeColumn._directive_regexes.copy()
+        for missing_directives in [[], ['H', 'f']]:
+            with patch.dict(DateTimeColumn._directive_regexes), \
+                    warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                for directive in missing_directives:
+                    DateTimeColumn._directive_regexes.pop(directive)
+                profile = DateTimeColumn._get_datetime_profile(data)
+            self.assertDictEqual(directive_regexes,
+                                 DateTimeColumn._directive_regexes)
+            self.assertListEqual(
+                [date_format for date_format in DateTimeColumn._date_formats
+                 if date_format in expected_formats],
+                profile['date_formats'])
+            self.assertEqual(len(expected_dates), profile['match_count'])
+            self.assertEqual(min(expected_dates), (profile['min_obj'],
+                                                   profile['min']))
+            self.assertEqual(max(expected_dates), (profile['max_obj'],
+                                                   profile['max']))
+
+    def test_date_format_regex(self):
+        """
+        Checks the regular expressions of the date formats are the ones of
+        strptime.
+        :return:
+        """
+        for date_format in DateTimeColumn._date_formats + ['%Y  %m%%']:
+            self.assertEqual(
+                _strptime._TimeRE_cache.pattern(date_format),
+                DateTimeColumn._get_date_format_regex(date_format))
+        self.assertIsNone(DateTimeColumn._get_date_format_regex('%Y %j'))
+
+    def test_learned_date_formats_tried_first(self):
+        data = self._generate_datetime_data("%m/%d/%y")
+        profiler = DateTimeColumn(data.name)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            profiler.update(data[:25])
+            self.assertListEqual(["%m/%d/%y"], profiler.date_formats)
+
+            # "%m/%d/%Y" comes first and has the same shape, but is not tried
+            # since all the values are dates in the learned format
+            with patch.object(DateTimeColumn, '_parse_datetimes',
+                              wraps=DateTimeColumn._parse_datetimes) \
+                    as mock_parse_datetimes:
+                profiler.update(data[25:])
+        self.assertSetEqual(
+            {"%m/%d/%y"},
+            {args[1] for args, _ in mock_parse_datetimes.call_args_list})
+        self.assertListEqual(["%m/%d/%y"], profiler.date_formats)
+        self.assertEqual(50, profiler.match_count)
+
+    def test_quick_reject_without_date_shapes(self):
+        data = pd.Series(['apple', 'banana split', '3.5', 'x-y-z', '12'] * 20)
+        profiler = DateTimeColumn(data.name)
+        with patch.object(DateTimeColumn, '_get_datetime_profile') \
+                as mock_get_datetime_profile:
+            profiler.update(data)
+        mock_get_datetime_profile.assert_not_called()
+        self.assertEqual(100, profiler.sample_size)
+        self.assertEqual(0, profiler.match_count)
+
     def test_data_ratio(self):
         data = [
             2.5, 12.5, '2013-03-5 15:43:30', 5, '03/10/13 15:43', 'Mar 11, 2013'
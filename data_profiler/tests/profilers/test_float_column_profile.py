@@ -6,6 +6,7 @@ from collections import defaultdict
 from unittest.mock import patch, MagicMock
 
 from data_profiler.profilers import FloatColumn
+from data_profiler.profilers import histogram_utils
 from data_profiler.profilers.profiler_options import FloatOptions
 
 test_root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
@@ -68,10 +69,39 @@ class TestFloatColumn(unittest.TestCase):
         float_profiler.update(df_mix)
         self.assertEqual(5, float_profiler.precision)
 
+        # 1 decimal place: 5 + 2, 2: 8 + 1, 3: 4, 5: 1
+        self.assertDictEqual({'min': 1, 'max': 5, 'mode': 2},
+                             float_profiler.precision_distribution)
+
         float_profiler = FloatColumn(df_mix.name)
         float_profiler.update(df_mix)
         self.assertEqual(5, float_profiler.precision)
 
+    def test_precision_distribution(self):
+        float_profiler = FloatColumn("Float")
+        self.assertDictEqual({'min': None, 'max': None, 'mode': None},
+                             float_profiler.precision_distribution)
+
+        # integers and values without a decimal point are not counted
+        df = pd.Series(['1', '2.50', '3.1', '4.1', '1e5', '6.', 'nan'])
+        self.assertDictEqual({0: 1, 1: 2, 2: 1},
+                             FloatColumn._get_float_precision_counts(df))
+        self.assertDictEqual(
+            {0: 1, 1: 2, 2: 1, 40000: 1},
+            FloatColumn._get_float_precision_counts(
+                pd.concat([df, pd.Series(['1.' + '5' * 40000])])))
+        float_profiler.update(df)
+        self.assertDictEqual({'min': 0, 'max': 2, 'mode': 1},
+                             float_profiler.precision_distribution)
+
+        # ties are broken by the lowest number of decimal places
+        other_profiler = FloatColumn("Float")
+        other_profiler.update(pd.Series(['1.25', '1.125', '1.125']))
+        merged_profiler = float_profiler + other_profiler
+        self.assertEqual(3, merged_profiler.precision)
+        self.assertDictEqual({'min': 0, 'max': 3, 'mode': 1},
+                             merged_profiler.precision_distribution)
+
     def test_profiled_min(self):
         # test with multiple values
         data = np.linspace(-5, 5, 11)
@@ -383,6 +413,19 @@ class TestFloatColumn(unittest.TestCase):
             input_array, method='auto')
         self.assertEqual(expected_total_var, est_total_var)
 
+    def test_get_bin_stats(self):
+        input_array = np.array([0.5, 1.1, 1.5, 2.3, 3.5, 4.0, 6.5, 7.0])
+        bin_edges = np.array([1.0, 3.0, 5.0, 7.0, 9.0])
+        counts, sums, sq_deviations = histogram_utils._get_bin_stats(
+            input_array, bin_edges)
+
+        # values below the first edge are not counted
+        np.testing.assert_array_equal([3, 2, 1, 1], counts)
+        np.testing.assert_array_almost_equal([4.9, 7.5, 6.5, 7.0], sums)
+        np.testing.assert_array_almost_equal(
+            [np.array([1.1, 1.5, 2.3]).var() * 3,
+             np.array([3.5, 4.0]).var() * 2, 0, 0], sq_deviations)
+
     def test_histogram_loss(self):
         # run time is small
         diff_var, avg_diffvar, total_var, avg_totalvar, run_time, avg_runtime =\
@@ -441,7 +484,89 @@ class TestFloatColumn(unittest.TestCase):
             current_total_var, current_run_time)
         self.assertEqual(selected_method, 'sturges')
 
-    def test_histogram_to_array(self):
+    def test_adaptive_histogram_selection(self):
+        np.random.seed(0)
+        batches = [pd.Series(np.random.lognormal(size=20000))
+                   .apply(str) for _ in range(8)]
+        options = FloatOptions()
+        options.histogram_and_quantiles.adaptive_selection = True
+        profiler = FloatColumn("Float", options=options)
+        for batch in batches[:4]:
+            profiler.update(batch)
+        self.assertEqual(7, len(profiler.histogram_bin_method_names))
+        self.assertNotIn('histogram_selection_time_saved', profiler.times)
+
+        # once the selection is stable, only it and a challenger are updated
+        for batch in batches[4:]:
+            profiler.update(batch)
+        self.assertEqual(2, len(profiler.histogram_bin_method_names))
+        self.assertIn(profiler.histogram_selection,
+                      profiler.histogram_bin_method_names)
+        self.assertCountEqual(profiler.histogram_bin_method_names,
+                              profiler.histogram_methods)
+        self.assertGreater(profiler.times['histogram_selection_time_saved'], 0)
+        self.assertEqual(
+            160000, profiler.histogram_methods[profiler.histogram_selection]
+            ['histogram']['bin_counts'].sum())
+
+        # profiles keeping different methods merge their selected histograms
+        other_profiler = FloatColumn("Float")
+        other_profiler.update(batches[0])
+        other_profiler.histogram_bin_method_names = ['sqrt']
+        other_profiler.histogram_selection = 'sqrt'
+        merged_profiler = profiler + other_profiler
+        self.assertEqual([profiler.histogram_selection],
+                         merged_profiler.histogram_bin_method_names)
+        self.assertEqual(
+            180000, merged_profiler.histogram_methods[
+                profiler.histogram_selection]['histogram']['bin_counts'].sum())
+
+        # a profile keeping every method merges the methods both kept, the
+        # selection being one of them
+        uniform_batches = [pd.Series(np.random.uniform(size=20000))
+                           .apply(str) for _ in range(8)]
+        pruned_profiler = FloatColumn("Float", options=options)
+        for batch in uniform_batches:
+            pruned_profiler.update(batch)
+        self.assertEqual(['sqrt', 'rice'],
+                         pruned_profiler.histogram_bin_method_names)
+        unpruned_profiler = FloatColumn("Float")
+        unpruned_profiler.update(batches[0])
+        self.assertEqual('auto', unpruned_profiler.histogram_selection)
+        for merged_profiler in [unpruned_profiler + pruned_profiler,
+                                pruned_profiler + unpruned_profiler]:
+            self.assertCountEqual(['sqrt', 'rice'],
+                                  merged_profiler.histogram_bin_method_names)
+            self.assertCountEqual(['sqrt', 'rice'],
+                                  merged_profiler.histogram_methods)
+            self.assertEqual('sqrt', merged_profiler.histogram_selection)
+            self.assertIsNotNone(merged_profiler.profile['quantiles'][0])
+
+        # a profile merged with an empty one copies its histograms
+        merged_profiler = profiler + FloatColumn("Float", options=options)
+        merged_profiler.histogram_methods.clear()
+        merged_profiler.quantiles.clear()
+        self.assertCountEqual(profiler.histogram_bin_method_names,
+                              profiler.histogram_methods)
+        self.assertEqual(1000, len(profiler.quantiles))
+
+        # adaptive selection is disabled by default
+        profiler = FloatColumn("Float")
+        for batch in batches:
+            profiler.update(batch)
+        self.assertEqual(7, len(profiler.histogram_bin_method_names))
+
+    def test_pinned_histogram_method(self):
+        options = FloatOptions()
+        options.histogram_and_quantiles.method = 'sqrt'
+        profiler = FloatColumn("Float", options=options)
+        profiler.update(pd.Series(np.arange(100)).apply(str))
+        self.assertEqual(['sqrt'], profiler.histogram_bin_method_names)
+        self.assertEqual('sqrt', profiler.histogram_selection)
+        self.assertEqual(10, len(profiler.profile['histogram']['bin_counts']))
+        self.assertEqual(0, profiler.histogram_methods['sqrt']['total_loss'])
+
+    def test_histogram_to_weighted_values(self):
         data = pd.Series([], dtype=object)
         profiler = FloatColumn(data.name)
         profiler.update(data)
@@ -449,9 +574,29 @@ class TestFloatColumn(unittest.TestCase):
             np.array([3, 2, 1])
         profiler.histogram_methods['auto']['histogram']['bin_edges'] = \
             np.array([1.0, 3.0, 5.0, 7.0])
-        array_from_histogram = profiler._histogram_to_array('auto')
+        values, weights = profiler._histogram_to_weighted_values('auto')
         expected_array = [1.0, 1.0, 1.0, 3.0, 3.0, 7.0]
-        self.assertCountEqual(array_from_histogram, expected_array)
+        self.assertCountEqual(np.repeat(values, weights), expected_array)
+
+    def test_weighted_histogram_matches_repeated_values(self):
+        data = pd.Series([], dtype=object)
+        profiler = FloatColumn(data.name)
+        rng = np.random.RandomState(0)
+        values = np.round(rng.lognormal(size=200), 1)
+        weights = rng.randint(0, 20, size=200)
+        for method in profiler.histogram_bin_method_names:
+            bin_counts, bin_edges = profiler._get_weighted_histogram(
+                values, weights, method)
+            expected_counts, expected_edges = profiler._get_histogram(
+                np.repeat(values, weights), method)
+            self.assertEqual(expected_counts.tolist(), bin_counts.tolist())
+            np.testing.assert_allclose(expected_edges, bin_edges)
+
+        # a single distinct value
+        bin_counts, bin_edges = profiler._get_weighted_histogram(
+            np.array([2.0, 2.0, 3.0]), np.array([3, 4, 0]), 'auto')
+        self.assertEqual([7], bin_counts.tolist())
+        self.assertEqual([2.0, 2.0], bin_edges.tolist())
 
     def test_merge_histogram(self):
         data = pd.Series([], dtype=object)
@@ -502,6 +647,69 @@ class TestFloatColumn(unittest.TestCase):
         self.assertEqual(est_Q2, exact_Q2)
         self.assertEqual(est_Q3, exact_Q3)
 
+    def test_get_percentiles(self):
+        profiler = FloatColumn("Float")
+        profiler.histogram_selection = 'auto'
+        profiler.histogram_methods['auto']['histogram'] = {
+            'bin_counts': np.array([1, 1, 1, 1]),
+            'bin_edges': np.array([1., 1.75, 2.5, 3.25, 4.])
+        }
+        percentiles = [25, 50, 75, 100, 10, 30]
+        expected = [1.75, 2.5, 3.25, 4., 1.375, 1.75]
+        np.testing.assert_array_equal(
+            expected, profiler._get_percentiles(percentiles))
+        for percentile, value in zip(percentiles, expected):
+            self.assertEqual(value, profiler._get_percentile(percentile))
+
+        # an even number of edges averages the neighboring edges
+        profiler.histogram_methods['auto']['histogram'] = {
+            'bin_counts': np.array([1, 2, 1]),
+            'bin_edges': np.array([0., 1., 2., 3.])
+        }
+        np.testing.assert_array_equal(
+            [0.5, 0.5, 1.5, 3.], profiler._get_percentiles([25, 50, 80, 100]))
+
+    def test_quantile_sketch(self):
+        """
+        Checks the quantiles and median are estimated by the quantile sketch
+        when enabled, including after merging profiles.
+        :return:
+        """
+        options = FloatOptions()
+        options.quantile_sketch.is_enabled = True
+        options.quantile_sketch.k = 100
+
+        np.random.seed(0)
+        data = np.random.normal(size=20000)
+        profiler1 = FloatColumn("Float", options=options)
+        profiler1.update(pd.Series(data[:10000]).apply(str))
+        profiler2 = FloatColumn("Float", options=options)
+        profiler2.update(pd.Series(data[10000:]).apply(str))
+        self.assertIn("quantile_sketch", profiler1.times)
+
+        for profiler, values in [(profiler1, data[:10000]),
+                                 (profiler1 + profiler2, data)]:
+            profile = profiler.profile
+            rank_error = profiler._quantile_sketch.rank_error
+            sorted_values = np.sort(values)
+            for quantile, fraction in [(249, 0.25), (499, 0.5), (749, 0.75)]:
+                rank = np.searchsorted(
+                    sorted_values, profile['quantiles'][quantile]) \
+                    / len(values)
+                self.assertAlmostEqual(fraction, rank, delta=rank_error)
+            self.assertEqual(profile['quantiles'][499], profile['median'])
+            self.assertIsNone(profile['quantiles'][999])
+
+        # the median is only reported by the sketch
+        profiler = FloatColumn("Float")
+        profiler.update(pd.Series(data[:100]).apply(str))
+        self.assertIsNone(profiler.profile['median'])
+        with self.assertRaisesRegex(ValueError,
+                                    'Profiles must either both or neither '
+                                    'use a quantile sketch to be added '
+                                    'together.'):
+            profiler1 + profiler
+
     def test_data_type_ratio(self):
         data = np.linspace(-5, 5, 4)
         df = pd.Series(data).apply(str)
@@ -539,7 +747,8 @@ class TestFloatColumn(unittest.TestCase):
             times=defaultdict(float, {'histogram_and_quantiles': 15.0,\
                                       'precision': 1.0, 'max': 1.0, 'min': 1.0,\
                                       'sum': 1.0, 'variance': 1.0}),
-            precision=1.0
+            precision=1.0,
+            precision_distribution={'min': 1, 'max': 1, 'mode': 1}
         )
         time_array = [float(i) for i in range(100, 0, -1)]
         with patch('time.time', side_effect=lambda: time_array.pop()):
@@ -159,6 +159,57 @@ class TestNumericStatsMixin(unittest.TestCase):
         mean_all, var_all = mean1, var1
         self.assertEqual(var_all, var_from_profile_updated)
 
+    def test_get_batch_moments(self):
+        """
+        Checks the moments of a batch are calculated once and shared
+        :return:
+        """
+        data = pd.Series([-3.0, 2.0, np.nan, 11.0])
+        subset_properties = dict()
+        moments = NumericStatsMixin._get_batch_moments(data, subset_properties)
+        self.assertEqual(3, moments['match_count'])
+        self.assertEqual(-3.0, moments['min'])
+        self.assertEqual(11.0, moments['max'])
+        self.assertEqual(10.0, moments['sum'])
+        self.assertAlmostEqual(10.0 / 3, moments['mean'])
+        self.assertAlmostEqual(2 * np.var([-3.0, 2.0, 11.0], ddof=1),
+                               moments['M2'])
+        self.assertIs(moments, subset_properties['moments'])
+        self.assertIs(moments, NumericStatsMixin._get_batch_moments(
+            pd.Series([1.0]), subset_properties))
+
+        # empty batch
+        moments = NumericStatsMixin._get_batch_moments(pd.Series([]), dict())
+        self.assertEqual(0, moments['match_count'])
+        self.assertTrue(np.isnan(moments['min']))
+        self.assertTrue(np.isnan(moments['max']))
+        self.assertEqual(0, moments['sum'])
+        self.assertEqual(0, moments['M2'])
+
+    def test_merge_moments(self):
+        """
+        Checks merged moments match the moments of all the values
+        :return:
+        """
+        data1 = np.array([-3.0, 2.0, 11.0])
+        data2 = np.array([-5.0, 5.0, 11.0, 7.5])
+        data_all = np.concatenate([data1, data2])
+        match_count, mean, M2 = NumericStatsMixin._merge_moments(
+            len(data1), data1.mean(), len(data1) * data1.var(),
+            len(data2), data2.mean(), len(data2) * data2.var())
+        self.assertEqual(7, match_count)
+        self.assertAlmostEqual(data_all.mean(), mean)
+        self.assertAlmostEqual(len(data_all) * data_all.var(), M2)
+
+        # merging with an empty set
+        self.assertEqual(
+            (3, data1.mean(), len(data1) * data1.var()),
+            NumericStatsMixin._merge_moments(
+                len(data1), data1.mean(), len(data1) * data1.var(),
+                0, 0., 0.))
+        self.assertEqual((0, 0., 0.),
+                         NumericStatsMixin._merge_moments(0, 0., 0., 0, 0., 0.))
+
     def test_timeit_merge(self):
         """
         Checks profiles have been merged and timed
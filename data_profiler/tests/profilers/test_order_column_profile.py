@@ -1,7 +1,7 @@
 import unittest
 import pandas as pd
 
-from data_profiler.profilers import OrderColumn
+from data_profiler.profilers import OrderColumn, utils
 from . import test_utils
 from unittest.mock import patch, MagicMock
 from collections import defaultdict
@@ -66,6 +66,41 @@ class TestOrderColumn(unittest.TestCase):
         order = self._update_order(data)
         self.assertEqual(order, 'random')
 
+    def test_get_data_order_by_chunk(self):
+        profiler = OrderColumn('a')
+
+        # the order is the same regardless of the chunk size
+        data = pd.Series(['1', '1', '2', '3', '3', '10'])
+        for chunk_size in [1, 2, 3, 5, 100]:
+            self.assertEqual(('ascending', 1., 10.),
+                             profiler._get_data_order(data, chunk_size))
+
+        # strings which are not all numeric are compared as strings
+        data = pd.Series(['c', 'b', 'b', 'a', '1'])
+        for chunk_size in [1, 2, 3, 5, 100]:
+            self.assertEqual(('descending', 'c', '1'),
+                             profiler._get_data_order(data, chunk_size))
+
+        # the last value is the one before the order became random
+        data = pd.Series(['5', '4', '4', '3', '6', '1', '2'])
+        for chunk_size in [1, 2, 3, 5, 100]:
+            self.assertEqual(('random', 5., 3.),
+                             profiler._get_data_order(data, chunk_size))
+
+        data = pd.Series(['7'])
+        self.assertEqual(('constant value', 7., 7.),
+                         profiler._get_data_order(data))
+
+        # the values of a given parse are reused instead of parsed again
+        data = pd.Series(['3', '2', '1e0'])
+        numeric_parse = utils.parse_numeric(data)
+        with patch('data_profiler.profilers.utils.parse_numeric') \
+                as mock_parse:
+            self.assertEqual(
+                ('descending', 3., 1.),
+                profiler._get_data_order(data, numeric_parse=numeric_parse))
+        mock_parse.assert_not_called()
+
     def test_batch_updates(self):
         data = ['a', 'a', 'a']
         df = pd.Series(data)
@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 import data_profiler as dp
+from data_profiler.profilers import profile_builder
 from data_profiler.profilers.profile_builder import StructuredDataProfile
 from data_profiler.profilers.profiler_options import \
     ProfilerOptions, StructuredOptions
@@ -8,6 +9,7 @@ from data_profiler.profilers.column_profile_compilers import \
     ColumnPrimitiveTypeProfileCompiler, ColumnStatsProfileCompiler
 from . import utils as test_utils
 
+import pickle
 import random
 import unittest
 from unittest import mock
@@ -15,6 +17,7 @@ import numpy as np
 import pandas as pd
 import six
 import os
+import tempfile
 import re
 
 
@@ -108,6 +111,62 @@ class TestProfiler(unittest.TestCase):
         self.assertEqual(2999, self.trained_schema.rows_ingested)
         self.assertEqual(0.0, self.trained_schema._get_duplicate_row_count())
 
+    def test_row_statistics_in_batches(self):
+        data = pd.DataFrame({'a': [1, 2, 1, None, 2, 1.5],
+                             'b': ['x', 'y', 'x', 'z', 'y', None]})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        profile = dp.Profiler(data, profiler_options=options)
+        self.assertEqual(6, profile.rows_ingested)
+        self.assertEqual(2, profile.null_in_row_count)
+        self.assertEqual(2, profile._get_duplicate_row_count())
+        self.assertEqual(4 / 6, profile._get_unique_row_ratio())
+
+        # duplicates across batches are detected
+        batch_profile = dp.Profiler(data[:3], profiler_options=options)
+        batch_profile.update_profile(data[3:])
+        self.assertEqual(6, batch_profile.rows_ingested)
+        self.assertEqual(2, batch_profile.null_in_row_count)
+        self.assertDictEqual(profile.hashed_row_dict,
+                             batch_profile.hashed_row_dict)
+
+    def test_unique_row_sketch(self):
+        data = pd.DataFrame({'a': np.arange(3000) % 1000,
+                             'b': np.arange(3000) % 500})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False,
+                     'unique_row_sketch.is_enabled': True})
+        profile = dp.Profiler(data[:2000], profiler_options=options)
+        profile2 = dp.Profiler(data[2000:], profiler_options=options)
+
+        # no hashes are stored when the unique rows are estimated
+        self.assertDictEqual({}, profile.hashed_row_dict)
+        self.assertAlmostEqual(1000, profile._get_unique_row_count(), delta=50)
+        self.assertAlmostEqual(
+            1000, profile._get_duplicate_row_count(), delta=50)
+        report = profile.report()
+        self.assertAlmostEqual(0.5, report['global_stats']['unique_row_ratio'],
+                               delta=0.025)
+        self.assertEqual(1.04 / 2 ** 7,
+                         report['global_stats']['unique_row_ratio_error'])
+
+        merged_profile = profile + profile2
+        self.assertEqual(3000, merged_profile.rows_ingested)
+        self.assertAlmostEqual(
+            1000, merged_profile._get_unique_row_count(), delta=50)
+
+        # cannot add a profile which counts the unique rows exactly
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        exact_profile = dp.Profiler(data[2000:], profiler_options=options)
+        self.assertNotIn('unique_row_ratio_error',
+                         exact_profile.report()['global_stats'])
+        with self.assertRaisesRegex(ValueError,
+                                    'The two profilers do not both estimate '
+                                    'the unique rows with a sketch and cannot '
+                                    'be added together.'):
+            profile + exact_profile
+
     def test_correct_datatime_schema_test(self):
         profile = self.trained_schema.profile["datetime"]
         col_schema_info = \
@@ -194,6 +253,72 @@ class TestProfiler(unittest.TestCase):
             2: report2_1000_quant[749],
         })
 
+    def test_report_selection(self):
+        report = self.trained_schema.report()
+        selected_report = self.trained_schema.report(
+            report_options={"columns": ["int_col", "src"]})
+        self.assertDictEqual(report['global_stats'],
+                             selected_report['global_stats'])
+        self.assertListEqual(['int_col', 'src'],
+                             list(selected_report['data_stats']))
+        self.assertEqual(report['data_stats']['src'],
+                         selected_report['data_stats']['src'])
+
+        selected_report = self.trained_schema.report(
+            report_options={"sections": ["global_stats"]})
+        self.assertListEqual(['global_stats'], list(selected_report))
+        selected_report = self.trained_schema.report(
+            report_options={"sections": ["data_stats"],
+                            "columns": ["int_col"]})
+        self.assertListEqual(['data_stats'], list(selected_report))
+        self.assertListEqual(['int_col'], list(selected_report['data_stats']))
+
+        with self.assertRaisesRegex(ValueError, r"Columns \['a'\] are not in "
+                                                r"the profile."):
+            self.trained_schema.report(report_options={"columns": ["a"]})
+        with self.assertRaisesRegex(ValueError, r"Report sections must be any "
+                                                r"of \['global_stats', "
+                                                r"'data_stats'\]."):
+            self.trained_schema.report(report_options={"sections": ["a"]})
+
+    def test_report_cache(self):
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        data = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        profile = dp.Profiler(data, profiler_options=options)
+        report = profile.report()
+        col_a_profile = profile.profile['a'].profile
+        col_b_profile = profile.profile['b'].profile
+
+        # the column profiles are compiled once until they are updated
+        with mock.patch.object(StructuredDataProfile, '_get_profile') \
+                as mock_get_profile:
+            self.assertEqual(report, profile.report())
+            profile.update_profile(data[['a']])
+            profile.report(report_options={"sections": ["global_stats"]})
+            mock_get_profile.assert_not_called()
+        updated_report = profile.report()
+        self.assertEqual(6, updated_report['data_stats']['a']['statistics']
+                         ['sample_size'])
+        self.assertIsNot(col_a_profile, profile.profile['a'].profile)
+        self.assertIs(col_b_profile, profile.profile['b'].profile)
+
+        # changing a report does not change the later reports
+        report = profile.report()
+        report['data_stats']['b']['statistics']['vocab'].append('changed')
+        report['data_stats']['b']['statistics'].clear()
+        report['data_stats']['a']['statistics']['quantiles'][0] = 'changed'
+        report = profile.report()
+        self.assertNotIn('changed', report['data_stats']['b']['statistics']
+                         ['vocab'])
+        self.assertNotEqual(
+            'changed', report['data_stats']['a']['statistics']['quantiles'][0])
+
+        # the cached profiles are not pickled
+        profile_state = pickle.loads(pickle.dumps(profile.profile['b']))
+        self.assertIsNone(profile_state._profile_cache)
+        self.assertIsNotNone(profile.profile['b']._profile_cache)
+
     def test_profile_key_name_without_space(self):
 
         def recursive_test_helper(report, prev_key=None):
@@ -201,10 +326,10 @@ class TestProfiler(unittest.TestCase):
                 # do not test keys in 'data_stats' as they contain column names
                 # neither for 'ave_predictions' and 'data_label_representation'
                 # as they contain label names
-                # same for 'null_types_index'
+                # same for 'null_types_index' and 'categorical_count'
                 if prev_key not in ['data_stats', 'avg_predictions',
                                     'data_label_representation',
-                                    'null_types_index']:
+                                    'null_types_index', 'categorical_count']:
                     # key names should contain only alphanumeric letters or '_'
                     self.assertIsNotNone(re.match('^[a-zA-Z0-9_]+$', str(key)))
                 if isinstance(report[key], dict):
@@ -245,6 +370,277 @@ class TestProfiler(unittest.TestCase):
                                     ' names.'):
             profile = dp.Profiler(invalid_data)
 
+    def test_parallel_profile_matches_serial(self):
+
+        def remove_times(report):
+            # times are the only stats expected to differ between the runs
+            if isinstance(report, dict):
+                return {key: remove_times(value)
+                        for key, value in report.items() if key != 'times'}
+            return report
+
+        def get_report(data, samples_per_update, parallel_options=None):
+            test_utils.set_seed(seed=0)
+            options = ProfilerOptions()
+            options.set({'data_labeler.is_enabled': False})
+            if parallel_options:
+                options.parallel.set(parallel_options)
+            profile = dp.Profiler(data, samples_per_update=samples_per_update,
+                                  profiler_options=options)
+            profile.update_profile(data[::-1])
+            return remove_times(
+                profile.report(report_options={
+                    'output_format': 'serializable'}))
+
+        data = self.aws_dataset.iloc[:300]
+        process_options = {'is_enabled': True, 'pool_type': 'process',
+                           'workers': 2, 'columns_per_task': 3}
+
+        # the columns of a process pool are seeded individually, hence the
+        # randomly sampled profiles are reproducible
+        process_report = get_report(
+            data, samples_per_update=100, parallel_options=process_options)
+        self.assertDictEqual(process_report, get_report(
+            data, samples_per_update=100, parallel_options=process_options))
+
+        # when sampling all rows, only the randomly selected samples differ
+        # from the serial profiles
+        serial_report = get_report(data, samples_per_update=len(data))
+        process_report = get_report(
+            data, samples_per_update=len(data),
+            parallel_options=process_options)
+        thread_report = get_report(
+            data, samples_per_update=len(data),
+            parallel_options={'is_enabled': True, 'pool_type': 'thread',
+                              'workers': 2})
+        for report in [serial_report, process_report, thread_report]:
+            for column_report in report['data_stats'].values():
+                column_report.pop('samples')
+        self.assertEqual(list(serial_report['data_stats']),
+                         list(process_report['data_stats']))
+        self.assertDictEqual(serial_report, process_report)
+        self.assertDictEqual(serial_report, thread_report)
+
+    def test_serial_profile_does_not_reseed_random_state(self):
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        data = self.aws_dataset.iloc[:300]
+
+        # the serial profiles draw from the caller's random state as is
+        with mock.patch('data_profiler.profilers.profile_builder.'
+                        '_column_random_state',
+                        wraps=profile_builder._column_random_state) \
+                as mock_random_state:
+            dp.Profiler(data, samples_per_update=100,
+                        profiler_options=options)
+        self.assertTrue(mock_random_state.called)
+        for call in mock_random_state.call_args_list:
+            self.assertIsNone(call[0][0])
+
+    @mock.patch('data_profiler.profilers.data_labeler_column_profile.'
+                'DataLabelerColumn.update', return_value=None)
+    @mock.patch('data_profiler.profilers.data_labeler_column_profile.'
+                'DataLabeler')
+    def test_data_labeler_reattached_on_failed_update(self, *mocks):
+        data = pd.DataFrame([[1, 'a'], [2, 'b'], [3, 'c']],
+                            columns=['int', 'text'])
+        profile = dp.Profiler(data)
+        data_labelers = {col: column_profile.profiles['data_label_profile']
+                         for col, column_profile in profile.profile.items()}
+
+        with mock.patch('data_profiler.profilers.profile_builder.'
+                        '_profile_columns', side_effect=ValueError('failed')):
+            with self.assertRaisesRegex(ValueError, 'failed'):
+                profile.update_profile(data)
+        for col, column_profile in profile.profile.items():
+            self.assertIs(data_labelers[col],
+                          column_profile.profiles['data_label_profile'])
+
+    def test_streaming_profile(self):
+        with open(self.input_file_path) as input_file:
+            data_as_str = ''.join(input_file.readlines()[:101])
+        tmp_file = tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False)
+        tmp_file.write(data_as_str)
+        tmp_file.close()
+        self.addCleanup(os.remove, tmp_file.name)
+
+        def get_profile(streaming_options=None):
+            options = ProfilerOptions()
+            options.set({'data_labeler.is_enabled': False})
+            if streaming_options:
+                options.streaming.set(streaming_options)
+            data = dp.Data(tmp_file.name)
+            profile = dp.Profiler(data, samples_per_update=100,
+                                  profiler_options=options)
+            return data, profile
+
+        _, profile = get_profile()
+        data, streamed_profile = get_profile(
+            {'is_enabled': True, 'chunk_size': 30})
+
+        # the file is never loaded into memory as a whole
+        self.assertIsNone(data._data)
+        self.assertEqual(profile.encoding, streamed_profile.encoding)
+        self.assertEqual('csv', streamed_profile.file_type)
+        self.assertEqual(100, streamed_profile.rows_ingested)
+        self.assertEqual(profile.null_in_row_count,
+                         streamed_profile.null_in_row_count)
+        self.assertDictEqual(profile.hashed_row_dict,
+                             streamed_profile.hashed_row_dict)
+        self.assertListEqual(list(profile.profile),
+                             list(streamed_profile.profile))
+        for col_name, col_profile in profile.profile.items():
+            streamed_col_profile = streamed_profile.profile[col_name]
+            self.assertEqual(col_profile.sample_size,
+                             streamed_col_profile.sample_size)
+            self.assertEqual(col_profile.null_count,
+                             streamed_col_profile.null_count)
+            self.assertDictEqual(col_profile.null_types_index,
+                                 streamed_col_profile.null_types_index)
+            self.assertEqual(col_profile.profile['data_type'],
+                             streamed_col_profile.profile['data_type'])
+            stats = col_profile.profile['statistics']
+            streamed_stats = streamed_col_profile.profile['statistics']
+            for key in ['categorical', 'order', 'min', 'max']:
+                self.assertEqual(stats.get(key), streamed_stats.get(key))
+            if 'mean' in stats:
+                self.assertAlmostEqual(stats['mean'], streamed_stats['mean'])
+
+    @mock.patch('data_profiler.profilers.data_labeler_column_profile.'
+                'DataLabelerColumn.update', return_value=None)
+    @mock.patch('data_profiler.profilers.data_labeler_column_profile.'
+                'DataLabeler')
+    def test_parallel_profile_with_data_labeler(self, *mocks):
+        options = ProfilerOptions()
+        options.parallel.set({'is_enabled': True, 'pool_type': 'thread',
+                              'workers': 2, 'columns_per_task': 1})
+        data = pd.DataFrame([[1, 'a'], [2, 'b'], [3, 'c']],
+                            columns=['int', 'text'])
+        profile = dp.Profiler(data, profiler_options=options)
+        profile.update_profile(data)
+
+        for column_profile in profile.profile.values():
+            self.assertListEqual(
+                ['data_type_profile', 'data_stats_profile',
+                 'data_label_profile'],
+                list(column_profile.profiles))
+            self.assertIs(options.structured_options, column_profile.options)
+            self.assertEqual(6, column_profile.sample_size)
+        # the data labeler is only ever updated in the calling process
+        self.assertEqual(4, mocks[1].call_count)
+
+    def test_merge_profiles(self):
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        data = self.aws_dataset.iloc[:250]
+        profile = dp.Profiler(data, profiler_options=options)
+        partial_profiles = [
+            dp.Profiler(data.iloc[i:i + 50], profiler_options=options)
+            for i in range(0, len(data), 50)]
+
+        # test invalid inputs
+        with self.assertRaisesRegex(ValueError, 'At least one profile must be '
+                                                'given to merge.'):
+            dp.Profiler.merge([])
+        with self.assertRaisesRegex(TypeError, '`int` is not a Profiler and '
+                                               'cannot be merged.'):
+            dp.Profiler.merge(partial_profiles + [3])
+        with self.assertRaisesRegex(ValueError, 'workers must be a positive '
+                                                'integer or None.'):
+            dp.Profiler.merge(partial_profiles, workers=0)
+
+        # a single profile is returned as is
+        self.assertIs(profile, dp.Profiler.merge([profile]))
+
+        added_profile = sum(partial_profiles[1:], partial_profiles[0])
+        for workers in [None, 2]:
+            merged_profile = dp.Profiler.merge(partial_profiles,
+                                               workers=workers)
+            self.assertEqual(250, merged_profile.rows_ingested)
+            self.assertEqual(profile.null_in_row_count,
+                             merged_profile.null_in_row_count)
+            self.assertDictEqual(profile.hashed_row_dict,
+                                 merged_profile.hashed_row_dict)
+            self.assertDictEqual(
+                added_profile.report()['global_stats'],
+                merged_profile.report()['global_stats'])
+            for col_name, col_profile in profile.profile.items():
+                merged_col_profile = merged_profile.profile[col_name]
+                self.assertIs(options.structured_options,
+                              merged_col_profile.options)
+                self.assertListEqual(['data_type_profile',
+                                      'data_stats_profile'],
+                                     list(merged_col_profile.profiles))
+                self.assertEqual(col_profile.sample_size,
+                                 merged_col_profile.sample_size)
+                self.assertEqual(col_profile.null_count,
+                                 merged_col_profile.null_count)
+                self.assertDictEqual(col_profile.null_types_index,
+                                     merged_col_profile.null_types_index)
+                self.assertEqual(col_profile.profile['data_type'],
+                                 merged_col_profile.profile['data_type'])
+
+
+    def test_save_and_load(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        filepath = os.path.join(tmp_dir.name, 'profile.pkl')
+
+        self.trained_schema.save(filepath)
+        loaded_profile = dp.Profiler.load(filepath)
+        self.assertIsInstance(loaded_profile, dp.Profiler)
+        self.assertDictEqual(
+            self.trained_schema.report(
+                report_options={'output_format': 'serializable'}),
+            loaded_profile.report(
+                report_options={'output_format': 'serializable'}))
+
+        # the loaded profile can be updated and merged
+        data = self.aws_dataset.iloc[:10]
+        loaded_profile.update_profile(data)
+        self.assertEqual(len(self.aws_dataset) + 10,
+                         loaded_profile.rows_ingested)
+        merged_profile = loaded_profile + self.trained_schema
+        self.assertEqual(2 * len(self.aws_dataset) + 10,
+                         merged_profile.rows_ingested)
+
+        # test invalid files
+        with open(filepath, 'wb') as outfile:
+            outfile.write(b'not a profile')
+        with self.assertRaisesRegex(ValueError, 'is not a saved profile.'):
+            dp.Profiler.load(filepath)
+        with open(filepath, 'wb') as outfile:
+            outfile.write(b'DPPROFILE\xff\xff')
+        with self.assertRaisesRegex(ValueError, 'The profile was saved in '
+                                                'version 65535 of the format, '
+                                                'which is newer than the '
+                                                'supported version 1.'):
+            dp.Profiler.load(filepath)
+
+    @mock.patch('data_profiler.profilers.data_labeler_column_profile.'
+                'DataLabelerColumn.update', return_value=None)
+    @mock.patch('data_profiler.profilers.data_labeler_column_profile.'
+                'DataLabeler')
+    def test_save_and_load_with_data_labeler(self, *mocks):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        filepath = os.path.join(tmp_dir.name, 'profile.pkl')
+
+        data = pd.DataFrame([[1, 'a'], [2, 'b'], [3, 'c']],
+                            columns=['int', 'text'])
+        profile = dp.Profiler(data)
+        self.assertEqual(2, mocks[0].call_count)
+        profile.save(filepath)
+
+        # the data labeler is loaded once and shared among the columns
+        loaded_profile = dp.Profiler.load(filepath)
+        self.assertEqual(3, mocks[0].call_count)
+        for column_profile in loaded_profile.profile.values():
+            labeler_profile = column_profile.profiles['data_label_profile'] \
+                ._profiles['data_labeler']
+            self.assertIs(mocks[0].return_value, labeler_profile.data_labeler)
+
 
 class TestStructuredDataProfileClass(unittest.TestCase):
 
@@ -383,10 +779,31 @@ class TestStructuredDataProfileClass(unittest.TestCase):
         # note data above is a subset `df_series=data[1:]`, 1.0 will not exist
         self.assertTrue(np.issubdtype(np.object_, df_series.dtype))
         self.assertDictEqual(
-            {'sample': ['4.0', '6.0', '3.0'], 'sample_size': 5, 'null_count': 2,
-             'null_types': dict(nan=['e', 'b'])},
+            {'sample': ['4.0', '3.0', '6.0'], 'sample_size': 5, 'null_count': 2,
+             'null_types': dict(nan=['b', 'e'])},
             base_stats)
 
+    def test_get_base_props_null_types(self):
+        data = pd.Series(['NaN', 'a', 'nan', '', '  ', '--', '__', 'None',
+                          'NULL', 'b', 'null', '-_', ' x', 'nan', ''])
+        df_series, base_stats = \
+            StructuredDataProfile.get_base_props_and_clean_null_params(
+                self=None, df_series=data, sample_size=len(data),
+                min_true_samples=0)
+        self.assertListEqual(['a', 'b', '-_', ' x'], df_series.tolist())
+        self.assertEqual(11, base_stats['null_count'])
+
+        # null types are ordered by the null value they match first
+        null_types = list(base_stats['null_types'])
+        self.assertEqual('', null_types[0])
+        six.assertCountEqual(self, ['nan', 'NaN'], null_types[1:3])
+        self.assertEqual('None', null_types[3])
+        six.assertCountEqual(self, ['NULL', 'null'], null_types[4:6])
+        self.assertListEqual(['  ', '--', '__'], null_types[6:])
+        for null_type, null_rows in base_stats['null_types'].items():
+            six.assertCountEqual(
+                self, data.index[data == null_type].tolist(), null_rows)
+
     def test_update_match_are_abstract(self):
         six.assertCountEqual(
             self,
@@ -406,13 +823,39 @@ class TestStructuredDataProfileClass(unittest.TestCase):
         self.assertIn('data_label_profile', std_profile.profiles)
         self.assertNotIn('data_label_profile', togg_profile.profiles)
 
+    def test_numeric_parse_shared(self):
+        data = pd.Series(['1', '2.5', 'a'], name='test')
+        structured_options = StructuredOptions()
+        structured_options.data_labeler.is_enabled = False
+        with mock.patch('data_profiler.profilers.utils.parse_numeric',
+                        wraps=dp.profilers.utils.parse_numeric) as mock_parse:
+            profile = StructuredDataProfile(data, sample_size=len(data),
+                                            options=structured_options)
+            profile.update_profile(data)
+
+        # the int, float and order profiles share one parse per update
+        self.assertEqual(2, mock_parse.call_count)
+        type_profiles = profile.profiles['data_type_profile']._profiles
+        self.assertEqual(2, type_profiles['int'].match_count)
+        self.assertEqual(4, type_profiles['float'].match_count)
+
+        # the column is not parsed when no profile needs it
+        structured_options.int.is_enabled = False
+        structured_options.float.is_enabled = False
+        structured_options.order.is_enabled = False
+        with mock.patch('data_profiler.profilers.utils.parse_numeric',
+                        wraps=dp.profilers.utils.parse_numeric) as mock_parse:
+            StructuredDataProfile(data, sample_size=len(data),
+                                  options=structured_options)
+        mock_parse.assert_not_called()
+
     def test_null_count(self):
         column = pd.Series([1, float('nan')] * 10)
 
         # test null_count when subset of full sample size
         random.seed(0)
         profile = StructuredDataProfile(column, sample_size=10)
-        self.assertEqual(6, profile.null_count)
+        self.assertEqual(4, profile.null_count)
 
         # test null_count when full sample size
         profile = StructuredDataProfile(column, sample_size=len(column))
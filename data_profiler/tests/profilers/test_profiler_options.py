@@ -25,10 +25,14 @@ class TestProfilerOptions(unittest.TestCase):
         self.assertIsNotNone(profile.options)
         self.assertTrue(profile.options.structured_options.data_labeler
                         .is_enabled)
-        for column in profile.options.structured_options.properties:
+        for column in profile.options.structured_options.enabled_columns:
             self.assertTrue(
                 profile.options.structured_options.properties[column].
                     is_enabled)
+        self.assertEqual(
+            7, len(profile.options.structured_options.enabled_columns))
+        self.assertFalse(
+            profile.options.structured_options.short_circuit_types.is_enabled)
 
         for column in ["int", "float", "text"]:
             column = profile.options.structured_options.properties[column]
@@ -182,6 +186,160 @@ class TestProfilerOptions(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, expected_error):
             profile = Profiler(self.data, profiler_options=options)
                 
+    def test_validate_parallel(self, *mocks):
+        options = ProfilerOptions()
+        self.assertFalse(options.parallel.is_enabled)
+        self.assertEqual('process', options.parallel.pool_type)
+
+        options.parallel.set({"is_enabled": True, "pool_type": "thread",
+                              "workers": 2, "columns_per_task": 5})
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        options.parallel.pool_type = "Invalid"
+        options.parallel.workers = 0
+        options.parallel.columns_per_task = "Invalid"
+        expected_error = (
+            r"ProfilerOptions.parallel.pool_type must be one of "
+            r"\['process', 'thread'\].\n"
+            r"ProfilerOptions.parallel.workers must be None or a positive "
+            r"integer.\n"
+            r"ProfilerOptions.parallel.columns_per_task must be None or a "
+            r"positive integer.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_streaming(self, *mocks):
+        options = ProfilerOptions()
+        self.assertFalse(options.streaming.is_enabled)
+        self.assertEqual(100000, options.streaming.chunk_size)
+
+        options.streaming.set({"is_enabled": True, "chunk_size": 10})
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        for chunk_size in [0, 1.5, True, None]:
+            options.streaming.chunk_size = chunk_size
+            expected_error = (r"ProfilerOptions.streaming.chunk_size must be "
+                              r"a positive integer.")
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+
+    def test_validate_unique_row_sketch(self, *mocks):
+        options = ProfilerOptions()
+        self.assertFalse(options.unique_row_sketch.is_enabled)
+        self.assertEqual(14, options.unique_row_sketch.precision)
+
+        options.unique_row_sketch.set({"is_enabled": True, "precision": 4})
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        for precision in [3, 19, 10.5, True]:
+            options.unique_row_sketch.precision = precision
+            expected_error = (r"ProfilerOptions.unique_row_sketch.precision "
+                              r"must be an integer between 4 and 18.")
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+
+    def test_validate_histogram_option(self, *mocks):
+        options = ProfilerOptions()
+        int_options = options.structured_options.int
+        self.assertIsNone(int_options.histogram_and_quantiles.method)
+        self.assertFalse(int_options.histogram_and_quantiles.adaptive_selection)
+
+        options.set({"histogram_and_quantiles.method": "fd",
+                     "histogram_and_quantiles.adaptive_selection": True})
+        self.assertEqual(
+            "fd", options.structured_options.text.histogram_and_quantiles
+            .method)
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        int_options.histogram_and_quantiles.method = "unknown"
+        int_options.histogram_and_quantiles.adaptive_selection = 1
+        expected_error = (
+            r"ProfilerOptions.structured_options.int.histogram_and_quantiles."
+            r"method must be None or one of \['auto', 'fd', 'doane', "
+            r"'scott', 'rice', 'sturges', 'sqrt'\].\n"
+            r"ProfilerOptions.structured_options.int.histogram_and_quantiles."
+            r"adaptive_selection must be a Boolean.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_quantile_sketch(self, *mocks):
+        options = ProfilerOptions()
+        int_options = options.structured_options.int
+        self.assertFalse(int_options.quantile_sketch.is_enabled)
+        self.assertEqual(200, int_options.quantile_sketch.k)
+
+        options.set({"quantile_sketch.is_enabled": True,
+                     "quantile_sketch.k": 8})
+        self.assertTrue(options.structured_options.float
+                        .quantile_sketch.is_enabled)
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        for k in [7, 10.5, True]:
+            int_options.quantile_sketch.k = k
+            expected_error = (r"ProfilerOptions.structured_options.int."
+                              r"quantile_sketch.k must be an integer of at "
+                              r"least 8.")
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+
+    def test_validate_categorical_max_unique_count(self, *mocks):
+        options = ProfilerOptions()
+        category_options = options.structured_options.category
+        self.assertIsNone(category_options.max_unique_count)
+        self.assertEqual(14, category_options.unique_count_precision)
+
+        options.set({"category.max_unique_count": 1000,
+                     "category.unique_count_precision": 4})
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        for max_unique_count in [0, 10.5, True]:
+            category_options.max_unique_count = max_unique_count
+            expected_error = (r"ProfilerOptions.structured_options.category."
+                              r"max_unique_count must be None or a positive "
+                              r"integer.")
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+        category_options.max_unique_count = None
+
+        for precision in [3, 19, 10.5, True]:
+            category_options.unique_count_precision = precision
+            expected_error = (r"ProfilerOptions.structured_options.category."
+                              r"unique_count_precision must be an integer "
+                              r"between 4 and 18.")
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+
+    def test_short_circuit_types(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"short_circuit_types.is_enabled": True})
+        self.assertTrue(
+            options.structured_options.short_circuit_types.is_enabled)
+        self.assertNotIn('short_circuit_types',
+                         options.structured_options.enabled_columns)
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        options.structured_options.short_circuit_types.is_enabled = 1
+        expected_error = (r"ProfilerOptions.structured_options."
+                          r"short_circuit_types.is_enabled must be a "
+                          r"Boolean.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_vocab_counts(self, *mocks):
+        options = ProfilerOptions()
+        text_options = options.structured_options.text
+        self.assertTrue(text_options.vocab.is_enabled)
+        self.assertFalse(text_options.vocab.track_counts)
+
+        options.set({"vocab.track_counts": True})
+        self.assertListEqual([], options.validate(raise_error=False))
+
+        text_options.vocab.track_counts = 1
+        expected_error = (r"ProfilerOptions.structured_options.text.vocab."
+                          r"track_counts must be a Boolean.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
     def test_validate_numeric_stats(self, *mocks):
         options = ProfilerOptions()
         numerical_options = {
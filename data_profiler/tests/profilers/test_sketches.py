@@ -0,0 +1,117 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_profiler.profilers.sketches import HyperLogLog, KLL
+
+
+class TestHyperLogLog(unittest.TestCase):
+
+    def test_cardinality(self):
+        sketch = HyperLogLog()
+        self.assertEqual(0, sketch.cardinality)
+        self.assertEqual(2 ** 14, sketch.num_registers)
+
+        for num_values in [10, 1000, 100000]:
+            hashes = pd.util.hash_array(np.arange(num_values))
+            sketch = HyperLogLog()
+            sketch.update(hashes)
+            # repeated values do not change the estimate
+            sketch.update(hashes[:num_values // 2])
+            self.assertAlmostEqual(
+                num_values, sketch.cardinality,
+                delta=4 * sketch.relative_error * num_values)
+
+    def test_relative_error(self):
+        self.assertAlmostEqual(1.04 / 2 ** 7, HyperLogLog(14).relative_error)
+        self.assertAlmostEqual(1.04 / 2 ** 2, HyperLogLog(4).relative_error)
+
+    def test_invalid_precision(self):
+        for precision in [3, 19, 10.0, True]:
+            with self.assertRaisesRegex(
+                    ValueError,
+                    "precision must be an integer between 4 and 18."):
+                HyperLogLog(precision)
+
+    def test_add(self):
+        sketch1 = HyperLogLog(12)
+        sketch1.update(pd.util.hash_array(np.arange(50000)))
+        sketch2 = HyperLogLog(12)
+        sketch2.update(pd.util.hash_array(np.arange(25000, 75000)))
+
+        merged_sketch = sketch1 + sketch2
+        np.testing.assert_array_equal(
+            np.maximum(sketch1.registers, sketch2.registers),
+            merged_sketch.registers)
+        self.assertAlmostEqual(
+            75000, merged_sketch.cardinality,
+            delta=4 * merged_sketch.relative_error * 75000)
+
+        with self.assertRaisesRegex(ValueError,
+                                    "Sketches with different precisions "
+                                    "cannot be merged: 12 != 14"):
+            sketch1 + HyperLogLog(14)
+        with self.assertRaisesRegex(TypeError,
+                                    "Unsupported operand type"):
+            sketch1 + 1
+
+
+class TestKLL(unittest.TestCase):
+
+    def assert_rank_error(self, values, sketch):
+        fractions = np.linspace(0.01, 0.99, 99)
+        ranks = np.searchsorted(np.sort(values),
+                                sketch.quantiles(fractions)) / len(values)
+        self.assertLessEqual(np.abs(ranks - fractions).max(),
+                             sketch.rank_error)
+
+    def test_quantiles(self):
+        sketch = KLL()
+        self.assertTrue(np.isnan(sketch.quantiles([0.5])).all())
+        sketch.update(np.arange(100.))
+        np.testing.assert_array_equal([0, 49, 99],
+                                      sketch.quantiles([0, 0.5, 1]))
+
+        np.random.seed(0)
+        values = np.random.lognormal(size=200000)
+        sketch = KLL()
+        for batch in np.array_split(values, 20):
+            sketch.update(batch)
+        self.assertEqual(200000, sketch.num_values)
+        self.assert_rank_error(values, sketch)
+
+        # memory is bounded by the capacities of the compactors
+        self.assertLess(sketch.size, 3 * sketch.k + len(sketch.compactors))
+
+    def test_rank_error(self):
+        self.assertAlmostEqual(2.296 / 200 ** 0.9723, KLL().rank_error)
+        self.assertLess(KLL(400).rank_error, KLL(200).rank_error)
+
+    def test_invalid_k(self):
+        for k in [7, 10.0, True]:
+            with self.assertRaisesRegex(ValueError,
+                                        "k must be an integer of at least 8."):
+                KLL(k)
+
+    def test_add(self):
+        np.random.seed(0)
+        values = np.random.normal(size=100000)
+        sketches = []
+        for batch in np.array_split(values, 4):
+            sketch = KLL(100)
+            sketch.update(batch)
+            sketches.append(sketch)
+
+        merged_sketch = (sketches[0] + sketches[1]) + \
+            (sketches[2] + sketches[3])
+        self.assertEqual(100000, merged_sketch.num_values)
+        self.assert_rank_error(values, merged_sketch)
+
+        with self.assertRaisesRegex(ValueError,
+                                    "Sketches with different k cannot be "
+                                    "merged: 100 != 200"):
+            sketches[0] + KLL(200)
+        with self.assertRaisesRegex(TypeError,
+                                    "Unsupported operand type"):
+            sketches[0] + 1
@@ -283,6 +283,52 @@ class TestTextColumnProfiler(unittest.TestCase):
         self.assertEqual(profiler3.max, profiler2.max)
         self.assertEqual(expected_vocab, profiler3.vocab)
 
+    def test_vocab_counts(self):
+        df = pd.Series(["abcd", "aa", "b\u00e9", "\U0010ffffa"])
+        self.assertListEqual(
+            [('a', 4), ('b', 2), ('c', 1), ('d', 1), ('\u00e9', 1),
+             ('\U0010ffff', 1)],
+            list(TextColumn._get_vocab_counts(''.join(df)).items()))
+
+        # the order of the characters comes from the first prefixes of the
+        # text containing them all, regardless of their length
+        text = 'z' * 5000 + 'y' + 'x' * 3000
+        self.assertListEqual(
+            [('z', 5000), ('y', 1), ('x', 3000)],
+            list(TextColumn._get_vocab_counts(text).items()))
+        self.assertDictEqual({}, TextColumn._get_vocab_counts(''))
+
+        # counts are only reported if tracked
+        profiler = TextColumn(df.name)
+        profiler.update(df)
+        self.assertNotIn('vocab_count', profiler.profile)
+
+        options = TextOptions()
+        options.vocab.track_counts = True
+        profiler = TextColumn(df.name, options=options)
+        profiler.update(df)
+        self.assertListEqual(['a', 'b', 'c', 'd', '\u00e9', '\U0010ffff'],
+                             profiler.vocab)
+        self.assertDictEqual(
+            {'a': 4, 'b': 2, 'c': 1, 'd': 1, '\u00e9': 1, '\U0010ffff': 1},
+            profiler.profile['vocab_count'])
+
+        profiler2 = TextColumn(df.name, options=options)
+        profiler2.update(pd.Series(["ef", "a"]))
+        profiler3 = profiler + profiler2
+        self.assertListEqual(
+            ['a', 'b', 'c', 'd', '\u00e9', '\U0010ffff', 'e', 'f'],
+            profiler3.vocab)
+        self.assertDictEqual(
+            {'a': 5, 'b': 2, 'c': 1, 'd': 1, '\u00e9': 1, '\U0010ffff': 1,
+             'e': 1, 'f': 1},
+            profiler3.profile['vocab_count'])
+
+        with self.assertRaisesRegex(ValueError, 'Profiles must either both or '
+                                                'neither track vocab counts '
+                                                'to be added together.'):
+            profiler + TextColumn(df.name)
+
     def test_merge_timing(self):
         profiler1 = TextColumn("placeholder_name")
         profiler2 = TextColumn("placeholder_name")
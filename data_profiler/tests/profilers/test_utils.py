@@ -1,6 +1,10 @@
+import random
 import unittest
 
-from data_profiler.profilers import utils
+import numpy as np
+import pandas as pd
+
+from data_profiler.profilers import utils, NumericStatsMixin
 from data_profiler.tests.test_utils import patched_assert_warns
 
 
@@ -45,3 +49,153 @@ class TestShuffleInChunks(unittest.TestCase):
             num_chunks += 1
         self.assertEqual(num_chunks, 100 // 7 + 1)
         self.assertCountEqual(all_values, list(range(100)))
+
+    def test_seed(self):
+        """
+        Check if the shuffle is reproducible with a seed.
+        """
+        samples1 = list(utils.shuffle_in_chunks(
+            data_length=1000, chunk_size=300, seed=0))
+        samples2 = list(utils.shuffle_in_chunks(
+            data_length=1000, chunk_size=300, seed=0))
+        self.assertEqual(4, len(samples1))
+        for sample1, sample2 in zip(samples1, samples2):
+            np.testing.assert_array_equal(sample1, sample2)
+
+        # without a seed, it is drawn from the random module
+        random.seed(0)
+        sample1 = next(utils.shuffle_in_chunks(data_length=10, chunk_size=5))
+        random.seed(0)
+        sample2 = next(utils.shuffle_in_chunks(data_length=10, chunk_size=5))
+        np.testing.assert_array_equal(sample1, sample2)
+
+    def test_large_sample(self):
+        """
+        Check if a small fraction of a large dataset can be shuffled.
+        """
+        sample_gen = utils.shuffle_in_chunks(data_length=10 ** 8,
+                                             chunk_size=1000, seed=0)
+        all_values = set()
+        for _ in range(3):
+            sample = next(sample_gen)
+            self.assertEqual(1000, len(sample))
+            self.assertFalse(all_values & set(sample))
+            all_values = all_values | set(sample)
+        self.assertTrue(all(0 <= value < 10 ** 8 for value in all_values))
+
+
+class TestToStrSeries(unittest.TestCase):
+    """
+    Validates utils.to_str_series is properly working.
+    """
+
+    def test_converts_values(self):
+        """
+        Check if non-string values are converted to strings.
+        """
+        data = pd.Series([1, None, 2.5, 'a', np.nan], index=list('abcde'))
+        str_data = utils.to_str_series(data)
+        self.assertListEqual(['1', 'None', '2.5', 'a', 'nan'],
+                             str_data.tolist())
+        self.assertListEqual(list('abcde'), str_data.index.tolist())
+
+        str_data = utils.to_str_series(pd.Series([1.0, 2.0]))
+        self.assertListEqual(['1.0', '2.0'], str_data.tolist())
+
+    def test_string_series_not_copied(self):
+        """
+        Check if a series of strings is returned without being copied.
+        """
+        data = pd.Series(['1', 'a', ''])
+        self.assertIs(data, utils.to_str_series(data))
+
+
+class TestParseNumeric(unittest.TestCase):
+    """
+    Validates utils.parse_numeric is properly working.
+    """
+
+    def test_matches_is_float_and_is_int(self):
+        """
+        Check if the parse matches parsing each value separately.
+        """
+        data = pd.Series(['1', '1.0', '1.5', '-2e3', ' 3 ', '1_000', 'nan',
+                          'inf', '1e400', 'a', '', '0x10', '--1', '1__0',
+                          '-Infinity', '\u0661\u0662', '.5', '1.', '.',
+                          '9373.711634780513'])
+        parse = utils.parse_numeric(data)
+        self.assertListEqual([NumericStatsMixin.is_float(x) for x in data],
+                             parse['is_float'].tolist())
+        self.assertListEqual([NumericStatsMixin.is_int(x) for x in data],
+                             parse['is_int'].tolist())
+        expected_values = [float(x) if NumericStatsMixin.is_float(x)
+                           else np.nan for x in data]
+        np.testing.assert_array_equal(expected_values, parse['values'])
+        self.assertListEqual(data.str.len().tolist(),
+                             parse['lengths'].tolist())
+
+        # only numeric values are cast at once
+        parse = utils.parse_numeric(pd.Series(['1', '2.5', 'nan']))
+        self.assertListEqual([True, True, True], parse['is_float'].tolist())
+        self.assertListEqual([True, False, False], parse['is_int'].tolist())
+
+    def test_lengths(self):
+        """
+        Check if only the values which are all strings have lengths.
+        """
+        self.assertIsNone(utils.parse_numeric(pd.Series([1, 2]))['lengths'])
+
+
+class TestRowIndexSet(unittest.TestCase):
+    """
+    Validates utils.RowIndexSet is properly working.
+    """
+
+    def test_integer_indices(self):
+        """
+        Check if integer indices are stored as ranges of consecutive rows.
+        """
+        index_set = utils.RowIndexSet([5, 1, 2, 3, 9, 10, 3])
+        np.testing.assert_array_equal([[1, 4], [5, 6], [9, 11]],
+                                      index_set._ranges)
+        self.assertListEqual([1, 2, 3, 5, 9, 10], index_set.tolist())
+        self.assertEqual(6, len(index_set))
+
+        index_set = utils.RowIndexSet(range(1000000))
+        self.assertEqual(1, len(index_set._ranges))
+        self.assertEqual(1000000, len(index_set))
+
+        index_set = utils.RowIndexSet()
+        self.assertListEqual([], index_set.tolist())
+        self.assertEqual(0, len(index_set))
+
+    def test_label_indices(self):
+        """
+        Check if non-integer index labels are kept sorted.
+        """
+        index_set = utils.RowIndexSet(['e', 'b'])
+        index_set.update(['a', 'e'])
+        self.assertListEqual(['a', 'b', 'e'], index_set.tolist())
+        self.assertEqual(3, len(index_set))
+
+        # labels which cannot be compared keep their order
+        index_set = utils.RowIndexSet(['b', 1.5, 'a'])
+        self.assertListEqual(['b', 1.5, 'a'], index_set.tolist())
+
+    def test_update_and_add(self):
+        """
+        Check if sets are merged into the union of their indices.
+        """
+        index_set1 = utils.RowIndexSet([1, 2, 3, 9, 10])
+        index_set2 = utils.RowIndexSet([4, 8, 20, 2])
+        merged_set = index_set1 + index_set2
+        np.testing.assert_array_equal([[1, 5], [8, 11], [20, 21]],
+                                      merged_set._ranges)
+        self.assertListEqual([1, 2, 3, 4, 8, 9, 10, 20], merged_set.tolist())
+
+        # the added sets are unchanged
+        self.assertListEqual([1, 2, 3, 9, 10], index_set1.tolist())
+        self.assertListEqual([2, 4, 8, 20], index_set2.tolist())
+
+        index_set1.update([0, 11])
+        self.assertListEqual([0, 1, 2, 3, 9, 10, 11], index_set1.tolist())